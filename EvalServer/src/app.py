@@ -12,6 +12,8 @@ from routers.deepeval_arena import router as deepeval_arena
 from routers.bias_audits import router as bias_audits
 from middlewares.middleware import TenantMiddleware
 from database.redis import close_redis
+from utils.evaluation_worker_pool import get_evaluation_worker_pool, shutdown_evaluation_worker_pool
+from utils.job_queue import get_job_queue_worker, shutdown_job_queue_worker, get_active_job_ids
 from database.config import settings
 
 import logging
@@ -46,7 +48,14 @@ async def run_data_migration():
 async def shutdown_redis():
     await close_redis()
 
-app = FastAPI(on_shutdown=[shutdown_redis])
+async def shutdown_job_queue():
+    # Stop consuming first so in-flight jobs are handed back to the queue
+    await shutdown_job_queue_worker()
+
+async def shutdown_worker_pool():
+    await shutdown_evaluation_worker_pool()
+
+app = FastAPI(on_shutdown=[shutdown_job_queue, shutdown_worker_pool, shutdown_redis])
 
 # enable CORS
 origins = [os.environ.get("BACKEND_URL") or "http://localhost:3000"]
@@ -62,9 +71,18 @@ app.add_middleware(
 app.add_middleware(TenantMiddleware)
 
 async def cleanup_orphaned_experiments():
-    """Mark any experiments stuck in 'running' as failed on server restart."""
+    """Mark experiments stuck in 'running' as failed on server restart.
+
+    Experiments that still have a queued or leased job are left alone: the job
+    queue re-delivers them once their lease expires.
+    """
     from database.db import get_db
     from sqlalchemy import text
+    active_ids = await get_active_job_ids("experiment")
+    if active_ids is None:
+        active_ids = set()
+    elif active_ids:
+        logger.info(f"Leaving {len(active_ids)} queued experiment(s) for re-delivery")
     try:
         async with get_db() as db:
             # First, try shared-schema (llm_evals_experiments)
@@ -72,8 +90,9 @@ async def cleanup_orphaned_experiments():
                 res = await db.execute(text(
                     "UPDATE llm_evals_experiments "
                     "SET status = 'failed', error_message = 'Server restarted during execution', "
-                    "completed_at = NOW() WHERE status = 'running'"
-                ))
+                    "completed_at = NOW() WHERE status = 'running' "
+                    "AND NOT (id = ANY(CAST(:active_ids AS text[])))"
+                ), {"active_ids": list(active_ids)})
                 if res.rowcount > 0:
                     logger.info(f"Marked {res.rowcount} orphaned experiment(s) as failed in verifywise schema")
             except Exception:
@@ -106,6 +125,10 @@ async def startup_event():
     # Alembic migrations run once in Dockerfile/CLI before uvicorn starts workers.
     await run_data_migration()
     await cleanup_orphaned_experiments()
+    # Spawn evaluation workers now so they finish importing before the first experiment
+    get_evaluation_worker_pool().start()
+    # Start consuming queued experiments, arena runs and bias audits
+    get_job_queue_worker().start()
 
 @app.get("/")
 def root():
@@ -5,13 +5,15 @@ Handles bias audit creation, background task execution,
 status polling, and result retrieval.
 """
 
+import asyncio
 import json
+import os
 import logging
 import traceback
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional
-from fastapi import HTTPException, BackgroundTasks, UploadFile
+from fastapi import HTTPException, UploadFile
 from fastapi.responses import JSONResponse
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,7 @@ logger = logging.getLogger(__name__)
 MAX_CSV_SIZE = 50 * 1024 * 1024  # 50 MB
 
 from database.db import get_db
+from utils.job_queue import register_job_handler, submit_job
 from crud.bias_audits import (
     create_bias_audit,
     get_bias_audit,
@@ -38,6 +41,45 @@ if engines_path not in sys.path:
     sys.path.insert(0, engines_path)
 
 
+def _get_audit_uploads_root() -> Path:
+    """
+    Directory holding uploaded audit CSVs until their queued audit has run.
+    Same volume as dataset uploads (Docker: /app/data/uploads, local:
+    EvaluationModule/data/uploads) so every API process can read it.
+    """
+    docker_uploads = Path("/app/data/uploads")
+    if docker_uploads.exists():
+        return docker_uploads / "bias_audits"
+    root_path = Path(__file__).parent.parent.parent.parent
+    return root_path / "EvaluationModule" / "data" / "uploads" / "bias_audits"
+
+
+def _audit_csv_path(csv_file: str) -> Path:
+    root = _get_audit_uploads_root().resolve()
+    path = (root / csv_file).resolve()
+    if root not in path.parents:
+        raise ValueError(f"Invalid audit CSV reference: {csv_file}")
+    return path
+
+
+def _save_audit_csv(organization_id: int, audit_id: str, csv_bytes: bytes) -> str:
+    """Write an uploaded CSV to disk and return the reference stored in the job payload."""
+    csv_file = f"{organization_id}/{audit_id}.csv"
+    path = _audit_csv_path(csv_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(csv_bytes)
+    return csv_file
+
+
+def _remove_audit_csv(csv_file: str) -> None:
+    try:
+        os.remove(_audit_csv_path(csv_file))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"[BiasAudit] Could not remove uploaded CSV {csv_file}: {e}")
+
+
 async def list_presets_controller() -> JSONResponse:
     """List all available bias audit presets (summaries only)."""
     from presets.bias_audits.loader import list_presets
@@ -55,7 +97,6 @@ async def get_preset_controller(preset_id: str) -> JSONResponse:
 
 
 async def create_bias_audit_controller(
-    background_tasks: BackgroundTasks,
     dataset: UploadFile,
     config_json: str,
     organization_id: int,
@@ -67,7 +108,7 @@ async def create_bias_audit_controller(
 
     1. Parse config, load preset, merge overrides
     2. Save audit record with status=pending
-    3. Launch background task
+    3. Queue the audit on the durable job queue
     4. Return 202 with audit ID
     """
     try:
@@ -128,14 +169,26 @@ async def create_bias_audit_controller(
         logger.error(f"[BiasAudit] Failed to create audit for org {organization_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to create audit. Please try again.")
 
-    # Launch background task
-    background_tasks.add_task(
-        run_bias_audit_task,
-        audit_id=audit_id,
-        csv_bytes=csv_bytes,
-        config_data=config_data,
-        preset=preset,
+    # Queue the audit; the CSV stays on disk and the job payload only references it
+    try:
+        csv_file = await asyncio.to_thread(_save_audit_csv, organization_id, audit_id, csv_bytes)
+    except Exception as e:
+        logger.error(f"[BiasAudit] Failed to store CSV for audit {audit_id}: {e}")
+        async with get_db() as db:
+            await update_bias_audit_status(organization_id, db, audit_id, status="failed", error="Failed to store dataset")
+            await db.commit()
+        raise HTTPException(status_code=500, detail="Failed to store dataset. Please try again.")
+
+    await submit_job(
+        kind="bias_audit",
+        entity_id=audit_id,
         organization_id=organization_id,
+        payload={
+            "audit_id": audit_id,
+            "csv_file": csv_file,
+            "config_data": config_data,
+            "preset": preset,
+        },
     )
 
     return JSONResponse(
@@ -218,7 +271,9 @@ async def run_bias_audit_task(
         logger.info(f"[BiasAudit] CSV bytes length={len(csv_bytes)}")
         logger.info(f"[BiasAudit] CSV first 200 bytes: {csv_bytes[:200]}")
 
-        records, unknown_count = parse_csv_dataset(
+        # CPU-bound work runs off the event loop so queue heartbeats and other jobs keep going
+        records, unknown_count = await asyncio.to_thread(
+            parse_csv_dataset,
             csv_bytes=csv_bytes,
             column_mapping=audit_config.column_mapping,
             outcome_column=audit_config.outcome_column,
@@ -232,7 +287,8 @@ async def run_bias_audit_task(
         logger.info(f"[BiasAudit] Parsed {len(records)} records, {unknown_count} unknown")
 
         # Run computation
-        result = compute_bias_audit(
+        result = await asyncio.to_thread(
+            compute_bias_audit,
             records=records,
             config=audit_config,
             unknown_count=unknown_count,
@@ -279,6 +335,50 @@ async def run_bias_audit_task(
             logger.error(f"[BiasAudit] Failed to mark audit {audit_id} as failed: {cleanup_err}")
 
 
+async def run_bias_audit_job(payload: Dict[str, Any], organization_id: int, attempt: int) -> None:
+    """Job queue handler for bias audits."""
+    if attempt > 1:
+        logger.warning(f"[BiasAudit] Re-delivered audit {payload['audit_id']} (attempt {attempt})")
+    try:
+        csv_bytes = await asyncio.to_thread(_audit_csv_path(payload["csv_file"]).read_bytes)
+    except (OSError, ValueError) as e:
+        logger.error(f"[BiasAudit] Uploaded CSV for audit {payload['audit_id']} is unavailable: {e}")
+        async with get_db() as db:
+            await update_bias_audit_status(
+                organization_id, db, payload["audit_id"],
+                status="failed",
+                error="Uploaded dataset is no longer available",
+            )
+            await db.commit()
+        return
+    await run_bias_audit_task(
+        audit_id=payload["audit_id"],
+        csv_bytes=csv_bytes,
+        config_data=payload["config_data"],
+        preset=payload.get("preset"),
+        organization_id=organization_id,
+    )
+    # The task records its own success or failure; the upload is no longer needed
+    if "csv_file" in payload:
+        await asyncio.to_thread(_remove_audit_csv, payload["csv_file"])
+
+
+async def fail_bias_audit_job(payload: Dict[str, Any], organization_id: int) -> None:
+    """Dead-letter handler for bias audits."""
+    async with get_db() as db:
+        await update_bias_audit_status(
+            organization_id, db, payload["audit_id"],
+            status="failed",
+            error="Audit was interrupted repeatedly and could not be completed",
+        )
+        await db.commit()
+    if "csv_file" in payload:
+        await asyncio.to_thread(_remove_audit_csv, payload["csv_file"])
+
+
+register_job_handler("bias_audit", run_bias_audit_job, on_dead=fail_bias_audit_job)
+
+
 async def get_bias_audit_status_controller(
     audit_id: str,
     organization_id: int,
@@ -375,6 +475,9 @@ async def delete_bias_audit_controller(
         if not deleted:
             raise HTTPException(status_code=404, detail=f"Audit {audit_id} not found")
 
+        # Drop the upload of an audit that was deleted before it ran
+        await asyncio.to_thread(_remove_audit_csv, f"{organization_id}/{audit_id}.csv")
+
         return JSONResponse(
             status_code=200,
             content={"message": "Bias audit deleted successfully", "auditId": audit_id},
@@ -380,7 +380,9 @@ async def run_deepeval_evaluation_task(
             "toxicity": True,
         })
         
-        results = evaluator.run_evaluation(
+        # In a worker thread: judge calls must not block the event loop
+        results = await asyncio.to_thread(
+            evaluator.run_evaluation,
             test_cases_data=test_cases_data,
             metrics_config=metrics_config
         )
@@ -6,7 +6,7 @@ Controller functions for LLM Arena comparisons using ArenaGEval.
 Shared-schema multi-tenancy: Uses organization_id for tenant isolation.
 """
 
-from fastapi import BackgroundTasks, HTTPException
+from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -15,6 +15,7 @@ import asyncio
 import traceback
 import json
 import re
+from itertools import islice
 
 from database.db import get_db
 from crud.deepeval_arena import (
@@ -24,7 +25,10 @@ from crud.deepeval_arena import (
     update_arena_comparison,
     delete_arena_comparison,
 )
-from database.redis import get_redis
+from crud.llm_api_keys import get_decrypted_api_keys
+from utils.job_queue import register_job_handler, submit_job
+from utils.dataset_stream import iter_dataset_items
+from utils.rate_limiter import acall_with_rate_limit, get_rate_limiter
 
 import logging
 logger = logging.getLogger('uvicorn')
@@ -33,12 +37,17 @@ logger = logging.getLogger('uvicorn')
 MAX_PROMPTS_PER_COMPARISON = 10  # Limit to avoid long-running tasks
 
 
-async def load_dataset_prompts(dataset_path: str, organization_id: int) -> List[Dict[str, Any]]:
+async def load_dataset_prompts(
+    dataset_path: str,
+    organization_id: int,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
     """
     Load prompts from a dataset file.
+
+    The file is streamed and reading stops after ``limit`` prompts, so large
+    datasets are never loaded whole.
     """
-    import json
-    import os
     from pathlib import Path
 
     logger.info(f"[ARENA] Loading dataset: path={dataset_path}, organization_id={organization_id}")
@@ -88,26 +97,9 @@ async def load_dataset_prompts(dataset_path: str, organization_id: int) -> List[
     logger.info(f"[ARENA] Loading dataset from: {file_path}")
     
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        logger.debug(f"[ARENA] Dataset loaded, type: {type(data)}")
-        
-        # Handle different dataset formats
-        prompts = []
-        if isinstance(data, list):
-            prompts = data
-        elif isinstance(data, dict):
-            # Check for common keys
-            if "prompts" in data:
-                prompts = data["prompts"]
-            elif "test_cases" in data:
-                prompts = data["test_cases"]
-            elif "data" in data:
-                prompts = data["data"]
-            else:
-                # Try to use the whole dict as a single item
-                prompts = [data]
+        # Lists, JSONL and objects wrapping the list under prompts/test_cases/data
+        # are all handled by the streaming reader (other objects become one item)
+        prompts = list(islice(iter_dataset_items(file_path), limit))
         
         logger.info(f"[ARENA] Extracted {len(prompts)} prompts from dataset")
         return prompts
@@ -141,6 +133,9 @@ async def call_llm_model(
     if not api_key:
         raise ValueError(f"No API key provided for provider: {provider}")
     
+    # Shared with evaluation runs and scorers using the same provider key
+    limiter = get_rate_limiter(provider.lower(), api_key=api_key)
+
     try:
         if provider == "openai":
             client = openai.OpenAI(api_key=api_key)
@@ -149,35 +144,42 @@ async def call_llm_model(
             # Older models use max_tokens
             newer_models = ["o1", "o3", "gpt-4o", "gpt-4.5", "gpt-5"]
             use_completion_tokens = any(model.startswith(prefix) for prefix in newer_models)
+            token_param = "max_completion_tokens" if use_completion_tokens else "max_tokens"
             
-            if use_completion_tokens:
-                response = client.chat.completions.create(
+            raw = await acall_with_rate_limit(
+                limiter,
+                lambda: asyncio.to_thread(
+                    client.chat.completions.with_raw_response.create,
                     model=model,
                     messages=[{"role": "user", "content": prompt}],
-                    max_completion_tokens=1024,
-                )
-            else:
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=1024,
-                )
+                    **{token_param: 1024},
+                ),
+            )
+            response = raw.parse()
             return response.choices[0].message.content or ""
         
         elif provider == "anthropic":
             client = anthropic.Anthropic(api_key=api_key)
-            response = client.messages.create(
-                model=model,
-                max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
+            raw = await acall_with_rate_limit(
+                limiter,
+                lambda: asyncio.to_thread(
+                    client.messages.with_raw_response.create,
+                    model=model,
+                    max_tokens=1024,
+                    messages=[{"role": "user", "content": prompt}],
+                ),
             )
+            response = raw.parse()
             return response.content[0].text if response.content else ""
         
         elif provider == "google":
             import google.generativeai as genai
             genai.configure(api_key=api_key)
             gen_model = genai.GenerativeModel(model)
-            response = gen_model.generate_content(prompt)
+            response = await acall_with_rate_limit(
+                limiter,
+                lambda: asyncio.to_thread(gen_model.generate_content, prompt),
+            )
             return response.text or ""
         
         else:
@@ -189,11 +191,16 @@ async def call_llm_model(
             }
             base_url = provider_base_urls.get(provider.lower(), f"https://api.{provider}.com/v1")
             client = openai.OpenAI(api_key=api_key, base_url=base_url)
-            response = client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1024,
+            raw = await acall_with_rate_limit(
+                limiter,
+                lambda: asyncio.to_thread(
+                    client.chat.completions.with_raw_response.create,
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=1024,
+                ),
             )
+            response = raw.parse()
             return response.choices[0].message.content or ""
             
     except Exception as e:
@@ -238,7 +245,7 @@ async def run_arena_comparison_task(
         logger.info(f"[ARENA] {comparison_id}: Loading dataset")
 
         # Load prompts from dataset
-        prompts = await load_dataset_prompts(dataset_path, organization_id)
+        prompts = await load_dataset_prompts(dataset_path, organization_id, limit=MAX_PROMPTS_PER_COMPARISON)
         
         if not prompts:
             # If no dataset, check if testCases are provided directly
@@ -337,15 +344,7 @@ async def run_arena_comparison_task(
                     individual_criteria = ["Overall"]
                 
                 # Determine judge provider from model name
-                judge_provider = "openai"
-                if "claude" in judge_model.lower():
-                    judge_provider = "anthropic"
-                elif "gemini" in judge_model.lower():
-                    judge_provider = "google"
-                elif "mistral" in judge_model.lower() or "magistral" in judge_model.lower():
-                    judge_provider = "mistral"
-                elif "grok" in judge_model.lower():
-                    judge_provider = "xai"
+                judge_provider = get_judge_provider(judge_model)
                 
                 # Build contestant names for the prompt
                 contestant_names = [cr["name"] for cr in contestant_responses]
@@ -494,8 +493,66 @@ IMPORTANT: Respond with ONLY the JSON, no other text."""
             await db.commit()
 
 
+def get_judge_provider(judge_model: str) -> str:
+    """Provider serving an arena judge model, derived from its name."""
+    judge_model = judge_model.lower()
+    if "claude" in judge_model:
+        return "anthropic"
+    if "gemini" in judge_model:
+        return "google"
+    if "mistral" in judge_model or "magistral" in judge_model:
+        return "mistral"
+    if "grok" in judge_model:
+        return "xai"
+    return "openai"
+
+
+async def resolve_arena_api_keys(config_data: Dict[str, Any], organization_id: int) -> Dict[str, str]:
+    """
+    Load the organization's stored API keys for the contestants' and judge's providers.
+
+    Keys are never put on the job queue (job records are kept in Redis), so
+    they are read from the database when the comparison runs.
+    """
+    providers = [
+        c.get("hyperparameters", {}).get("provider", "").lower()
+        for c in config_data.get("contestants", [])
+    ]
+    providers.append(get_judge_provider(config_data.get("judgeModel", "gpt-4o")))
+    async with get_db() as db:
+        return await get_decrypted_api_keys(organization_id, [p for p in providers if p], db)
+
+
+async def run_arena_comparison_job(payload: Dict[str, Any], organization_id: int, attempt: int):
+    """Job queue handler for arena comparisons."""
+    if attempt > 1:
+        logger.warning(f"[ARENA] Re-delivered comparison {payload['comparison_id']} (attempt {attempt})")
+    config_data = dict(payload["config_data"])
+    try:
+        config_data["apiKeys"] = await resolve_arena_api_keys(config_data, organization_id)
+    except Exception as e:
+        logger.error(f"[ARENA] Could not load API keys for {payload['comparison_id']}: {e}")
+        config_data["apiKeys"] = {}
+    await run_arena_comparison_task(payload["comparison_id"], config_data, organization_id)
+
+
+async def fail_arena_comparison_job(payload: Dict[str, Any], organization_id: int):
+    """Dead-letter handler for arena comparisons."""
+    async with get_db() as db:
+        await update_arena_comparison(
+            payload["comparison_id"],
+            organization_id=organization_id,
+            status="failed",
+            error_message="Comparison was interrupted repeatedly and could not be completed",
+            db=db,
+        )
+        await db.commit()
+
+
+register_job_handler("arena", run_arena_comparison_job, on_dead=fail_arena_comparison_job)
+
+
 async def create_arena_comparison_controller(
-    background_tasks: BackgroundTasks,
     config_data: Dict[str, Any],
     organization_id: int,
     user_id: Optional[str] = None,
@@ -534,15 +591,19 @@ async def create_arena_comparison_controller(
             )
             await db.commit()
         
-        # Start background task
-        logger.info(f"[ARENA] Scheduling background task for {comparison_id}")
-        background_tasks.add_task(
-            run_arena_comparison_task,
-            comparison_id,
-            config_data,
-            organization_id,
+        # Queue the comparison on the durable job queue
+        logger.info(f"[ARENA] Queueing job for {comparison_id}")
+        await submit_job(
+            kind="arena",
+            entity_id=comparison_id,
+            organization_id=organization_id,
+            # Provider keys stay out of the queue; the job loads them from the database
+            payload={
+                "comparison_id": comparison_id,
+                "config_data": {k: v for k, v in config_data.items() if k != "apiKeys"},
+            },
         )
-        logger.info(f"[ARENA] Background task scheduled for {comparison_id}")
+        logger.info(f"[ARENA] Job queued for {comparison_id}")
         
         return JSONResponse(
             status_code=202,
@@ -6,7 +6,8 @@ Shared-schema multi-tenancy: All data is in the public schema with organization_
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
+import os
 import uuid
 import json
 
@@ -106,6 +107,38 @@ async def update_log_metadata(
     return result.mappings().first() is not None
 
 
+async def update_logs_metadata_bulk(
+    db: AsyncSession,
+    organization_id: int,
+    updates: Dict[str, Dict[str, Any]],
+    chunk_size: int = 1000,
+) -> int:
+    """Merge metadata for many logs ({log_id: metadata}) with one UPDATE per chunk and a single commit"""
+    items = [(log_id, metadata) for log_id, metadata in updates.items() if log_id]
+    if not items:
+        return 0
+
+    updated = 0
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start:start + chunk_size]
+        result = await db.execute(
+            text('''
+                UPDATE llm_evals_logs AS l
+                SET metadata = COALESCE(l.metadata, '{}'::jsonb) || v.metadata_json::jsonb
+                FROM unnest(CAST(:log_ids AS text[]), CAST(:metadata_jsons AS text[])) AS v(log_id, metadata_json)
+                WHERE l.organization_id = :organization_id AND l.id = v.log_id::uuid
+            '''),
+            {
+                "log_ids": [str(log_id) for log_id, _ in chunk],
+                "metadata_jsons": [json.dumps(metadata) if metadata else '{}' for _, metadata in chunk],
+                "organization_id": organization_id,
+            }
+        )
+        updated += result.rowcount or 0
+    await db.commit()
+    return updated
+
+
 async def get_logs(
     db: AsyncSession,
     organization_id: int,
@@ -197,6 +230,55 @@ async def get_log_count(
     return row["count"] if row else 0
 
 
+async def get_completed_experiment_logs(
+    db: AsyncSession,
+    organization_id: int,
+    experiment_id: str,
+) -> List[Dict[str, Any]]:
+    """Get the successful logs of an experiment in insertion order (used to resume a run)"""
+    result = await db.execute(
+        text('''
+            SELECT id, input_text, output_text, latency_ms, token_count, metadata
+            FROM llm_evals_logs
+            WHERE organization_id = :organization_id AND experiment_id = :experiment_id
+              AND status = 'success'
+            ORDER BY timestamp ASC
+        '''),
+        {"organization_id": organization_id, "experiment_id": experiment_id}
+    )
+    return [
+        {
+            "id": str(row["id"]),
+            "input_text": row["input_text"],
+            "output_text": row["output_text"],
+            "latency_ms": row["latency_ms"],
+            "token_count": row["token_count"],
+            "metadata": row["metadata"] or {},
+        }
+        for row in result.mappings().all()
+    ]
+
+
+async def delete_experiment_logs(
+    db: AsyncSession,
+    organization_id: int,
+    experiment_id: str,
+    status: Optional[str] = None,
+) -> int:
+    """Delete an experiment's logs, optionally only those with the given status"""
+    status_clause = "AND status = :status" if status else ""
+    result = await db.execute(
+        text(f'''
+            DELETE FROM llm_evals_logs
+            WHERE organization_id = :organization_id AND experiment_id = :experiment_id
+            {status_clause}
+        '''),
+        {"organization_id": organization_id, "experiment_id": experiment_id, "status": status}
+    )
+    await db.commit()
+    return result.rowcount or 0
+
+
 # ==================== METRICS ====================
 
 async def create_metric(
@@ -298,6 +380,179 @@ async def get_metric_aggregates(
     return {"average": 0, "min": 0, "max": 0, "count": 0}
 
 
+# ==================== BATCHED WRITES ====================
+
+# Rows per multi-row INSERT issued by LogWriteBuffer (keeps bind params well under Postgres' 65535 limit)
+DEFAULT_WRITE_BATCH_SIZE = int(os.getenv("EVAL_LOG_BATCH_SIZE", "100"))
+_MAX_ROWS_PER_INSERT = 1000
+
+_LOG_COLUMNS = (
+    "id", "organization_id", "project_id", "experiment_id", "trace_id", "parent_trace_id", "span_name",
+    "input_text", "output_text", "model_name", "metadata", "latency_ms", "token_count",
+    "cost", "status", "error_message", "created_by", "timestamp",
+)
+_LOG_CASTS = {
+    "trace_id": "CAST(:{p} AS uuid)",
+    "parent_trace_id": "CAST(:{p} AS uuid)",
+    "metadata": "CAST(:{p} AS jsonb)",
+}
+
+_METRIC_COLUMNS = (
+    "id", "organization_id", "project_id", "experiment_id", "metric_name", "metric_type",
+    "value", "dimensions", "timestamp",
+)
+_METRIC_CASTS = {
+    "dimensions": "CAST(:{p} AS jsonb)",
+}
+
+
+async def _insert_rows(
+    db: AsyncSession,
+    table: str,
+    columns: tuple,
+    casts: Dict[str, str],
+    rows: List[Dict[str, Any]],
+) -> int:
+    """Insert rows with multi-row INSERT statements (no commit)"""
+    inserted = 0
+    for start in range(0, len(rows), _MAX_ROWS_PER_INSERT):
+        chunk = rows[start:start + _MAX_ROWS_PER_INSERT]
+        params: Dict[str, Any] = {}
+        values_sql = []
+        for i, row in enumerate(chunk):
+            placeholders = []
+            for col in columns:
+                param = f"{col}_{i}"
+                params[param] = row.get(col)
+                placeholders.append(casts.get(col, ":{p}").format(p=param))
+            values_sql.append(f"({', '.join(placeholders)})")
+        await db.execute(
+            text(f'''
+                INSERT INTO {table} ({', '.join(columns)})
+                VALUES {', '.join(values_sql)}
+            '''),
+            params
+        )
+        inserted += len(chunk)
+    return inserted
+
+
+class LogWriteBuffer:
+    """
+    Write-behind buffer for per-sample logs and metrics of one experiment.
+
+    add_log/add_metric queue rows in memory and return immediately (log ids are
+    generated client-side, so callers can reference them before the row is
+    written). Rows are persisted with multi-row INSERTs whenever batch_size rows
+    are pending, and on every explicit flush() - callers must flush at stage
+    boundaries and before reporting a failure so no rows are lost.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        organization_id: int,
+        project_id: str,
+        experiment_id: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self.db = db
+        self.organization_id = organization_id
+        self.project_id = project_id
+        self.experiment_id = experiment_id
+        self.batch_size = max(1, int(batch_size or DEFAULT_WRITE_BATCH_SIZE))
+        self._logs: List[Dict[str, Any]] = []
+        self._metrics: List[Dict[str, Any]] = []
+
+    @property
+    def pending(self) -> int:
+        return len(self._logs) + len(self._metrics)
+
+    async def add_log(
+        self,
+        input_text: Optional[str] = None,
+        output_text: Optional[str] = None,
+        model_name: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+        latency_ms: Optional[int] = None,
+        token_count: Optional[int] = None,
+        cost: Optional[float] = None,
+        status: Optional[str] = "success",
+        error_message: Optional[str] = None,
+        trace_id: Optional[str] = None,
+        parent_trace_id: Optional[str] = None,
+        span_name: Optional[str] = None,
+        created_by: Optional[int] = None,
+    ) -> str:
+        """Queue a log row and return its id"""
+        log_id = str(uuid.uuid4())
+        self._logs.append({
+            "id": log_id,
+            "organization_id": self.organization_id,
+            "project_id": self.project_id,
+            "experiment_id": self.experiment_id,
+            "trace_id": trace_id or str(uuid.uuid4()),
+            "parent_trace_id": parent_trace_id,
+            "span_name": span_name,
+            "input_text": input_text,
+            "output_text": output_text,
+            "model_name": model_name,
+            "metadata": json.dumps(metadata) if metadata else '{}',
+            "latency_ms": latency_ms,
+            "token_count": token_count,
+            "cost": cost,
+            "status": status,
+            "error_message": error_message,
+            "created_by": str(created_by) if created_by is not None else None,
+            "timestamp": datetime.now(timezone.utc),
+        })
+        await self._maybe_flush()
+        return log_id
+
+    async def add_metric(
+        self,
+        metric_name: str,
+        metric_type: str,
+        value: float,
+        dimensions: Optional[Dict] = None,
+    ) -> str:
+        """Queue a metric row and return its id"""
+        metric_id = str(uuid.uuid4())
+        self._metrics.append({
+            "id": metric_id,
+            "organization_id": self.organization_id,
+            "project_id": self.project_id,
+            "experiment_id": self.experiment_id,
+            "metric_name": metric_name,
+            "metric_type": metric_type,
+            "value": value,
+            "dimensions": json.dumps(dimensions) if dimensions else '{}',
+            "timestamp": datetime.now(timezone.utc),
+        })
+        await self._maybe_flush()
+        return metric_id
+
+    async def _maybe_flush(self) -> None:
+        if self.pending >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Persist all pending rows; on error the rows stay queued and the error is raised"""
+        if not self.pending:
+            return 0
+        logs, metrics = self._logs, self._metrics
+        try:
+            # Logs first, in one transaction with the metrics
+            written = await _insert_rows(self.db, "llm_evals_logs", _LOG_COLUMNS, _LOG_CASTS, logs)
+            written += await _insert_rows(self.db, "llm_evals_metrics", _METRIC_COLUMNS, _METRIC_CASTS, metrics)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        self._logs, self._metrics = [], []
+        return written
+
+
 # ==================== EXPERIMENTS ====================
 
 async def create_experiment(
@@ -530,6 +785,74 @@ async def update_experiment_status(
     return None
 
 
+async def update_experiment_partial_results(
+    db: AsyncSession,
+    experiment_id: str,
+    organization_id: int,
+    results: Dict[str, Any],
+) -> bool:
+    """
+    Store in-progress results for a running experiment.
+
+    Only applies while the experiment is still running, so a late periodic
+    write can never overwrite the final results of a completed experiment.
+    """
+    result = await db.execute(
+        text('''
+            UPDATE llm_evals_experiments
+            SET results = CAST(:results_json AS jsonb), updated_at = CURRENT_TIMESTAMP
+            WHERE organization_id = :organization_id AND id = :experiment_id AND status = 'running'
+        '''),
+        {
+            "experiment_id": experiment_id,
+            "organization_id": organization_id,
+            "results_json": json.dumps(results),
+        }
+    )
+    await db.commit()
+    return (result.rowcount or 0) > 0
+
+
+async def get_experiment_batch_jobs(
+    db: AsyncSession,
+    experiment_id: str,
+    organization_id: int,
+) -> List[Dict[str, Any]]:
+    """Provider batch jobs recorded for an experiment (batch execution mode)"""
+    result = await db.execute(
+        text('''
+            SELECT batch_jobs FROM llm_evals_experiments
+            WHERE organization_id = :organization_id AND id = :experiment_id
+        '''),
+        {"organization_id": organization_id, "experiment_id": experiment_id}
+    )
+    row = result.mappings().first()
+    return list(row["batch_jobs"] or []) if row else []
+
+
+async def add_experiment_batch_jobs(
+    db: AsyncSession,
+    experiment_id: str,
+    organization_id: int,
+    jobs: List[Dict[str, Any]],
+) -> None:
+    """Append submitted provider batch jobs to an experiment's batch_jobs"""
+    await db.execute(
+        text('''
+            UPDATE llm_evals_experiments
+            SET batch_jobs = COALESCE(batch_jobs, CAST('[]' AS jsonb)) || CAST(:jobs_json AS jsonb),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE organization_id = :organization_id AND id = :experiment_id
+        '''),
+        {
+            "experiment_id": experiment_id,
+            "organization_id": organization_id,
+            "jobs_json": json.dumps(jobs),
+        }
+    )
+    await db.commit()
+
+
 async def update_experiment(
     db: AsyncSession,
     experiment_id: str,
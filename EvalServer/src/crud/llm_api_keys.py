@@ -0,0 +1,43 @@
+"""
+Read access to the organization LLM API keys managed by the backend.
+
+Shared-schema multi-tenancy: All data is in the public schema with organization_id column.
+"""
+
+from typing import Dict, Iterable, Optional
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from utils.encryption import decrypt
+
+logger = logging.getLogger(__name__)
+
+
+async def get_decrypted_api_key(organization_id: int, provider: str, db: AsyncSession) -> Optional[str]:
+    """
+    Decrypted API key stored for ``provider``, or None if there is none or it cannot be decrypted.
+    """
+    result = await db.execute(
+        text('SELECT api_key_encrypted FROM llm_evals_api_keys WHERE organization_id = :organization_id AND provider = :provider'),
+        {"organization_id": organization_id, "provider": provider},
+    )
+    row = result.fetchone()
+    if not row or not row[0]:
+        return None
+    try:
+        return decrypt(row[0])
+    except Exception as e:
+        logger.error(f"Failed to decrypt API key for provider {provider}: {e}")
+        return None
+
+
+async def get_decrypted_api_keys(organization_id: int, providers: Iterable[str], db: AsyncSession) -> Dict[str, str]:
+    """Decrypted API keys for ``providers``; providers without a usable key are left out."""
+    keys: Dict[str, str] = {}
+    for provider in dict.fromkeys(providers):
+        api_key = await get_decrypted_api_key(organization_id, provider, db)
+        if api_key:
+            keys[provider] = api_key
+    return keys
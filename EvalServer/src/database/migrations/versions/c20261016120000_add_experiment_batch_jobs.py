@@ -0,0 +1,35 @@
+"""add-experiment-batch-jobs
+
+Revision ID: c20261016120000
+Revises: c20260303115117
+Create Date: 2026-10-16
+
+Adds llm_evals_experiments.batch_jobs: the provider batch jobs (OpenAI Batch /
+Anthropic Message Batches) an experiment submitted in batch execution mode, so
+a resumed run re-attaches to them instead of submitting and paying again.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c20261016120000'
+down_revision: Union[str, None] = 'c20260303115117'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.text('''
+        ALTER TABLE verifywise.llm_evals_experiments
+        ADD COLUMN IF NOT EXISTS batch_jobs JSONB;
+    '''))
+
+
+def downgrade() -> None:
+    op.execute(sa.text('''
+        ALTER TABLE verifywise.llm_evals_experiments
+        DROP COLUMN IF EXISTS batch_jobs;
+    '''))
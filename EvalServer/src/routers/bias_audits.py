@@ -5,7 +5,7 @@ Endpoints for managing bias audits with law-aware presets.
 Shared-schema multi-tenancy: Uses organization_id from request.state.
 """
 
-from fastapi import APIRouter, BackgroundTasks, Request, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Request, UploadFile, File, Form, HTTPException
 from controllers.bias_audits import (
     list_presets_controller,
     get_preset_controller,
@@ -47,7 +47,6 @@ async def get_preset(preset_id: str):
 @router.post("/bias-audits/run")
 async def create_bias_audit(
     request: Request,
-    background_tasks: BackgroundTasks,
     dataset: UploadFile = File(...),
     config_json: str = Form(...),
     org_id: str = Form(...),
@@ -61,7 +60,6 @@ async def create_bias_audit(
     organization_id = _get_organization_id(request)
     user_id = request.headers.get("x-user-id")
     return await create_bias_audit_controller(
-        background_tasks=background_tasks,
         dataset=dataset,
         config_json=config_json,
         organization_id=organization_id,
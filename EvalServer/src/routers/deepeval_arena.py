@@ -7,7 +7,7 @@ Based on DeepEval's LLM Arena: https://deepeval.com/docs/getting-started-llm-are
 Shared-schema multi-tenancy: Uses organization_id from request.state.
 """
 
-from fastapi import APIRouter, BackgroundTasks, Request, Body, HTTPException
+from fastapi import APIRouter, Request, Body, HTTPException
 from fastapi.responses import JSONResponse
 from typing import List, Dict, Any, Optional
 from controllers.deepeval_arena import (
@@ -32,7 +32,6 @@ def _get_organization_id(request: Request) -> int:
 @router.post("/arena/compare")
 async def create_arena_comparison(
     request: Request,
-    background_tasks: BackgroundTasks,
     config_data: dict = Body(...)
 ):
     """
@@ -81,7 +80,6 @@ async def create_arena_comparison(
     organization_id = _get_organization_id(request)
     user_id = request.headers.get("x-user-id")
     return await create_arena_comparison_controller(
-        background_tasks=background_tasks,
         config_data=config_data,
         organization_id=organization_id,
         user_id=user_id,
@@ -5,14 +5,17 @@ Shared-schema multi-tenancy: Uses organization_id from request.state.
 """
 
 from fastapi import APIRouter, Query, Path, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import os
+import json
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 
 from controllers import evaluation_logs as controller
 from database.db import get_db
+from utils.job_queue import register_job_handler, submit_job, get_queue_stats
+from utils.progress import get_progress_snapshot, stream_progress
 
 
 def _get_organization_id(request: Request) -> int:
@@ -352,18 +355,15 @@ async def create_experiment(
         # Auto-run the evaluation in the background
         experiment_id = result.get("experiment", {}).get("id")
         if experiment_id:
-            import asyncio
-            from database.db import get_db
-            from utils.run_evaluation import run_evaluation
-            
-            print(f"🚀 Starting background evaluation task...")
+            print(f"🚀 Queueing evaluation job...")
             
-            # Run evaluation in background
-            asyncio.create_task(run_evaluation_task(
-                experiment_id=experiment_id,
-                config=experiment_data.config,
+            # Run evaluation through the durable job queue
+            await submit_job(
+                kind="experiment",
+                entity_id=experiment_id,
                 organization_id=_get_organization_id(request),
-            ))
+                payload={"experiment_id": experiment_id, "config": experiment_data.config},
+            )
         
         return result
     except Exception as e:
@@ -374,15 +374,11 @@ async def create_experiment(
 
 
 async def run_evaluation_task(experiment_id: str, config: Dict, organization_id: int):
-    """Background task: run evaluation in a non-blocking subprocess and stream logs asynchronously."""
-    import sys
-    import json
-    from pathlib import Path
-    import asyncio
-
+    """Background task: run evaluation on a warm worker process (isolated from uvloop)."""
     try:
         from database.db import get_db
         from crud import evaluation_logs as crud
+        from utils.evaluation_worker_pool import get_evaluation_worker_pool
 
         async with get_db() as db:
             # Update status to running
@@ -393,46 +389,19 @@ async def run_evaluation_task(experiment_id: str, config: Dict, organization_id:
                 status="running",
             )
         
-        # Run evaluation in subprocess to avoid uvloop conflict with DeepEval
-        print("🚀 Starting evaluation in subprocess (streaming logs)...")
+        # Run evaluation in a warm worker process to avoid uvloop conflict with DeepEval
+        print("🚀 Starting evaluation on warm worker pool...")
 
-        script_path = Path(__file__).parent.parent / "utils" / "run_evaluation_subprocess.py"
-        python_executable = sys.executable
-
-        # Prepare arguments
-        eval_args = json.dumps({
-            "experiment_id": experiment_id,
-            "config": config,
-            "organization_id": organization_id,
-        })
-
-        # Async subprocess with piped output (non-blocking)
-        env = dict(**os.environ)
-        env["PYTHONUNBUFFERED"] = "1"
-
-        proc = await asyncio.create_subprocess_exec(
-            python_executable,
-            "-u",
-            str(script_path),
-            eval_args,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.STDOUT,
-            env=env,
+        reply = await get_evaluation_worker_pool().run(
+            experiment_id=experiment_id,
+            config=config,
+            organization_id=organization_id,
         )
 
-        assert proc.stdout is not None
-        while True:
-            line = await proc.stdout.readline()
-            if not line:
-                break
-            print(f"[eval:{experiment_id}] {line.decode().rstrip()}")
-
-        return_code = await proc.wait()
-
-        if return_code == 0:
-            print("✅ Evaluation subprocess completed successfully")
+        if reply.get("ok"):
+            print("✅ Evaluation worker completed successfully")
         else:
-            raise Exception(f"Evaluation subprocess failed with code {return_code}")
+            raise Exception(f"Evaluation worker failed: {reply.get('error')}")
             
     except Exception as e:
         print(f"❌ Background evaluation failed: {e}")
@@ -456,6 +425,38 @@ async def run_evaluation_task(experiment_id: str, config: Dict, organization_id:
             print(f"Failed to update experiment status: {update_err}")
 
 
+async def run_experiment_job(payload: Dict[str, Any], organization_id: int, attempt: int):
+    """Job queue handler for experiments"""
+    # Always resume: a previous delivery may have been interrupted (crash, or a
+    # graceful shutdown that re-queues without counting an attempt), and its
+    # finished samples must not be logged twice. With no logs this is a no-op.
+    if attempt > 1:
+        print(f"🔁 Re-delivered experiment {payload['experiment_id']} (attempt {attempt})")
+    config = {**payload["config"], "resume": True}
+    await run_evaluation_task(
+        experiment_id=payload["experiment_id"],
+        config=config,
+        organization_id=organization_id,
+    )
+
+
+async def fail_experiment_job(payload: Dict[str, Any], organization_id: int):
+    """Dead-letter handler: the experiment kept crashing its worker, give up on it"""
+    from crud import evaluation_logs as crud
+
+    async with get_db() as db:
+        await crud.update_experiment_status(
+            db=db,
+            experiment_id=payload["experiment_id"],
+            organization_id=organization_id,
+            status="failed",
+            error_message="Experiment was interrupted repeatedly and could not be completed",
+        )
+
+
+register_job_handler("experiment", run_experiment_job, on_dead=fail_experiment_job)
+
+
 @router.get("/experiments")
 async def get_experiments(
     request: Request,
@@ -503,6 +504,53 @@ async def get_experiment(
     )
 
 
+@router.get("/experiments/{experiment_id}/progress")
+async def get_experiment_progress(
+    request: Request,
+    experiment_id: str = Path(...),
+):
+    """Latest progress snapshot for a running experiment (served from Redis, not Postgres)"""
+    try:
+        snapshot = await get_progress_snapshot(_get_organization_id(request), experiment_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Progress store unavailable: {e}")
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="No progress recorded for this experiment")
+    return snapshot
+
+
+@router.get("/experiments/{experiment_id}/progress/stream")
+async def stream_experiment_progress(
+    request: Request,
+    experiment_id: str = Path(...),
+):
+    """
+    Server-Sent Events stream of experiment progress.
+
+    Each event is a JSON snapshot (stage, completed/total, throughput, ETA,
+    errors). The stream starts with the latest snapshot, sends a keep-alive
+    comment when idle, and closes after the completed/failed event.
+    """
+    organization_id = _get_organization_id(request)
+
+    async def event_source():
+        async for event in stream_progress(organization_id, experiment_id):
+            if await request.is_disconnected():
+                break
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: progress\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.patch("/experiments/{experiment_id}")
 async def update_experiment(
     request: Request,
@@ -534,6 +582,38 @@ async def update_experiment(
         )
 
 
+@router.post("/experiments/{experiment_id}/resume")
+async def resume_experiment(
+    request: Request,
+    experiment_id: str = Path(...),
+):
+    """Re-run a failed experiment, skipping samples that already completed"""
+    from crud import evaluation_logs as crud
+
+    organization_id = _get_organization_id(request)
+    async with get_db() as db:
+        experiment = await crud.get_experiment_by_id(
+            db=db,
+            experiment_id=experiment_id,
+            organization_id=organization_id,
+        )
+    if not experiment:
+        raise HTTPException(status_code=404, detail="Experiment not found")
+    if experiment["status"] in ("running", "completed"):
+        raise HTTPException(status_code=409, detail=f"Experiment is {experiment['status']}; only failed or pending experiments can be resumed")
+
+    config = dict(experiment.get("config") or {})
+    config.setdefault("project_id", experiment["project_id"])
+    config["resume"] = True
+    queued = await submit_job(
+        kind="experiment",
+        entity_id=experiment_id,
+        organization_id=organization_id,
+        payload={"experiment_id": experiment_id, "config": config},
+    )
+    return {"experiment_id": experiment_id, "status": "pending" if queued != "duplicate" else experiment["status"], "resume": True}
+
+
 @router.put("/experiments/{experiment_id}/status")
 async def update_experiment_status(
     request: Request,
@@ -564,6 +644,19 @@ async def delete_experiment(
         )
 
 
+# ==================== JOB QUEUE ENDPOINT ====================
+
+@router.get("/queue/stats")
+async def get_job_queue_stats(request: Request):
+    """Queue depth and running job counts (global and for the caller's organization)"""
+    try:
+        return await get_queue_stats(organization_id=_get_organization_id(request))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Job queue unavailable: {e}")
+
+
 # ==================== MONITOR DASHBOARD ENDPOINT ====================
 
 @router.get("/projects/{project_id}/monitor/dashboard")
@@ -0,0 +1,156 @@
+"""
+Streaming dataset loader.
+
+Datasets are read lazily instead of with ``json.load`` on the whole file, so
+only the items in flight (plus a read buffer) are held in memory no matter
+how large the file is. Supported layouts:
+
+- JSON Lines (``.jsonl`` / ``.ndjson``): one item per line, blank lines skipped
+- a top-level JSON array: items are parsed incrementally with
+  ``JSONDecoder.raw_decode`` as chunks are read
+- a top-level JSON object wrapping the list under ``prompts``, ``test_cases``
+  or ``data`` (or a single item): loaded whole, as these are small legacy files
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+WRAPPER_KEYS = ("prompts", "test_cases", "data")
+# Characters that may follow a complete array element
+_VALUE_TERMINATORS = " \t\r\n,]"
+
+_decoder = json.JSONDecoder()
+
+
+def _iter_jsonl(f) -> Iterator[Any]:
+    for line_no, line in enumerate(f, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_no}: {e.msg}") from e
+
+
+def _iter_json_array(f, buf: str, chunk_size: int) -> Iterator[Any]:
+    """Yield the elements of a JSON array whose opening '[' was already consumed from ``buf``."""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    expect_value = True
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n":
+            pos += 1
+        if pos >= len(buf):
+            if not fill():
+                raise ValueError("Unexpected end of file inside JSON array")
+            continue
+        char = buf[pos]
+        if char == "]":
+            return
+        if char == ",":
+            if expect_value:
+                raise ValueError("Unexpected ',' in JSON array")
+            expect_value = True
+            pos += 1
+            continue
+        if not expect_value:
+            raise ValueError("Expected ',' or ']' in JSON array")
+        try:
+            item, end = _decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if fill():
+                continue
+            raise ValueError("Unexpected end of file inside JSON array")
+        if (end == len(buf) or buf[end] not in _VALUE_TERMINATORS) and not eof and fill():
+            # A number cut at the chunk boundary ("12" of "123", "1." of "1.5")
+            # decodes as a shorter number, so only accept values followed by a
+            # separator or the end of the file
+            continue
+        pos = end
+        expect_value = False
+        yield item
+
+
+def iter_dataset_items(path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield dataset items from ``path`` one at a time."""
+    path = Path(path)
+    with open(path, "r", encoding="utf-8-sig") as f:
+        if path.suffix.lower() in JSONL_SUFFIXES:
+            yield from _iter_jsonl(f)
+            return
+
+        buf = ""
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return  # empty file
+            buf = (buf + chunk).lstrip()
+            if buf:
+                break
+
+        if buf.startswith("["):
+            yield from _iter_json_array(f, buf[1:], chunk_size)
+            return
+
+        data = json.loads(buf + f.read())
+        if isinstance(data, dict):
+            for key in WRAPPER_KEYS:
+                if isinstance(data.get(key), list):
+                    yield from data[key]
+                    return
+        yield data
+
+
+class StreamingDataset:
+    """
+    Re-iterable, lazily read dataset file.
+
+    Every iteration re-reads the file; ``len()`` is computed with one counting
+    pass and cached.
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self._length: Optional[int] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter_dataset_items(self.path, self.chunk_size)
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = sum(1 for _ in self)
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self.first() is not None
+
+    def first(self) -> Any:
+        items = iter(self)
+        try:
+            return next(items, None)
+        finally:
+            items.close()
+
+    def is_conversational(self) -> bool:
+        """True when items are multi-turn scenarios (``{"turns": [...]}``)."""
+        first = self.first()
+        return isinstance(first, dict) and "turns" in first
+
+    def __repr__(self) -> str:
+        return f"StreamingDataset({str(self.path)!r})"
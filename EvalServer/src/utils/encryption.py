@@ -0,0 +1,36 @@
+"""
+Decryption of secrets stored by the backend (Servers/utils/encryption.utils.ts).
+
+The backend encrypts LLM API keys with AES-256-CBC using ENCRYPTION_KEY and
+stores them as "iv:encryptedData" (both hex). The same key must be configured
+for the eval server so it can read keys at job run time instead of receiving
+them in job payloads.
+"""
+
+import os
+
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+# Same fallback as the backend, so unconfigured dev setups stay compatible
+_DEFAULT_ENCRYPTION_KEY = "default-key-change-this-in-production-32chars!!"
+
+
+def _encryption_key() -> bytes:
+    key = os.getenv("ENCRYPTION_KEY") or _DEFAULT_ENCRYPTION_KEY
+    return key.ljust(32, "0")[:32].encode("utf-8")
+
+
+def decrypt(encrypted_text: str) -> str:
+    """Decrypt text in the backend's "iv:encryptedData" format."""
+    if not encrypted_text:
+        raise ValueError("Text to decrypt cannot be empty")
+    parts = encrypted_text.split(":")
+    if len(parts) != 2:
+        raise ValueError("Invalid encrypted text format")
+
+    iv_hex, data_hex = parts
+    decryptor = Cipher(algorithms.AES(_encryption_key()), modes.CBC(bytes.fromhex(iv_hex))).decryptor()
+    padded = decryptor.update(bytes.fromhex(data_hex)) + decryptor.finalize()
+    unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+    return (unpadder.update(padded) + unpadder.finalize()).decode("utf-8")
@@ -0,0 +1,291 @@
+"""
+Warm pool of long-lived evaluation worker processes.
+
+Each worker is a spawned (not forked) interpreter that runs a standard asyncio
+loop, so DeepEval never sees uvicorn's uvloop ("Can't patch loop"). Workers
+import the evaluation stack (deepeval_engine, deepeval, torch/transformers)
+once at start-up and then execute experiments sent over a pipe, so no
+experiment pays the interpreter start and import cost.
+
+- A worker that dies mid-experiment is detected (EOF on its pipe), reaped and
+  respawned; the experiment is reported as failed to the caller.
+- Workers are recycled after EVAL_WORKER_MAX_TASKS experiments to bound
+  memory growth from model caches and leaks in third-party libraries.
+- Environment variables set by an experiment (API keys, judge settings) are
+  restored after every job so nothing leaks into the next tenant's run.
+"""
+
+import asyncio
+import gc
+import importlib
+import multiprocessing
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import logging
+logger = logging.getLogger('uvicorn')
+
+# Number of warm worker processes per API process (also the job queue's default
+# per-process concurrency, so every claimed experiment has a worker)
+DEFAULT_POOL_SIZE = int(os.getenv("EVAL_WORKER_POOL_SIZE", "2"))
+# Experiments a worker runs before it is replaced with a fresh process
+DEFAULT_MAX_TASKS_PER_WORKER = int(os.getenv("EVAL_WORKER_MAX_TASKS", "20"))
+
+PROJECT_SRC = Path(__file__).resolve().parent.parent
+# Imported once when a worker starts (utils.run_evaluation also puts EvaluationModule on sys.path)
+WARM_UP_MODULES = ("utils.run_evaluation", "deepeval_engine.deepeval_evaluator", "deepeval.test_case")
+
+
+class WorkerCrashedError(RuntimeError):
+    """Raised when a worker process exits while running an experiment."""
+
+
+class _PrefixedStream:
+    """Line-buffered stream wrapper that prefixes every line (keeps '[eval:<id>]' log tagging)."""
+
+    def __init__(self, stream, prefix: str):
+        self._stream = stream
+        self._prefix = prefix
+        self._buffer = ""
+
+    def write(self, data: str) -> int:
+        self._buffer += data
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            self._stream.write(f"{self._prefix}{line}\n")
+        self._stream.flush()
+        return len(data)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._stream.write(f"{self._prefix}{self._buffer}")
+            self._buffer = ""
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+async def _run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    from utils.run_evaluation import run_evaluation
+    from database.db import get_db
+
+    async with get_db() as db:
+        result = await run_evaluation(
+            db=db,
+            experiment_id=job["experiment_id"],
+            config=job["config"],
+            organization_id=job["organization_id"],
+        )
+    return result if isinstance(result, dict) else {}
+
+
+def _worker_main(conn, worker_index: int) -> None:
+    """Entry point of a worker process: warm up, then run jobs until told to stop."""
+    # Force use of standard asyncio loop (not uvloop)
+    asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    if str(PROJECT_SRC) not in sys.path:
+        sys.path.insert(0, str(PROJECT_SRC))
+
+    # Pre-import the evaluation stack once; failures surface on the first job instead
+    try:
+        for module in WARM_UP_MODULES:
+            importlib.import_module(module)
+        print(f"✅ Evaluation worker {worker_index} ready (pid={os.getpid()})", flush=True)
+    except Exception as e:
+        print(f"⚠️ Evaluation worker {worker_index} warm-up import failed: {e}", flush=True)
+
+    stdout, stderr = sys.stdout, sys.stderr
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+
+        env_snapshot = dict(os.environ)
+        prefix = f"[eval:{job['experiment_id']}] "
+        sys.stdout = _PrefixedStream(stdout, prefix)
+        sys.stderr = _PrefixedStream(stderr, prefix)
+        try:
+            result = loop.run_until_complete(_run_job(job))
+            reply = {"ok": True, "error": result.get("error")}
+        except BaseException as e:  # noqa: BLE001 - report everything back to the parent
+            import traceback
+            traceback.print_exc()
+            reply = {"ok": False, "error": str(e) or e.__class__.__name__}
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            sys.stdout, sys.stderr = stdout, stderr
+            os.environ.clear()
+            os.environ.update(env_snapshot)
+            gc.collect()
+
+        try:
+            conn.send(reply)
+        except (BrokenPipeError, OSError):
+            break
+
+    loop.close()
+
+
+class _WorkerSlot:
+    """One worker process plus its pipe; runs a single experiment at a time."""
+
+    def __init__(self, ctx, index: int, max_tasks: int, target: Callable = _worker_main):
+        self._ctx = ctx
+        self._target = target
+        self.index = index
+        self.max_tasks = max(1, max_tasks)
+        self.process = None
+        self.conn = None
+        self.tasks_done = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def start(self) -> None:
+        if self.alive:
+            return
+        self.stop()
+        parent_conn, child_conn = self._ctx.Pipe()
+        self.process = self._ctx.Process(
+            target=self._target,
+            args=(child_conn, self.index),
+            name=f"eval-worker-{self.index}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.tasks_done = 0
+        logger.info(f"Started evaluation worker {self.index} (pid={self.process.pid})")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Ask the worker to exit, killing it if it does not within ``timeout``."""
+        if self.conn is not None:
+            try:
+                self.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        if self.process is not None:
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join(5)
+        if self.conn is not None:
+            self.conn.close()
+        self.process = None
+        self.conn = None
+
+    def kill(self) -> None:
+        if self.process is not None and self.process.is_alive():
+            self.process.kill()
+            self.process.join(5)
+        if self.conn is not None:
+            self.conn.close()
+        self.process = None
+        self.conn = None
+
+    async def run(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        if self.tasks_done >= self.max_tasks:
+            logger.info(f"Recycling evaluation worker {self.index} after {self.tasks_done} experiments")
+            await asyncio.to_thread(self.stop)
+        self.start()
+
+        try:
+            self.conn.send(job)
+            reply = await asyncio.to_thread(self.conn.recv)
+        except (EOFError, OSError, BrokenPipeError):
+            exit_code = self.process.exitcode if self.process is not None else None
+            if self.process is not None:
+                await asyncio.to_thread(self.process.join, 5)
+                exit_code = self.process.exitcode
+            self.kill()
+            # Respawn right away so the pool stays warm
+            self.start()
+            raise WorkerCrashedError(f"Evaluation worker crashed (exit code {exit_code})")
+        except asyncio.CancelledError:
+            # The experiment is abandoned; the worker state is unknown, so replace it
+            self.kill()
+            raise
+
+        self.tasks_done += 1
+        return reply
+
+
+class EvaluationWorkerPool:
+    """Fixed-size pool of warm evaluation workers."""
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        max_tasks_per_worker: int = DEFAULT_MAX_TASKS_PER_WORKER,
+        worker_main: Callable = _worker_main,
+    ):
+        """``worker_main(conn, index)`` is the worker process entry point (replaceable in tests)."""
+        self._ctx = multiprocessing.get_context("spawn")
+        self._slots: List[_WorkerSlot] = [
+            _WorkerSlot(self._ctx, i, max_tasks_per_worker, target=worker_main) for i in range(max(1, size))
+        ]
+        self._idle: Optional[asyncio.Queue] = None
+
+    @property
+    def size(self) -> int:
+        return len(self._slots)
+
+    def start(self) -> None:
+        """Spawn all workers (idempotent) so they warm up before the first experiment."""
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for slot in self._slots:
+                self._idle.put_nowait(slot)
+        for slot in self._slots:
+            slot.start()
+
+    async def run(self, experiment_id: str, config: Dict[str, Any], organization_id: int) -> Dict[str, Any]:
+        """
+        Run one experiment on the next free worker.
+
+        Returns the worker's reply ({"ok": bool, "error": str | None}); raises
+        WorkerCrashedError if the worker process died during the experiment.
+        """
+        self.start()
+        slot = await self._idle.get()
+        try:
+            return await slot.run({
+                "experiment_id": experiment_id,
+                "config": config,
+                "organization_id": organization_id,
+            })
+        finally:
+            self._idle.put_nowait(slot)
+
+    def shutdown(self) -> None:
+        for slot in self._slots:
+            slot.stop(timeout=5)
+
+
+_pool: Optional[EvaluationWorkerPool] = None
+
+
+def get_evaluation_worker_pool() -> EvaluationWorkerPool:
+    global _pool
+    if _pool is None:
+        _pool = EvaluationWorkerPool()
+    return _pool
+
+
+async def shutdown_evaluation_worker_pool() -> None:
+    global _pool
+    if _pool is not None:
+        await asyncio.to_thread(_pool.shutdown)
+        _pool = None
@@ -0,0 +1,118 @@
+"""
+Content-addressed cache for model generations.
+
+Experiments often re-run the same prompts against the same model (re-runs,
+resumed jobs, A/B configs that only change the judge). With deterministic
+decoding the response is a pure function of the request, so it is cached in
+Redis under a SHA-256 of (provider, model, endpoint, prompt, temperature,
+max_tokens, top_p), scoped per organization.
+
+Entries expire after EVAL_GENERATION_CACHE_TTL seconds and the least recently
+used ones are evicted beyond EVAL_GENERATION_CACHE_MAX_ENTRIES (see
+utils.redis_lru). Redis errors are counted and treated as misses - the cache
+never fails a generation.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from utils.redis_lru import RedisLRUStore
+
+CACHE_PREFIX = "evalcache:gen"
+DEFAULT_TTL_SECONDS = int(os.getenv("EVAL_GENERATION_CACHE_TTL", str(7 * 24 * 3600)))
+DEFAULT_MAX_ENTRIES = int(os.getenv("EVAL_GENERATION_CACHE_MAX_ENTRIES", "100000"))
+
+
+class GenerationCache:
+    """Per-experiment view of the shared generation cache, with hit/miss accounting."""
+
+    def __init__(
+        self,
+        namespace: str,
+        provider: str,
+        model: Optional[str],
+        endpoint: Optional[str] = None,
+        mode: Optional[bool] = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            namespace: Isolation scope (the organization id)
+            provider/model/endpoint: Identify the model being called
+            mode: True = always cache, False = never, None = only deterministic (temperature 0) calls
+        """
+        self.namespace = namespace
+        self.provider = provider
+        self.model = model
+        self.endpoint = endpoint
+        self.mode = mode
+        self.store = RedisLRUStore(CACHE_PREFIX, ttl_seconds, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def enabled_for(self, temperature: Optional[float]) -> bool:
+        if self.mode is not None:
+            return bool(self.mode)
+        return temperature is not None and float(temperature) == 0.0
+
+    def make_key(
+        self,
+        prompt: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        top_p: Optional[float] = None,
+    ) -> str:
+        material = json.dumps(
+            {
+                "namespace": self.namespace,
+                "provider": self.provider,
+                "model": self.model,
+                "endpoint": self.endpoint,
+                "prompt": prompt,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "top_p": top_p,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            document = await self.store.get(key)
+        except Exception:
+            self.errors += 1
+            document = None
+        if document is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return document["response"]
+
+    async def set(self, key: str, response: str) -> None:
+        try:
+            await self.store.set(key, {"response": response})
+        except Exception:
+            self.errors += 1
+
+    def get_threadsafe(self, loop: asyncio.AbstractEventLoop, key: str) -> Optional[str]:
+        """Blocking lookup for code running in a worker thread while ``loop`` runs."""
+        return asyncio.run_coroutine_threadsafe(self.get(key), loop).result()
+
+    def set_threadsafe(self, loop: asyncio.AbstractEventLoop, key: str, response: str) -> None:
+        asyncio.run_coroutine_threadsafe(self.set(key, response), loop).result()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
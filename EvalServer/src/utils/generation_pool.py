@@ -0,0 +1,107 @@
+"""
+Bounded-concurrency worker pool for the generation stage.
+
+Runs an async worker over a sequence of items with at most ``concurrency``
+calls in flight, while handing results back to the caller strictly in input
+order. The caller therefore keeps its sequential bookkeeping (DB writes,
+fatal-error tracking, progress output) and can stop early at any point;
+leaving the ``async with`` block cancels everything still pending.
+"""
+
+import asyncio
+import os
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional, Tuple
+
+# Default number of in-flight model calls per experiment
+DEFAULT_GENERATION_CONCURRENCY = int(os.getenv("EVAL_GENERATION_CONCURRENCY", "4"))
+
+
+def resolve_concurrency(value: Any, default: int = DEFAULT_GENERATION_CONCURRENCY) -> int:
+    """Parse a concurrency setting from experiment config, falling back to ``default``."""
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return max(1, default)
+    return max(1, parsed)
+
+
+class OrderedWorkerPool:
+    """
+    Run ``worker(item)`` concurrently and yield ``(index, item, result)`` in input order.
+
+    ``window`` bounds how many items may be started ahead of the oldest result
+    the caller has not consumed yet, so a slow item cannot make the pool pull
+    the whole input into memory.
+    """
+
+    def __init__(
+        self,
+        worker: Callable[[Any], Awaitable[Any]],
+        concurrency: int = DEFAULT_GENERATION_CONCURRENCY,
+        window: Optional[int] = None,
+    ):
+        self.worker = worker
+        self.concurrency = max(1, int(concurrency))
+        self.window = max(self.concurrency, int(window or self.concurrency * 2))
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._tasks: set = set()
+        self._feeder: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "OrderedWorkerPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Cancel the feeder and every task that has not completed yet."""
+        tasks = list(self._tasks)
+        if self._feeder:
+            tasks.append(self._feeder)
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        if tasks:
+            # Also collects errors of finished tasks the caller never reached
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _run(self, item: Any) -> Any:
+        async with self._semaphore:
+            return await self.worker(item)
+
+    async def results(self, items: Iterable[Any]) -> AsyncIterator[Tuple[int, Any, Any]]:
+        """
+        Yield ``(index, item, result)`` for every item, in input order.
+
+        Exceptions raised by the worker propagate to the caller when that item
+        is reached; workers that want per-item error handling should return
+        the error instead of raising it.
+        """
+        window = asyncio.Semaphore(self.window)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def feed() -> None:
+            try:
+                for idx, item in enumerate(items):
+                    await window.acquire()
+                    task = asyncio.create_task(self._run(item))
+                    self._tasks.add(task)
+                    await queue.put((idx, item, task))
+            finally:
+                await queue.put(None)
+
+        self._feeder = asyncio.create_task(feed())
+        while True:
+            entry = await queue.get()
+            if entry is None:
+                break
+            idx, item, task = entry
+            try:
+                result = await task
+            finally:
+                self._tasks.discard(task)
+                window.release()
+            yield idx, item, result
+        # Surface errors raised while iterating the input
+        await self._feeder
@@ -0,0 +1,462 @@
+"""
+Durable Redis-backed job queue for long-running work (experiments, arena runs, bias audits).
+
+Jobs survive API restarts: a job is stored as a Redis hash and its id sits in a
+pending list until a consumer claims it. Claiming moves the id into a lease
+sorted set scored by its visibility deadline; consumers heartbeat to extend the
+lease while the job runs and acknowledge it when done. If a process dies, its
+leases expire and the reaper puts the jobs back at the head of the queue (up to
+EVAL_QUEUE_MAX_ATTEMPTS deliveries, after which the job's dead-letter callback
+marks it failed).
+
+Claims are atomic Lua scripts that enforce a global limit on running jobs and a
+per-organization limit, so one tenant cannot occupy every slot.
+
+Handlers are registered per job kind by the module that owns the work:
+
+    register_job_handler("experiment", run_experiment_job, on_dead=fail_experiment_job)
+
+and jobs are submitted with submit_job(); when Redis is unreachable the job
+runs in-process as before so the API keeps working.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from database.redis import get_redis
+from utils.evaluation_worker_pool import DEFAULT_POOL_SIZE
+
+import logging
+logger = logging.getLogger('uvicorn')
+
+QUEUE_PREFIX = "evaljobs"
+PENDING_KEY = f"{QUEUE_PREFIX}:pending"
+LEASES_KEY = f"{QUEUE_PREFIX}:leases"
+RUNNING_KEY = f"{QUEUE_PREFIX}:running"
+DEAD_KEY = f"{QUEUE_PREFIX}:dead"
+JOB_KEY_PREFIX = f"{QUEUE_PREFIX}:job:"
+
+# Jobs running across all API processes
+GLOBAL_CONCURRENCY = int(os.getenv("EVAL_QUEUE_GLOBAL_CONCURRENCY", "8"))
+# Jobs running per organization across all API processes
+ORG_CONCURRENCY = int(os.getenv("EVAL_QUEUE_ORG_CONCURRENCY", "2"))
+# Jobs this API process runs at once. Defaults to the evaluation worker pool size so
+# a claimed experiment never waits for a free worker while holding its lease and slots
+LOCAL_CONCURRENCY = int(os.getenv("EVAL_QUEUE_LOCAL_CONCURRENCY", str(DEFAULT_POOL_SIZE)))
+# Seconds a claimed job stays invisible without a heartbeat before it is re-delivered
+VISIBILITY_TIMEOUT = int(os.getenv("EVAL_QUEUE_VISIBILITY_TIMEOUT", "120"))
+MAX_ATTEMPTS = int(os.getenv("EVAL_QUEUE_MAX_ATTEMPTS", "3"))
+POLL_INTERVAL = float(os.getenv("EVAL_QUEUE_POLL_INTERVAL", "1.0"))
+# How many pending jobs a claim looks at to find one whose organization has a free slot
+CLAIM_SCAN_LIMIT = 50
+# Dead-lettered job records are kept this long for inspection
+DEAD_JOB_TTL = 7 * 24 * 3600
+DEAD_LIST_MAX = 1000
+
+_ENQUEUE_SCRIPT = """
+local key = ARGV[1] .. ARGV[2]
+local status = redis.call('HGET', key, 'status')
+if status == 'pending' or status == 'running' then
+  return 0
+end
+redis.call('DEL', key)
+redis.call('HSET', key, 'kind', ARGV[3], 'organization_id', ARGV[4], 'payload', ARGV[5],
+           'attempts', 0, 'status', 'pending', 'enqueued_at', ARGV[6])
+redis.call('RPUSH', KEYS[1], ARGV[2])
+return 1
+"""
+
+_CLAIM_SCRIPT = """
+if redis.call('ZCARD', KEYS[2]) >= tonumber(ARGV[3]) then
+  return false
+end
+local ids = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[5]) - 1)
+for _, id in ipairs(ids) do
+  local key = ARGV[6] .. id
+  local org = redis.call('HGET', key, 'organization_id')
+  if not org then
+    redis.call('LREM', KEYS[1], 1, id)
+  else
+    local running = tonumber(redis.call('HGET', KEYS[3], org) or '0')
+    if running < tonumber(ARGV[4]) then
+      redis.call('LREM', KEYS[1], 1, id)
+      redis.call('ZADD', KEYS[2], tonumber(ARGV[1]) + tonumber(ARGV[2]), id)
+      redis.call('HINCRBY', KEYS[3], org, 1)
+      redis.call('HINCRBY', key, 'attempts', 1)
+      redis.call('HSET', key, 'status', 'running', 'consumer', ARGV[7], 'claimed_at', ARGV[1])
+      return id
+    end
+  end
+end
+return false
+"""
+
+_HEARTBEAT_SCRIPT = """
+if redis.call('HGET', ARGV[2] .. ARGV[1], 'consumer') ~= ARGV[3] then
+  return 0
+end
+if not redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+  return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[4], ARGV[1])
+return 1
+"""
+
+# ARGV[4] == '1' puts the job back at the head of the queue (graceful shutdown) instead of deleting it
+_FINISH_SCRIPT = """
+local key = ARGV[2] .. ARGV[1]
+if redis.call('HGET', key, 'consumer') ~= ARGV[3] then
+  return 0
+end
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 1 then
+  local org = redis.call('HGET', key, 'organization_id')
+  if org and redis.call('HINCRBY', KEYS[2], org, -1) <= 0 then
+    redis.call('HDEL', KEYS[2], org)
+  end
+end
+if ARGV[4] == '1' then
+  redis.call('HINCRBY', key, 'attempts', -1)
+  redis.call('HSET', key, 'status', 'pending')
+  redis.call('HDEL', key, 'consumer')
+  redis.call('LPUSH', KEYS[3], ARGV[1])
+else
+  redis.call('DEL', key)
+end
+return 1
+"""
+
+_REAP_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 100)
+local requeued, dead = {}, {}
+for _, id in ipairs(expired) do
+  redis.call('ZREM', KEYS[1], id)
+  local key = ARGV[2] .. id
+  local org = redis.call('HGET', key, 'organization_id')
+  if org then
+    if redis.call('HINCRBY', KEYS[2], org, -1) <= 0 then
+      redis.call('HDEL', KEYS[2], org)
+    end
+    redis.call('HDEL', key, 'consumer')
+    if tonumber(redis.call('HGET', key, 'attempts') or '0') >= tonumber(ARGV[3]) then
+      redis.call('HSET', key, 'status', 'dead')
+      redis.call('EXPIRE', key, tonumber(ARGV[4]))
+      redis.call('LPUSH', KEYS[4], id)
+      redis.call('LTRIM', KEYS[4], 0, tonumber(ARGV[5]) - 1)
+      table.insert(dead, id)
+    else
+      redis.call('HSET', key, 'status', 'pending')
+      redis.call('LPUSH', KEYS[3], id)
+      table.insert(requeued, id)
+    end
+  end
+end
+return {requeued, dead}
+"""
+
+JobHandler = Callable[[Dict[str, Any], int, int], Awaitable[None]]
+DeadJobHandler = Callable[[Dict[str, Any], int], Awaitable[None]]
+
+
+@dataclass
+class _HandlerEntry:
+    run: JobHandler
+    on_dead: Optional[DeadJobHandler] = None
+
+
+_HANDLERS: Dict[str, _HandlerEntry] = {}
+# In-process fallback runs; the event loop only holds weak references to tasks
+_LOCAL_TASKS: Set[asyncio.Task] = set()
+
+
+def register_job_handler(kind: str, run: JobHandler, on_dead: Optional[DeadJobHandler] = None) -> None:
+    """
+    Register the coroutine that executes jobs of ``kind``.
+
+    ``run(payload, organization_id, attempt)`` is awaited for every delivery
+    (attempt > 1 means the job is being re-delivered after a crash).
+    The handler is cancelled on shutdown (the job is re-queued) and when its
+    lease is lost (the job is re-delivered elsewhere), so it must not swallow
+    ``asyncio.CancelledError``.
+    ``on_dead(payload, organization_id)`` is awaited once if the job exhausts
+    its delivery attempts, so the owner can mark it failed.
+    """
+    _HANDLERS[kind] = _HandlerEntry(run=run, on_dead=on_dead)
+
+
+def _job_key(job_id: str) -> str:
+    return f"{JOB_KEY_PREFIX}{job_id}"
+
+
+def make_job_id(kind: str, entity_id: str) -> str:
+    return f"{kind}:{entity_id}"
+
+
+async def enqueue_job(kind: str, entity_id: str, organization_id: int, payload: Dict[str, Any]) -> bool:
+    """Add a job to the durable queue. Returns False if the same job is already queued or running."""
+    r = await get_redis()
+    added = await r.eval(
+        _ENQUEUE_SCRIPT, 1, PENDING_KEY,
+        JOB_KEY_PREFIX, make_job_id(kind, entity_id), kind, str(organization_id),
+        json.dumps(payload), str(time.time()),
+    )
+    return bool(added)
+
+
+async def submit_job(kind: str, entity_id: str, organization_id: int, payload: Dict[str, Any]) -> str:
+    """
+    Queue a job, falling back to running it in this process if Redis is unavailable.
+
+    Returns "queued", "duplicate" or "local".
+    """
+    try:
+        added = await enqueue_job(kind, entity_id, organization_id, payload)
+        logger.info(f"[JobQueue] {'Queued' if added else 'Already queued'} {kind} job {entity_id}")
+        return "queued" if added else "duplicate"
+    except Exception as e:
+        logger.warning(f"[JobQueue] Redis unavailable ({e}); running {kind} job {entity_id} in-process")
+        handler = _HANDLERS.get(kind)
+        if handler is None:
+            raise
+        task = asyncio.create_task(handler.run(payload, organization_id, 1))
+        _LOCAL_TASKS.add(task)
+        task.add_done_callback(_LOCAL_TASKS.discard)
+        return "local"
+
+
+async def get_active_job_ids(kind: str) -> Optional[Set[str]]:
+    """Entity ids of ``kind`` jobs that are queued or leased, or None if Redis is unreachable."""
+    try:
+        r = await get_redis()
+        pending = await r.lrange(PENDING_KEY, 0, -1)
+        leased = await r.zrange(LEASES_KEY, 0, -1)
+    except Exception as e:
+        logger.warning(f"[JobQueue] Could not read queue state: {e}")
+        return None
+    prefix = f"{kind}:"
+    return {job_id[len(prefix):] for job_id in [*pending, *leased] if job_id.startswith(prefix)}
+
+
+async def get_queue_stats(organization_id: Optional[int] = None) -> Dict[str, Any]:
+    """Queue depth and running counts (global, and for one organization if given)."""
+    r = await get_redis()
+    async with r.pipeline(transaction=False) as pipe:
+        pipe.llen(PENDING_KEY)
+        pipe.zcard(LEASES_KEY)
+        pipe.llen(DEAD_KEY)
+        pipe.zrangebyscore(LEASES_KEY, "-inf", time.time())
+        if organization_id is not None:
+            pipe.hget(RUNNING_KEY, str(organization_id))
+        values = await pipe.execute()
+
+    stats: Dict[str, Any] = {
+        "pending": values[0],
+        "running": values[1],
+        "dead": values[2],
+        "expired_leases": len(values[3]),
+        "limits": {
+            "global": GLOBAL_CONCURRENCY,
+            "per_organization": ORG_CONCURRENCY,
+            "per_process": LOCAL_CONCURRENCY,
+            "visibility_timeout_seconds": VISIBILITY_TIMEOUT,
+            "max_attempts": MAX_ATTEMPTS,
+        },
+    }
+    if organization_id is not None:
+        stats["organization_running"] = int(values[4] or 0)
+    return stats
+
+
+class JobQueueWorker:
+    """Consumes the queue in this API process: claims jobs, heartbeats leases, reaps expired ones."""
+
+    def __init__(self, concurrency: int = LOCAL_CONCURRENCY, poll_interval: float = POLL_INTERVAL):
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.consumer_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._tasks: list = []
+        self._stopping = False
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._stopping = False
+        self._tasks = [self._spawn_slot(i) for i in range(self.concurrency)]
+        self._tasks.append(asyncio.create_task(self._reap_loop()))
+        logger.info(f"[JobQueue] Worker {self.consumer_id} started ({self.concurrency} slots)")
+
+    def _spawn_slot(self, slot: int, delay: float = 0.0) -> asyncio.Task:
+        task = asyncio.create_task(self._consume(slot, delay))
+        task.add_done_callback(lambda t, slot=slot: self._on_slot_done(slot, t))
+        return task
+
+    def _on_slot_done(self, slot: int, task: asyncio.Task) -> None:
+        """Restart a consumer slot that ended unexpectedly so the process keeps its capacity."""
+        if self._stopping or task.cancelled():
+            return
+        error = task.exception()
+        logger.error(f"[JobQueue] Consumer slot {slot} stopped ({error!r}); restarting it")
+        if slot < len(self._tasks) and self._tasks[slot] is task:
+            self._tasks[slot] = self._spawn_slot(slot, delay=self.poll_interval * 5)
+
+    async def stop(self) -> None:
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _claim(self) -> Optional[str]:
+        r = await get_redis()
+        return await r.eval(
+            _CLAIM_SCRIPT, 3, PENDING_KEY, LEASES_KEY, RUNNING_KEY,
+            str(time.time()), str(VISIBILITY_TIMEOUT), str(GLOBAL_CONCURRENCY), str(ORG_CONCURRENCY),
+            str(CLAIM_SCAN_LIMIT), JOB_KEY_PREFIX, self.consumer_id,
+        )
+
+    async def _finish(self, job_id: str, requeue: bool = False) -> None:
+        r = await get_redis()
+        await r.eval(
+            _FINISH_SCRIPT, 3, LEASES_KEY, RUNNING_KEY, PENDING_KEY,
+            job_id, JOB_KEY_PREFIX, self.consumer_id, "1" if requeue else "0",
+        )
+
+    async def _heartbeat(self, job_id: str, run: asyncio.Task, lease_lost: asyncio.Event) -> None:
+        """
+        Extend the lease on ``job_id`` while ``run`` executes.
+
+        Once the lease is gone (taken back by the reaper, or not renewed within
+        the visibility timeout) the job may already be running elsewhere, so
+        ``run`` is cancelled instead of being left to write duplicate results.
+        """
+        r = await get_redis()
+        renewed_at = time.monotonic()
+        while True:
+            await asyncio.sleep(max(1.0, VISIBILITY_TIMEOUT / 3))
+            try:
+                held = await r.eval(
+                    _HEARTBEAT_SCRIPT, 1, LEASES_KEY,
+                    job_id, JOB_KEY_PREFIX, self.consumer_id, str(time.time() + VISIBILITY_TIMEOUT),
+                )
+            except Exception as e:
+                logger.warning(f"[JobQueue] Heartbeat failed for {job_id}: {e}")
+                if time.monotonic() - renewed_at < VISIBILITY_TIMEOUT:
+                    continue
+                held = 0
+            if held:
+                renewed_at = time.monotonic()
+                continue
+            logger.error(f"[JobQueue] Lost lease on {job_id}; cancelling it here so it only runs once")
+            lease_lost.set()
+            run.cancel()
+            return
+
+    async def _consume(self, slot: int, delay: float = 0.0) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        while not self._stopping:
+            try:
+                job_id = await self._claim()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[JobQueue] Claim failed: {e}")
+                await asyncio.sleep(self.poll_interval * 5)
+                continue
+            if not job_id:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            try:
+                await self._execute(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Lookup or acknowledgement failed; an unacknowledged lease expires and is re-delivered
+                logger.error(f"[JobQueue] Failed to process {job_id}: {e}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _execute(self, job_id: str) -> None:
+        r = await get_redis()
+        job = await r.hgetall(_job_key(job_id))
+        kind = job.get("kind", "")
+        handler = _HANDLERS.get(kind)
+        if handler is None:
+            logger.error(f"[JobQueue] No handler registered for job {job_id} (kind={kind!r}); dropping it")
+            await self._finish(job_id)
+            return
+
+        attempt = int(job.get("attempts") or 1)
+        organization_id = int(job["organization_id"])
+        payload = json.loads(job.get("payload") or "{}")
+        logger.info(f"[JobQueue] Running {job_id} (attempt {attempt}/{MAX_ATTEMPTS})")
+
+        lease_lost = asyncio.Event()
+        run = asyncio.create_task(handler.run(payload, organization_id, attempt))
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, run, lease_lost))
+        try:
+            await run
+        except asyncio.CancelledError:
+            heartbeat.cancel()
+            if lease_lost.is_set():
+                # The job belongs to whichever consumer claims it next; leave it alone
+                return
+            # Shutting down: hand the job back so another process picks it up right away
+            await asyncio.shield(self._finish(job_id, requeue=True))
+            raise
+        except Exception as e:
+            # Handlers record their own failures; the job is still acknowledged
+            logger.error(f"[JobQueue] Job {job_id} raised: {e}")
+        finally:
+            heartbeat.cancel()
+        await self._finish(job_id)
+
+    async def _reap_loop(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(max(1.0, VISIBILITY_TIMEOUT / 4))
+            try:
+                await self.reap_expired()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[JobQueue] Reaper failed: {e}")
+
+    async def reap_expired(self) -> None:
+        """Re-queue jobs whose lease expired; dead-letter those out of attempts."""
+        r = await get_redis()
+        requeued, dead = await r.eval(
+            _REAP_SCRIPT, 4, LEASES_KEY, RUNNING_KEY, PENDING_KEY, DEAD_KEY,
+            str(time.time()), JOB_KEY_PREFIX, str(MAX_ATTEMPTS), str(DEAD_JOB_TTL), str(DEAD_LIST_MAX),
+        )
+        for job_id in requeued:
+            logger.warning(f"[JobQueue] Lease expired for {job_id}; re-queued")
+        for job_id in dead:
+            logger.error(f"[JobQueue] {job_id} exhausted {MAX_ATTEMPTS} attempts; dead-lettered")
+            job = await r.hgetall(_job_key(job_id))
+            handler = _HANDLERS.get(job.get("kind", ""))
+            if handler is not None and handler.on_dead is not None:
+                try:
+                    await handler.on_dead(json.loads(job.get("payload") or "{}"), int(job["organization_id"]))
+                except Exception as e:
+                    logger.error(f"[JobQueue] Dead-letter handler failed for {job_id}: {e}")
+
+
+_worker: Optional[JobQueueWorker] = None
+
+
+def get_job_queue_worker() -> JobQueueWorker:
+    global _worker
+    if _worker is None:
+        _worker = JobQueueWorker()
+    return _worker
+
+
+async def shutdown_job_queue_worker() -> None:
+    global _worker
+    if _worker is not None:
+        await _worker.stop()
+        _worker = None
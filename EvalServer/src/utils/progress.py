@@ -0,0 +1,172 @@
+"""
+Structured experiment progress events over Redis pub/sub.
+
+The runner publishes JSON snapshots - stage, completed/total, throughput, ETA
+and error count - to ``evalprogress:<org>:<experiment_id>`` and keeps the
+latest one under ``evalprogress:last:<org>:<experiment_id>`` so a dashboard
+that connects mid-run gets the current state immediately. Streaming
+endpoints subscribe to the channel instead of polling Postgres.
+
+Publishing is throttled (EVAL_PROGRESS_INTERVAL seconds) and fire-and-forget:
+Redis being unavailable never affects the experiment.
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+from database.redis import get_redis
+
+CHANNEL_PREFIX = "evalprogress"
+SNAPSHOT_TTL_SECONDS = 24 * 3600
+DEFAULT_PUBLISH_INTERVAL = float(os.getenv("EVAL_PROGRESS_INTERVAL", "1.0"))
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+def progress_channel(organization_id: int, experiment_id: str) -> str:
+    return f"{CHANNEL_PREFIX}:{organization_id}:{experiment_id}"
+
+
+def progress_snapshot_key(organization_id: int, experiment_id: str) -> str:
+    return f"{CHANNEL_PREFIX}:last:{organization_id}:{experiment_id}"
+
+
+class ProgressReporter:
+    """
+    Tracks one experiment's progress and publishes throttled snapshots.
+
+    ``advance`` is synchronous and cheap so it can be called per sample from
+    the event loop (worker threads use ``loop.call_soon_threadsafe``); stage
+    changes and ``finish`` are published immediately.
+    """
+
+    def __init__(
+        self,
+        experiment_id: str,
+        organization_id: int,
+        publish_interval: float = DEFAULT_PUBLISH_INTERVAL,
+    ):
+        self.experiment_id = experiment_id
+        self.organization_id = organization_id
+        self.publish_interval = publish_interval
+        self.stage = "pending"
+        self.status = "running"
+        self.completed = 0
+        self.total = 0
+        self.errors = 0
+        self.message: Optional[str] = None
+        self._stage_started = time.monotonic()
+        self._last_publish = 0.0
+        self._pending: set = set()
+
+    def snapshot(self) -> Dict[str, Any]:
+        elapsed = max(time.monotonic() - self._stage_started, 1e-6)
+        throughput = self.completed / elapsed if self.completed else 0.0
+        remaining = max(self.total - self.completed, 0)
+        eta = remaining / throughput if throughput > 0 else None
+        return {
+            "experiment_id": self.experiment_id,
+            "status": self.status,
+            "stage": self.stage,
+            "completed": self.completed,
+            "total": self.total,
+            "errors": self.errors,
+            "throughput_per_sec": round(throughput, 3),
+            "eta_seconds": round(eta, 1) if eta is not None else None,
+            "message": self.message,
+            "timestamp": time.time(),
+        }
+
+    async def _publish(self, event: Dict[str, Any]) -> None:
+        try:
+            r = await get_redis()
+            payload = json.dumps(event)
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.set(
+                    progress_snapshot_key(self.organization_id, self.experiment_id),
+                    payload,
+                    ex=SNAPSHOT_TTL_SECONDS,
+                )
+                pipe.publish(progress_channel(self.organization_id, self.experiment_id), payload)
+                await pipe.execute()
+        except Exception:
+            pass
+
+    def _schedule_publish(self) -> None:
+        self._last_publish = time.monotonic()
+        task = asyncio.get_running_loop().create_task(self._publish(self.snapshot()))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def start_stage(self, stage: str, total: int = 0, message: Optional[str] = None) -> None:
+        self.stage = stage
+        self.total = max(int(total or 0), 0)
+        self.completed = 0
+        self.message = message
+        self._stage_started = time.monotonic()
+        self._schedule_publish()
+
+    def advance(self, count: int = 1, errors: int = 0) -> None:
+        self.completed += count
+        self.errors += errors
+        if (
+            self.completed >= self.total
+            or time.monotonic() - self._last_publish >= self.publish_interval
+        ):
+            self._schedule_publish()
+
+    async def finish(self, status: str, message: Optional[str] = None) -> None:
+        """Publish the terminal event (once) and wait for in-flight publishes."""
+        if self.status in TERMINAL_STATUSES:
+            return
+        self.status = status
+        self.stage = status
+        self.message = message
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        await self._publish(self.snapshot())
+
+
+async def get_progress_snapshot(organization_id: int, experiment_id: str) -> Optional[Dict[str, Any]]:
+    r = await get_redis()
+    raw = await r.get(progress_snapshot_key(organization_id, experiment_id))
+    return json.loads(raw) if raw else None
+
+
+async def stream_progress(
+    organization_id: int,
+    experiment_id: str,
+    keepalive_seconds: float = 15.0,
+) -> AsyncIterator[Optional[Dict[str, Any]]]:
+    """
+    Yield progress events for one experiment, starting with the latest snapshot.
+
+    Yields ``None`` every ``keepalive_seconds`` without events so callers can
+    emit keep-alives and notice disconnected clients. Stops after a terminal
+    event.
+    """
+    r = await get_redis()
+    pubsub = r.pubsub()
+    await pubsub.subscribe(progress_channel(organization_id, experiment_id))
+    try:
+        # Subscribe first, then read the snapshot, so no event falls in between
+        snapshot = await get_progress_snapshot(organization_id, experiment_id)
+        if snapshot is not None:
+            yield snapshot
+            if snapshot.get("status") in TERMINAL_STATUSES:
+                return
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=keepalive_seconds)
+            if message is None:
+                yield None
+                continue
+            event = json.loads(message["data"])
+            yield event
+            if event.get("status") in TERMINAL_STATUSES:
+                return
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
@@ -0,0 +1,30 @@
+"""
+Server-side access to the shared adaptive LLM rate limiter.
+
+The limiter lives in the EvaluationModule (deepeval_engine.rate_limiter) so
+generation, DeepEval judges, custom scorers and the arena all draw from the
+same per-provider, per-key buckets within a process. This module makes it
+importable from API-process code that does not otherwise touch the
+EvaluationModule.
+"""
+
+import sys
+from pathlib import Path
+
+_eval_module_path = str(Path(__file__).parent.parent.parent.parent / "EvaluationModule" / "src")
+if _eval_module_path not in sys.path:
+    sys.path.insert(0, _eval_module_path)
+
+from deepeval_engine.rate_limiter import (  # noqa: E402
+    AdaptiveRateLimiter,
+    acall_with_rate_limit,
+    get_rate_limiter,
+    is_rate_limit_error,
+)
+
+__all__ = [
+    "AdaptiveRateLimiter",
+    "acall_with_rate_limit",
+    "get_rate_limiter",
+    "is_rate_limit_error",
+]
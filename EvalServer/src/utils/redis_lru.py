@@ -0,0 +1,53 @@
+"""
+Redis TTL + LRU store shared by the server-side caches (model generations,
+judge verdicts).
+
+Each entry is a JSON document under ``{prefix}:{member}`` that expires after
+``ttl_seconds``. A sorted set at ``{prefix}:lru`` scored by last access keeps
+the store under ``max_entries`` by evicting the least recently used members.
+
+The store uses the shared async client from database.redis and lets Redis
+errors propagate; the caches built on it count them and treat them as misses.
+"""
+
+import json
+import time
+from typing import Any, Dict, Optional
+
+from database.redis import get_redis
+
+
+class RedisLRUStore:
+    """JSON documents in Redis with a TTL and a least-recently-used size cap."""
+
+    def __init__(self, prefix: str, ttl_seconds: int, max_entries: int):
+        self.prefix = prefix
+        self.index_key = f"{prefix}:lru"
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    def _key(self, member: str) -> str:
+        return f"{self.prefix}:{member}"
+
+    async def get(self, member: str) -> Optional[Dict[str, Any]]:
+        """The document stored for ``member`` (marking it recently used), or None."""
+        r = await get_redis()
+        raw = await r.get(self._key(member))
+        if raw is None:
+            return None
+        await r.zadd(self.index_key, {member: time.time()})
+        return json.loads(raw)
+
+    async def set(self, member: str, document: Dict[str, Any]) -> None:
+        """Store ``document`` for ``member`` and evict the least recently used members over the cap."""
+        r = await get_redis()
+        now = time.time()
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(member), json.dumps({**document, "created_at": now}, default=str), ex=self.ttl_seconds)
+            pipe.zadd(self.index_key, {member: now})
+            pipe.zcard(self.index_key)
+            _, _, size = await pipe.execute()
+        if size > self.max_entries:
+            evicted = await r.zpopmin(self.index_key, size - self.max_entries)
+            if evicted:
+                await r.delete(*[self._key(m) for m, _ in evicted])
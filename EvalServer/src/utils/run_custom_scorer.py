@@ -10,9 +10,13 @@ Supports multiple providers: OpenAI, Anthropic, Mistral, xAI, Google (Gemini), e
 import re
 import os
 import json
+import asyncio
+import hashlib
 from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+from utils.rate_limiter import acall_with_rate_limit, get_rate_limiter
+
 # OpenAI client (used for OpenAI-compatible APIs)
 try:
     from openai import OpenAI
@@ -232,6 +236,38 @@ def extract_label(raw_text: str, choice_scores: Optional[List[Dict[str, Any]]] =
     return label or "UNKNOWN"
 
 
+def make_scorer_cache_key(
+    provider: str,
+    endpoint_url: Optional[str],
+    model_name: str,
+    temperature: Any,
+    max_tokens: Any,
+    rendered_messages: List[Dict[str, str]],
+    choice_scores: List[Dict[str, Any]],
+) -> str:
+    """
+    Verdict cache key for a scorer call: judge model and decoding settings,
+    the fully rendered messages (template + input/output/expected) and the
+    label-to-score mapping.
+    """
+    material = json.dumps(
+        {
+            "kind": "custom_scorer",
+            "provider": provider,
+            "endpoint": endpoint_url,
+            "model": model_name,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "messages": rendered_messages,
+            "choice_scores": choice_scores,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
 def label_to_score(label: str, choice_scores: List[Dict[str, Any]]) -> float:
     """
     Map a label (e.g. "PASS") to its numeric score from the config.
@@ -249,6 +285,7 @@ async def run_custom_scorer(
     output_text: str,
     expected_text: str = "",
     metadata: Optional[Dict[str, Any]] = None,
+    verdict_cache: Optional[Any] = None,
 ) -> ScorerResult:
     """
     Execute a custom LLM judge scorer.
@@ -264,6 +301,8 @@ async def run_custom_scorer(
         output_text: The model's actual output to evaluate
         expected_text: Optional expected/reference output
         metadata: Optional additional context
+        verdict_cache: Optional verdict cache (utils.verdict_cache.RedisVerdictCache);
+            a cached verdict for the same rendered request skips the judge call
         
     Returns:
         ScorerResult with label, score, and pass/fail status
@@ -322,6 +361,24 @@ async def run_custom_scorer(
     }
     
     rendered_messages = render_messages(messages_templates, values)
+
+    cache_key = None
+    if verdict_cache is not None:
+        cache_key = make_scorer_cache_key(
+            provider, endpoint_url, model_name, temperature, max_tokens, rendered_messages, choice_scores
+        )
+        cached = await verdict_cache.aget(cache_key)
+        if cached is not None:
+            score = float(cached["score"])
+            return ScorerResult(
+                scorer_id=scorer_id,
+                scorer_name=scorer_name,
+                label=cached["label"],
+                score=score,
+                raw_response=cached.get("raw_response", ""),
+                passed=score >= threshold if threshold is not None else True,
+                reason=cached.get("reason"),
+            )
     
     # Get the appropriate client for this provider
     try:
@@ -337,13 +394,24 @@ async def run_custom_scorer(
             passed=False,
         )
     
+    # Judge calls share the provider's rate limiter with generation and other scorers
+    limiter = get_rate_limiter(
+        f"self-hosted:{endpoint_url}" if provider == "self-hosted" else provider,
+        api_key=api_key,
+    )
+
     try:
-        response = client.chat.completions.create(
-            model=model_name,
-            messages=rendered_messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
+        raw = await acall_with_rate_limit(
+            limiter,
+            lambda: asyncio.to_thread(
+                client.chat.completions.with_raw_response.create,
+                model=model_name,
+                messages=rendered_messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            ),
         )
+        response = raw.parse()
         
         raw_response = response.choices[0].message.content.strip()
         usage = response.usage
@@ -351,12 +419,12 @@ async def run_custom_scorer(
         # Try to parse a JSON response of the form {"verdict": "PASS", "reason": "..."}
         extracted_reason: Optional[str] = None
         json_label: Optional[str] = None
+        known_labels = {c.get("label", "").upper() for c in choice_scores}
         try:
             json_text = re.sub(r"^```(?:json)?\s*", "", raw_response, flags=re.IGNORECASE)
             json_text = re.sub(r"```\s*$", "", json_text).strip()
             parsed = json.loads(json_text)
             verdict = str(parsed.get("verdict") or parsed.get("label") or "").strip().upper()
-            known_labels = {c.get("label", "").upper() for c in choice_scores}
             if verdict in known_labels:
                 json_label = verdict
             extracted_reason = str(parsed.get("reason", "")).strip() or None
@@ -368,6 +436,16 @@ async def run_custom_scorer(
         score = label_to_score(label, choice_scores)
         passed = score >= threshold if threshold is not None else True
 
+        # Unparseable replies (UNKNOWN or a label outside choice_scores) score 0.0 but are
+        # not verdicts: caching them would pin the failure for the cache TTL
+        if cache_key is not None and label.upper() in known_labels:
+            await verdict_cache.aset(cache_key, {
+                "label": label,
+                "score": score,
+                "raw_response": raw_response,
+                "reason": extracted_reason,
+            })
+
         return ScorerResult(
             scorer_id=scorer_id,
             scorer_name=scorer_name,
@@ -399,6 +477,7 @@ async def run_custom_scorers_batch(
     output_text: str,
     expected_text: str = "",
     metadata: Optional[Dict[str, Any]] = None,
+    verdict_cache: Optional[Any] = None,
 ) -> List[ScorerResult]:
     """
     Run multiple custom scorers on a single input/output pair.
@@ -409,6 +488,7 @@ async def run_custom_scorers_batch(
         output_text: The model's actual output to evaluate
         expected_text: Optional expected/reference output
         metadata: Optional additional context
+        verdict_cache: Optional verdict cache shared by all scorers
         
     Returns:
         List of ScorerResult for each scorer
@@ -421,6 +501,7 @@ async def run_custom_scorers_batch(
             output_text=output_text,
             expected_text=expected_text,
             metadata=metadata,
+            verdict_cache=verdict_cache,
         )
         results.append(result)
     return results
@@ -6,12 +6,14 @@ import os
 import sys
 import re
 import asyncio
-import json
+import math
+import random
+import threading
 import traceback
-import subprocess
+from contextlib import aclosing
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Regex pattern for valid model names (alphanumeric, dash, underscore, colon, slash, dot)
@@ -23,10 +25,31 @@ evaluation_module_path = Path(__file__).parent.parent.parent.parent / "Evaluatio
 sys.path.insert(0, str((evaluation_module_path / "src").resolve()))
 
 from crud import evaluation_logs as crud
+from database.db import get_db
 from crud.deepeval_scorers import list_scorers
-from deepeval_engine.gatekeeper import evaluate_gate
+from deepeval_engine.gatekeeper import evaluate_gate, load_gate_thresholds
+from deepeval_engine.early_stopping import SequentialGateMonitor
+from deepeval_engine.sampling import (
+    DEFAULT_STRATA_FIELDS,
+    StratifiedEstimator,
+    StratifiedSample,
+    draw_stratified_sample,
+    stratum_label,
+)
+from deepeval_engine.aggregates import AggregateTracker
+from deepeval_engine.model_registry import get_model_registry
+from deepeval_engine.ollama_support import ensure_model, list_local_models, normalize_model_name, ollama_num_parallel
 from utils.run_custom_scorer import run_custom_scorer, ScorerResult
 from utils.error_detection import FatalErrorTracker, detect_fatal_error
+from utils.generation_pool import OrderedWorkerPool, resolve_concurrency
+from utils.scenario_generation import generate_scenario, split_scenario_turns
+from utils.dataset_stream import StreamingDataset
+from utils.generation_cache import GenerationCache
+from utils.verdict_cache import RedisVerdictCache
+from utils.progress import ProgressReporter
+
+# Seconds between writes of in-progress aggregates to llm_evals_experiments.results
+PARTIAL_RESULTS_INTERVAL = float(os.getenv("EVAL_PARTIAL_RESULTS_INTERVAL", "10"))
 
 
 async def run_evaluation(
@@ -57,6 +80,20 @@ async def run_evaluation(
     print(f"📦 sys.path[0]: {sys.path[0]}")
     print(f"📦 EvaluationModule path added: {str((evaluation_module_path / 'src').resolve())}")
     print()
+
+    # Per-sample logs/metrics are written behind in multi-row batches; flushed at
+    # stage boundaries and on every failure path below.
+    log_buffer = crud.LogWriteBuffer(
+        db=db,
+        organization_id=organization_id,
+        project_id=config.get("project_id"),
+        experiment_id=experiment_id,
+        batch_size=config.get("logBatchSize"),
+    )
+    # Live progress for dashboards (Redis pub/sub, see utils/progress.py)
+    progress = ProgressReporter(experiment_id=experiment_id, organization_id=organization_id)
+    progress.start_stage("initializing")
+    partial_results_task: Optional[asyncio.Task] = None
     
     try:
         # Helper: ensure Ollama model is locally available
@@ -70,15 +107,13 @@ async def run_evaluation(
                 return
 
             try:
-                # Check if model exists locally
-                list_proc = subprocess.run(["ollama", "list"], capture_output=True, text=True, timeout=30)
-                if list_proc.returncode == 0 and model_name in list_proc.stdout:
+                # Inventory comes from the server's HTTP API (cached tag list); pull only when missing
+                if normalize_model_name(model_name) in list_local_models():
                     print(f"✓ Ollama model '{model_name}' is available locally")
                     return
-                print(f"• Ollama model '{model_name}' not found locally; pulling...")
-                pull_proc = subprocess.run(["ollama", "pull", model_name], text=True, timeout=600)
-                if pull_proc.returncode == 0:
-                    print(f"✓ Pulled Ollama model '{model_name}' successfully")
+                print(f"• Ollama model '{model_name}' not in cached inventory; checking/pulling...")
+                if ensure_model(model_name):
+                    print(f"✓ Ollama model '{model_name}' is available")
                 else:
                     print(f"⚠️  Unable to pull Ollama model '{model_name}'. You may need to run 'ollama pull {model_name}' manually.")
             except Exception as _e:
@@ -251,6 +286,7 @@ async def run_evaluation(
             model_runner = ModelRunner(
                 model_name=model_name,
                 provider=runner_provider,
+                batch_size=config.get("generationBatchSize"),
             )
         except Exception as e:
             error_msg = f"Failed to initialize model: {str(e)}"
@@ -266,7 +302,47 @@ async def run_evaluation(
         
         # If using Ollama, proactively ensure the model exists locally before generation
         if runner_provider == "ollama" and isinstance(model_name, str):
-            ensure_ollama_model(model_name)
+            await asyncio.to_thread(ensure_ollama_model, model_name)
+
+        # Sampling temperature for the model under test (0 makes generations cacheable)
+        generation_temperature = float(model_config.get("temperature", 0.7))
+
+        # Content-addressed generation cache: automatic for temperature 0,
+        # forced on/off with config "generationCache": true/false
+        generation_cache = GenerationCache(
+            namespace=str(organization_id),
+            provider=runner_provider,
+            model=model_name,
+            endpoint=model_config.get("endpointUrl"),
+            mode=config.get("generationCache"),
+        )
+        event_loop = asyncio.get_running_loop()
+
+        def generate_text(prompt: str, max_tokens: int, temperature: float) -> str:
+            """model_runner.generate behind the generation cache (called from worker threads)."""
+            if not generation_cache.enabled_for(temperature):
+                return model_runner.generate(prompt=prompt, max_tokens=max_tokens, temperature=temperature)
+            cache_key = generation_cache.make_key(prompt, temperature, max_tokens)
+            cached = generation_cache.get_threadsafe(event_loop, cache_key)
+            if cached is not None:
+                return cached
+            response = model_runner.generate(prompt=prompt, max_tokens=max_tokens, temperature=temperature)
+            if response and str(response).strip():
+                generation_cache.set_threadsafe(event_loop, cache_key, response)
+            return response
+
+        async def agenerate_text(prompt: str, max_tokens: int, temperature: float) -> str:
+            """model_runner.agenerate behind the generation cache (native async, on the event loop)."""
+            if not generation_cache.enabled_for(temperature):
+                return await model_runner.agenerate(prompt=prompt, max_tokens=max_tokens, temperature=temperature)
+            cache_key = generation_cache.make_key(prompt, temperature, max_tokens)
+            cached = await generation_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            response = await model_runner.agenerate(prompt=prompt, max_tokens=max_tokens, temperature=temperature)
+            if response and str(response).strip():
+                await generation_cache.set(cache_key, response)
+            return response
         
         # 2. Load Dataset (builtin by name, custom path, prompts, conversations, or benchmarks)
         print(f"\n📊 Loading dataset...")
@@ -296,13 +372,12 @@ async def run_evaluation(
             preset_path = preset_map.get(name)
             if preset_path and preset_path.is_file():
                 print(f"📦 Using built-in dataset: {name} -> {preset_path}")
-                with open(preset_path, "r", encoding="utf-8") as f:
-                    loaded = json.load(f)
-                    # Accept either prompts (single-turn) or conversational scenarios
-                    if isinstance(loaded, list) and loaded and isinstance(loaded[0], dict) and "turns" in loaded[0]:
-                        conversations = loaded
-                    else:
-                        prompts = loaded
+                # Accept either prompts (single-turn) or conversational scenarios
+                dataset = StreamingDataset(preset_path)
+                if dataset.is_conversational():
+                    conversations = list(dataset)
+                else:
+                    prompts = dataset
             elif name in preset_map:
                 error_msg = f"Built-in dataset file not found: {preset_map.get(name)}"
                 print(f"❌ {error_msg}")
@@ -331,12 +406,14 @@ async def run_evaluation(
                     error_message=error_msg
                 )
                 return {"error": error_msg}
-            with open(custom_path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-                if isinstance(loaded, list) and loaded and isinstance(loaded[0], dict) and "turns" in loaded[0]:
-                    conversations = loaded
-                else:
-                    prompts = loaded
+            # Single-turn prompts are streamed from disk into the generation
+            # pool; conversations are small and iterated several times, so
+            # they are materialised
+            dataset = StreamingDataset(custom_path)
+            if dataset.is_conversational():
+                conversations = list(dataset)
+            else:
+                prompts = dataset
             print(f"✓ Loaded dataset from {custom_path}")
         if not prompts and not conversations:
             error_msg = "No prompts or conversations in dataset"
@@ -349,9 +426,60 @@ async def run_evaluation(
                 error_message=error_msg
             )
             return {"error": error_msg}
+
+        # 2.1 Optional stratified sampling: generate and judge only a proportional
+        # sample per stratum; estimates with CIs are reported in the results
+        sampling_config = config.get("sampling") or {}
+        sample_plan: Optional[StratifiedSample] = None
+        if sampling_config.get("sampleSize") or sampling_config.get("sampleFraction"):
+            population = prompts or conversations
+            if sampling_config.get("sampleSize"):
+                sample_size = int(sampling_config["sampleSize"])
+            else:
+                sample_size = math.ceil(float(sampling_config["sampleFraction"]) * len(population))
+            if 0 < sample_size < len(population):
+                sample_plan = draw_stratified_sample(
+                    population,
+                    sample_size,
+                    fields=sampling_config.get("strata") or DEFAULT_STRATA_FIELDS,
+                    # Default seed is per experiment so a resumed run draws the same sample
+                    seed=sampling_config.get("seed", experiment_id),
+                )
+                if prompts:
+                    prompts = sample_plan.items
+                else:
+                    conversations = sample_plan.items
+                print(f"🎯 Stratified sample: {len(sample_plan.items)}/{len(population)} items across {len(sample_plan.populations)} strata")
+
+        def stratum_of(item: Dict[str, Any]) -> Optional[str]:
+            return stratum_label(item, sample_plan.fields) if sample_plan is not None else None
         
         test_cases_data = []
 
+        # Resume mode: samples that already have a successful log for this experiment
+        # (e.g. from a run interrupted by a crash) are rebuilt from the stored rows
+        # instead of being generated again. Matching is by logged input text.
+        resumed_logs: Dict[str, list] = {}
+        if config.get("resume"):
+            completed_logs = await crud.get_completed_experiment_logs(
+                db=db,
+                organization_id=organization_id,
+                experiment_id=experiment_id,
+            )
+            for row in completed_logs:
+                resumed_logs.setdefault(row["input_text"] or "", []).append(row)
+            cleared = await crud.delete_experiment_logs(
+                db=db,
+                organization_id=organization_id,
+                experiment_id=experiment_id,
+                status="error",
+            )
+            print(f"🔁 Resume mode: reusing {len(completed_logs)} completed samples, cleared {cleared} error logs")
+
+        def take_resumed_log(input_text: Optional[str]) -> Optional[Dict[str, Any]]:
+            rows = resumed_logs.get(input_text or "")
+            return rows.pop(0) if rows else None
+
         # Check if this is a simulated conversation mode
         simulated_mode = dataset_config.get("simulatedMode", False)
         simulated_scenarios = dataset_config.get("scenarios", [])
@@ -374,6 +502,7 @@ async def run_evaluation(
                 return {"error": error_msg}
             # 3A-SIM. Simulated conversation mode: use ConversationSimulator
             print(f"\n🎭 SIMULATED MODE: Generating conversations for {len(simulated_scenarios)} scenarios...")
+            progress.start_stage("generating", total=len(simulated_scenarios))
             
             # Create model callback for the simulator
             async def model_callback(input_text: str, turns_history: list, thread_id: str = "") -> Turn:
@@ -421,6 +550,7 @@ async def run_evaluation(
                     }
                 })
             
+            progress.advance(len(simulated_test_cases))
             print(f"✓ Generated {len(test_cases_data)} simulated conversations")
             
         elif conversations:
@@ -429,89 +559,95 @@ async def run_evaluation(
             print(f"\n🗣️ Detected conversational dataset with {len(conversations)} scenarios.")
             print(f"   🔄 MODEL WILL GENERATE RESPONSES for each conversation turn...\n")
 
+            # Scenarios run on a bounded worker pool (turns within a scenario stay
+            # sequential); outcomes are replayed in scenario order below.
+            scenario_concurrency = resolve_concurrency(config.get("scenarioConcurrency"))
+            if runner_provider == "huggingface":
+                scenario_concurrency = 1
+            print(f"   Scenario concurrency: {scenario_concurrency}")
+
             # Initialize fatal error tracker for early termination
             fatal_error_tracker = FatalErrorTracker(threshold=2)
+            # Set once the experiment is terminating so running scenarios stop early
+            stop_generation = threading.Event()
+
+            def attach_resumed_scenarios(items):
+                # Runs in dataset order, so duplicate scenarios map onto stored logs in order
+                for s_idx, convo in enumerate(items, 1):
+                    user_turns_content, _ = split_scenario_turns(convo)
+                    scenario = convo.get("scenario") or f"scenario_{s_idx}"
+                    combined_input = "\n".join([f"User: {msg}" for msg in user_turns_content])
+                    resumed = take_resumed_log(combined_input or scenario) if resumed_logs else None
+                    yield convo, resumed
+
+            async def scenario_worker(entry) -> Optional[Dict[str, Any]]:
+                convo, resumed = entry
+                user_turns_content, expected_assistant_turns = split_scenario_turns(convo)
 
-            for s_idx, convo in enumerate(conversations, 1):
-                scenario = convo.get("scenario") or f"scenario_{s_idx}"
-                expected_outcome = convo.get("expected_outcome", "")
-                raw_turns = convo.get("turns") or []
-                
-                print(f"  [{s_idx}/{len(conversations)}] Scenario: {scenario[:50]}...")
-                
-                # Extract user turns from the dataset
-                user_turns_content = []
-                expected_assistant_turns = []  # Keep expected responses for reference
-                for t in raw_turns:
-                    role = (t.get("role") or "").lower()
-                    content = t.get("content") or ""
-                    if role == "user":
-                        user_turns_content.append(content)
-                    elif role == "assistant":
-                        expected_assistant_turns.append(content)
-                
                 if not user_turns_content:
-                    print(f"    ⚠️ No user turns found, skipping...")
-                    continue
-                
-                # Build Turn objects by GENERATING assistant responses
-                turn_objects = []
-                generated_assistant_turns = []
-                conversation_history = []  # Track conversation for context
-                
-                start_time = datetime.now()
-                total_tokens = 0
-                
-                for turn_idx, user_msg in enumerate(user_turns_content):
-                    # Add user turn
-                    turn_objects.append(Turn(role="user", content=user_msg))
-                    conversation_history.append({"role": "user", "content": user_msg})
-                    
-                    # Build prompt with conversation context
-                    if len(conversation_history) == 1:
-                        # First turn - just the user message
-                        prompt = f"You are a helpful assistant. Respond to the user.\n\nUser: {user_msg}\n\nAssistant:"
-                    else:
-                        # Build multi-turn prompt with history
-                        history_str = ""
-                        for h in conversation_history[:-1]:  # Exclude current turn
-                            role_label = "User" if h["role"] == "user" else "Assistant"
-                            history_str += f"{role_label}: {h['content']}\n"
-                        prompt = f"You are a helpful assistant. Continue this conversation.\n\n{history_str}User: {user_msg}\n\nAssistant:"
-                    
-                    # GENERATE assistant response using the model
-                    try:
-                        assistant_response = model_runner.generate(
-                            prompt=prompt,
-                            max_tokens=1024,
-                            temperature=0.7,
-                        )
-                        
-                        # Clean up response if needed
-                        if assistant_response:
-                            assistant_response = assistant_response.strip()
-                            # Remove common prefixes if model echoes them
-                            if assistant_response.lower().startswith("assistant:"):
-                                assistant_response = assistant_response[10:].strip()
-                        
-                        if not assistant_response:
-                            assistant_response = "[Model returned empty response]"
+                    return None
 
-                        # Track success to reset fatal error counter
-                        fatal_error_tracker.track_success()
+                if resumed is not None:
+                    # Rebuild the conversation from the stored log instead of regenerating it
+                    stored_turns = resumed["metadata"].get("turns") or []
+                    return {
+                        "turn_objects": [Turn(role=t["role"], content=t["content"]) for t in stored_turns],
+                        "generated_assistant_turns": [t["content"] for t in stored_turns if t.get("role") == "assistant"],
+                        "turn_errors": [],
+                        "latency_ms": resumed["latency_ms"] or 0,
+                        "total_tokens": resumed["token_count"] or 0,
+                        "user_turns_content": user_turns_content,
+                        "expected_assistant_turns": expected_assistant_turns,
+                        "resumed_log_id": resumed["id"],
+                    }
+
+                generated = await asyncio.to_thread(
+                    generate_scenario, user_turns_content, generate_text, generation_temperature, stop_generation
+                )
+                generated["user_turns_content"] = user_turns_content
+                generated["expected_assistant_turns"] = expected_assistant_turns
+                return generated
+
+            progress.start_stage("generating", total=len(conversations))
+            async with OrderedWorkerPool(scenario_worker, concurrency=scenario_concurrency) as pool:
+                async for i, (convo, _), generated in pool.results(attach_resumed_scenarios(conversations)):
+                    s_idx = i + 1
+                    scenario = convo.get("scenario") or f"scenario_{s_idx}"
+                    expected_outcome = convo.get("expected_outcome", "")
+
+                    print(f"  [{s_idx}/{len(conversations)}] Scenario: {scenario[:50]}...")
+                    progress.advance(errors=sum(1 for err in generated["turn_errors"] if err) if generated else 0)
+
+                    if generated is None:
+                        print(f"    ⚠️ No user turns found, skipping...")
+                        continue
+
+                    user_turns_content = generated["user_turns_content"]
+                    expected_assistant_turns = generated["expected_assistant_turns"]
+                    turn_objects = generated["turn_objects"]
+                    generated_assistant_turns = generated["generated_assistant_turns"]
+                    total_tokens = generated["total_tokens"]
+                    latency_ms = generated["latency_ms"]
 
-                    except Exception as gen_err:
-                        print(f"    ⚠️ Generation error on turn {turn_idx + 1}: {gen_err}")
-                        assistant_response = f"[Generation error: {str(gen_err)[:100]}]"
+                    # Replay per-turn outcomes in order for fatal error tracking
+                    for turn_idx, turn_error in enumerate(generated["turn_errors"]):
+                        if turn_error is None:
+                            # Track success to reset fatal error counter
+                            fatal_error_tracker.track_success()
+                            continue
+
+                        print(f"    ⚠️ Generation error on turn {turn_idx + 1}: {turn_error}")
 
                         # Check if this is a fatal error that should stop the experiment
-                        should_stop = fatal_error_tracker.track_error(str(gen_err))
+                        should_stop = fatal_error_tracker.track_error(turn_error)
                         if should_stop:
+                            stop_generation.set()
                             termination_reason = fatal_error_tracker.get_termination_reason()
                             print(f"\n🛑 FATAL ERROR DETECTED: {termination_reason}")
                             print(f"   Stopping experiment early to avoid wasting time on unrecoverable errors.\n")
 
-                            # Update experiment status to failed
+                            # Persist what was generated so far, then mark the experiment failed
+                            await log_buffer.flush()
                             await crud.update_experiment_status(
                                 db=db,
                                 experiment_id=experiment_id,
@@ -521,212 +657,342 @@ async def run_evaluation(
                             )
                             return {"error": termination_reason, "early_termination": True}
 
-                    # Add generated assistant turn
-                    turn_objects.append(Turn(role="assistant", content=assistant_response))
-                    conversation_history.append({"role": "assistant", "content": assistant_response})
-                    generated_assistant_turns.append(assistant_response)
+                    if generated.get("resumed_log_id"):
+                        print(f"    ↺ Reused {len(generated_assistant_turns)} stored responses")
+                    else:
+                        print(f"    ✓ Generated {len(generated_assistant_turns)} responses ({latency_ms}ms)")
                     
-                    # Estimate tokens for this turn
-                    total_tokens += len(user_msg.split()) + len(assistant_response.split())
-                
-                latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-                
-                print(f"    ✓ Generated {len(generated_assistant_turns)} responses ({latency_ms}ms)")
-                
-                if not turn_objects:
-                    continue
-                
-                # Create ConversationalTestCase with MODEL-GENERATED responses
-                conv_test_case = ConversationalTestCase(
-                    turns=turn_objects,
-                )
-                
-                # Build raw_turns for storage (with generated responses)
-                generated_raw_turns = []
-                for i, user_msg in enumerate(user_turns_content):
-                    generated_raw_turns.append({"role": "user", "content": user_msg})
-                    if i < len(generated_assistant_turns):
-                        generated_raw_turns.append({"role": "assistant", "content": generated_assistant_turns[i]})
-                
-                # Store as conversational test case
-                test_cases_data.append({
-                    "test_case": conv_test_case,
-                    "is_conversational": True,
-                    "scenario": scenario,
-                    "expected_outcome": expected_outcome,
-                    "metadata": {
-                        "sample_id": f"{scenario}",
-                        "protected_attributes": {"category": scenario, "difficulty": "conversation"},
-                        "turn_count": len(turn_objects),
-                    }
-                })
-                
-                # Create a log entry for this conversation
-                combined_input = "\n".join([f"User: {msg}" for msg in user_turns_content])
-                combined_output = "\n".join([f"Assistant: {msg}" for msg in generated_assistant_turns])
-                
-                created_log = await crud.create_log(
-                    db=db,
-                    project_id=config.get("project_id"),
-                    organization_id=organization_id,
-                    experiment_id=experiment_id,
-                    input_text=combined_input or scenario,
-                    output_text=combined_output,
-                    model_name=model_name,
-                    latency_ms=latency_ms,
-                    token_count=total_tokens,
-                    metadata={
+                    if not turn_objects:
+                        continue
+                    
+                    # Create ConversationalTestCase with MODEL-GENERATED responses
+                    conv_test_case = ConversationalTestCase(
+                        turns=turn_objects,
+                    )
+                    
+                    # Build raw_turns for storage (with generated responses)
+                    generated_raw_turns = []
+                    for t_i, user_msg in enumerate(user_turns_content):
+                        generated_raw_turns.append({"role": "user", "content": user_msg})
+                        if t_i < len(generated_assistant_turns):
+                            generated_raw_turns.append({"role": "assistant", "content": generated_assistant_turns[t_i]})
+                    
+                    # Store as conversational test case
+                    test_cases_data.append({
+                        "test_case": conv_test_case,
                         "is_conversational": True,
                         "scenario": scenario,
                         "expected_outcome": expected_outcome,
-                        "turn_count": len(turn_objects),
-                        "turns": generated_raw_turns,  # Store conversation with GENERATED responses
-                        "expected_assistant_turns": expected_assistant_turns,  # Keep expected for reference
-                    },
-                )
-                
-                # Store log_id in test case metadata for later metric_scores update
-                if created_log:
-                    test_cases_data[-1]["metadata"]["log_id"] = created_log.get("id")
+                        "metadata": {
+                            "sample_id": f"{scenario}",
+                            "protected_attributes": {"category": scenario, "difficulty": "conversation"},
+                            "turn_count": len(turn_objects),
+                            "stratum": stratum_of(convo),
+                        }
+                    })
+                    
+                    if generated.get("resumed_log_id"):
+                        # Already logged by the interrupted run
+                        test_cases_data[-1]["metadata"]["log_id"] = generated["resumed_log_id"]
+                        continue
+
+                    # Create a log entry for this conversation
+                    combined_input = "\n".join([f"User: {msg}" for msg in user_turns_content])
+                    combined_output = "\n".join([f"Assistant: {msg}" for msg in generated_assistant_turns])
+                    
+                    log_id = await log_buffer.add_log(
+                        input_text=combined_input or scenario,
+                        output_text=combined_output,
+                        model_name=model_name,
+                        latency_ms=latency_ms,
+                        token_count=total_tokens,
+                        metadata={
+                            "is_conversational": True,
+                            "scenario": scenario,
+                            "expected_outcome": expected_outcome,
+                            "turn_count": len(turn_objects),
+                            "turns": generated_raw_turns,  # Store conversation with GENERATED responses
+                            "expected_assistant_turns": expected_assistant_turns,  # Keep expected for reference
+                        },
+                    )
+                    
+                    # Store log_id in test case metadata for later metric_scores update
+                    test_cases_data[-1]["metadata"]["log_id"] = log_id
             
             print(f"\n✓ Built {len(test_cases_data)} ConversationalTestCases with MODEL-GENERATED responses.")
         else:
             # 3B. Single-turn path (existing)
-            print(f"\n🤖 Generating {len(prompts)} responses...\n")
+            # Model calls run on a bounded worker pool; results are consumed in
+            # prompt order so logging and fatal-error tracking stay sequential.
+            generation_concurrency = resolve_concurrency(config.get("generationConcurrency"))
+            if runner_provider == "ollama" and config.get("generationConcurrency") is None:
+                # Fill the server's parallel slots (ModelRunner caps requests at the same number)
+                generation_concurrency = ollama_num_parallel()
+            if runner_provider == "huggingface":
+                # A single local model instance cannot serve parallel calls; instead
+                # enough prompts are kept in flight for ModelRunner to gather them
+                # into length-bucketed batches
+                from deepeval_engine.model_runner import HF_BUCKET_WINDOW
+                generation_concurrency = model_runner.batch_size * HF_BUCKET_WINDOW
+            prompt_total = len(prompts)
+            print(f"\n🤖 Generating {prompt_total} responses (concurrency={generation_concurrency})...\n")
 
             # Initialize fatal error tracker for early termination
             fatal_error_tracker = FatalErrorTracker(threshold=2)
 
-            for idx, prompt_data in enumerate(prompts, 1):
-                start_time = datetime.now()  # Set before try block so it's always defined
-                try:
-                    print(f"  [{idx}/{len(prompts)}] Processing: {prompt_data['prompt'][:50]}...")
-                    
-                    # Generate response (first attempt)
-                    response = model_runner.generate(
-                        prompt=prompt_data["prompt"],
-                        max_tokens=2048,
-                        temperature=0.7,
-                    )
-                    
-                    # If response is empty/whitespace, retry once with safer params
-                    if not response or not str(response).strip():
-                        print("     • Empty response, retrying with higher max_tokens/lower temperature...")
-                        try:
-                            response = model_runner.generate(
-                                prompt=prompt_data["prompt"],
-                                max_tokens=2048,
-                                temperature=0.2,
-                            )
-                        except Exception as retry_err:
-                            print(f"     • Retry failed: {retry_err}")
-                    
-                    # If still empty, mark as error and continue
-                    if not response or not str(response).strip():
-                        await crud.create_log(
+            async def generate_single(prompt_text: str) -> str:
+                # Generate response (first attempt)
+                response = await agenerate_text(
+                    prompt=prompt_text,
+                    max_tokens=2048,
+                    temperature=generation_temperature,
+                )
+
+                # If response is empty/whitespace, retry once with safer params
+                if not response or not str(response).strip():
+                    print("     • Empty response, retrying with higher max_tokens/lower temperature...")
+                    try:
+                        response = await agenerate_text(
+                            prompt=prompt_text,
+                            max_tokens=2048,
+                            temperature=0.2,
+                        )
+                    except Exception as retry_err:
+                        print(f"     • Retry failed: {retry_err}")
+                return response
+
+            def attach_resumed_prompts(items):
+                for prompt_data in items:
+                    resumed = take_resumed_log(prompt_data.get("prompt")) if resumed_logs else None
+                    yield prompt_data, resumed
+
+            entries = attach_resumed_prompts(prompts)
+
+            # Batch execution: all pending generations go to the provider's batch
+            # API as one job up front; the loop below then consumes the results
+            # exactly like interactive outcomes. Keyed by id() of the prompt dicts,
+            # which stay alive in the materialized entries list.
+            batch_outcomes: Optional[Dict[int, Dict[str, Any]]] = None
+            execution_mode = str(config.get("executionMode") or "interactive").lower()
+            if execution_mode == "batch" and not model_runner.supports_batch_api:
+                print(f"⚠️ Batch execution is not available for provider '{runner_provider}', running interactively")
+            elif execution_mode == "batch":
+                entries = list(entries)
+                batch_outcomes = {}
+                pending = []
+                use_cache = generation_cache.enabled_for(generation_temperature)
+                for prompt_data, resumed in entries:
+                    if resumed is not None:
+                        continue
+                    if use_cache:
+                        cached = await generation_cache.get(
+                            generation_cache.make_key(prompt_data["prompt"], generation_temperature, 2048)
+                        )
+                        if cached is not None:
+                            batch_outcomes[id(prompt_data)] = {"response": cached, "error": None, "latency_ms": 0}
+                            continue
+                    pending.append(prompt_data)
+
+                # Batch jobs submitted by an interrupted delivery of this experiment are
+                # re-attached to instead of being submitted (and paid for) again
+                previous_batch_jobs: List[Dict[str, Any]] = []
+                if config.get("resume") and pending:
+                    try:
+                        previous_batch_jobs = await crud.get_experiment_batch_jobs(
+                            db=db, experiment_id=experiment_id, organization_id=organization_id,
+                        )
+                    except Exception as e:
+                        print(f"⚠️ Could not load earlier batch jobs: {e}")
+
+                async def record_batch_jobs(jobs: List[Dict[str, Any]]) -> None:
+                    submitted_at = datetime.now().isoformat()
+                    try:
+                        await crud.add_experiment_batch_jobs(
                             db=db,
-                            project_id=config.get("project_id"),
-                            organization_id=organization_id,
                             experiment_id=experiment_id,
-                            input_text=prompt_data["prompt"],
-                            output_text="",
-                            model_name=model_name,
-                            latency_ms=int((datetime.now() - start_time).total_seconds() * 1000),
-                            token_count=0,
-                            status="error",
-                            error_message="empty_output",
+                            organization_id=organization_id,
+                            jobs=[{**job, "submitted_at": submitted_at} for job in jobs],
                         )
-                        print("     ✗ Empty output after retry - logged as error")
-                        continue
-                    
-                    latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-                    
-                    # Create test case
-                    test_case = LLMTestCase(
-                        input=prompt_data["prompt"],
-                        actual_output=response,
-                        expected_output=prompt_data.get("expected_output", ""),
-                    )
-                    
-                    # Log the interaction
-                    created_log = await crud.create_log(
+                    except Exception as e:
+                        # The batch still runs; it just cannot be re-attached after a restart
+                        print(f"⚠️ Could not record batch jobs {[job['id'] for job in jobs]}: {e}")
+
+                print(f"\n📦 Submitting {len(pending)} generations as a {runner_provider} batch job...")
+                progress.start_stage("batch", total=len(pending))
+                batch_done = 0
+
+                def on_batch_poll(status: str, done: int, total: int) -> None:
+                    nonlocal batch_done
+                    print(f"  • Batch status: {status} ({done}/{total})")
+                    progress.advance(max(done - batch_done, 0))
+                    batch_done = max(done, batch_done)
+
+                try:
+                    batch_results = await model_runner.agenerate_batch_api(
+                        [prompt_data["prompt"] for prompt_data in pending],
+                        max_tokens=2048,
+                        temperature=generation_temperature,
+                        on_poll=on_batch_poll,
+                        jobs=previous_batch_jobs,
+                        on_submit=record_batch_jobs,
+                    ) if pending else []
+                except Exception as e:
+                    error_msg = f"Batch generation failed: {e}"
+                    print(f"❌ {error_msg}")
+                    await log_buffer.flush()
+                    await crud.update_experiment_status(
                         db=db,
-                        project_id=config.get("project_id"),
-                        organization_id=organization_id,
                         experiment_id=experiment_id,
-                        input_text=prompt_data["prompt"],
-                        output_text=response,
-                        model_name=model_name,
-                        latency_ms=latency_ms,
-                        token_count=len(response.split()) if isinstance(response, str) else 0,  # Rough estimate
-                        status="success",
-                    )
-                    
-                    # Record latency metric
-                    await crud.create_metric(
-                        db=db,
-                        project_id=config.get("project_id"),
-                        metric_name="latency",
-                        metric_type="performance",
-                        value=float(latency_ms),
                         organization_id=organization_id,
-                        experiment_id=experiment_id,
+                        status="failed",
+                        error_message=error_msg,
                     )
-                    
-                    test_cases_data.append({
-                        "test_case": test_case,
-                        "metadata": {
-                            "sample_id": prompt_data.get("id"),
-                            "category": prompt_data.get("category"),
-                            "difficulty": prompt_data.get("difficulty"),
-                            "log_id": created_log.get("id") if created_log else None,
-                        }
-                    })
-
-                    print(f"     ✓ Generated ({latency_ms}ms)")
+                    return {"error": error_msg}
 
-                    # Track success to reset fatal error counter
-                    fatal_error_tracker.track_success()
+                for prompt_data, result in zip(pending, batch_results):
+                    # Per-request latency is not observable inside a batch job
+                    batch_outcomes[id(prompt_data)] = {
+                        "response": result.text,
+                        "error": RuntimeError(result.error) if result.error else None,
+                        "latency_ms": None,
+                    }
+                    if use_cache and result.text:
+                        await generation_cache.set(
+                            generation_cache.make_key(prompt_data["prompt"], generation_temperature, 2048),
+                            result.text,
+                        )
+                print(f"✓ Batch job finished: {sum(1 for r in batch_results if r.error is None)}/{len(batch_results)} succeeded")
 
+            async def generation_worker(entry) -> Dict[str, Any]:
+                prompt_data, resumed = entry
+                if resumed is not None:
+                    return {"response": resumed["output_text"], "error": None, "latency_ms": resumed["latency_ms"] or 0}
+                if batch_outcomes is not None:
+                    return batch_outcomes[id(prompt_data)]
+                start_time = datetime.now()  # Set before try block so it's always defined
+                try:
+                    response = await generate_single(prompt_data["prompt"])
+                    error = None
                 except Exception as e:
-                    print(f"     ❌ Error: {e}")
+                    response, error = None, e
+                latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+                return {"response": response, "error": error, "latency_ms": latency_ms}
 
-                    # Calculate latency even for errors (time spent before error)
-                    error_latency_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            progress.start_stage("generating", total=prompt_total)
+            # The worker's event loop outlives this experiment: close the runner's async client with it
+            async with aclosing(model_runner), OrderedWorkerPool(generation_worker, concurrency=generation_concurrency) as pool:
+                async for i, (prompt_data, resumed), outcome in pool.results(entries):
+                    idx = i + 1
+                    try:
+                        print(f"  [{idx}/{prompt_total}] Processing: {prompt_data['prompt'][:50]}...")
+                        if outcome["error"] is not None:
+                            raise outcome["error"]
+                        response = outcome["response"]
+                        latency_ms = outcome["latency_ms"]
 
-                    # Log the error with latency
-                    await crud.create_log(
-                        db=db,
-                        project_id=config.get("project_id"),
-                        organization_id=organization_id,
-                        experiment_id=experiment_id,
-                        input_text=prompt_data.get("prompt", str(prompt_data)[:200]),
-                        model_name=model_name,
-                        latency_ms=error_latency_ms,
-                        token_count=0,
-                        status="error",
-                        error_message=str(e),
-                    )
+                        # If still empty, mark as error and continue
+                        if not response or not str(response).strip():
+                            progress.advance(errors=1)
+                            await log_buffer.add_log(
+                                input_text=prompt_data["prompt"],
+                                output_text="",
+                                model_name=model_name,
+                                latency_ms=latency_ms,
+                                token_count=0,
+                                status="error",
+                                error_message="empty_output",
+                            )
+                            print("     ✗ Empty output after retry - logged as error")
+                            continue
 
-                    # Check if this is a fatal error that should stop the experiment
-                    should_stop = fatal_error_tracker.track_error(str(e))
-                    if should_stop:
-                        termination_reason = fatal_error_tracker.get_termination_reason()
-                        print(f"\n🛑 FATAL ERROR DETECTED: {termination_reason}")
-                        print(f"   Stopping experiment early to avoid wasting time on unrecoverable errors.\n")
+                        # Create test case
+                        test_case = LLMTestCase(
+                            input=prompt_data["prompt"],
+                            actual_output=response,
+                            expected_output=prompt_data.get("expected_output", ""),
+                        )
 
-                        # Update experiment status to failed
-                        await crud.update_experiment_status(
-                            db=db,
-                            experiment_id=experiment_id,
-                            organization_id=organization_id,
-                            status="failed",
-                            error_message=termination_reason,
+                        if resumed is not None:
+                            # Already logged (with its latency metric) by the interrupted run
+                            log_id = resumed["id"]
+                        else:
+                            # Log the interaction
+                            log_id = await log_buffer.add_log(
+                                input_text=prompt_data["prompt"],
+                                output_text=response,
+                                model_name=model_name,
+                                latency_ms=latency_ms,
+                                token_count=len(response.split()) if isinstance(response, str) else 0,  # Rough estimate
+                                status="success",
+                            )
+
+                            # Record latency metric (not measurable for batch-API generations)
+                            if latency_ms is not None:
+                                await log_buffer.add_metric(
+                                    metric_name="latency",
+                                    metric_type="performance",
+                                    value=float(latency_ms),
+                                )
+
+                        test_cases_data.append({
+                            "test_case": test_case,
+                            "metadata": {
+                                "sample_id": prompt_data.get("id"),
+                                "category": prompt_data.get("category"),
+                                "difficulty": prompt_data.get("difficulty"),
+                                "log_id": log_id,
+                                "stratum": stratum_of(prompt_data),
+                            }
+                        })
+
+                        if resumed is not None:
+                            print(f"     ↺ Reused stored response")
+                        elif latency_ms is None:
+                            print(f"     ✓ Generated (batch)")
+                        else:
+                            print(f"     ✓ Generated ({latency_ms}ms)")
+                        progress.advance()
+
+                        # Track success to reset fatal error counter
+                        fatal_error_tracker.track_success()
+
+                    except Exception as e:
+                        print(f"     ❌ Error: {e}")
+                        progress.advance(errors=1)
+
+                        # Log the error with latency (time spent before error)
+                        await log_buffer.add_log(
+                            input_text=prompt_data.get("prompt", str(prompt_data)[:200]),
+                            model_name=model_name,
+                            latency_ms=outcome["latency_ms"],
+                            token_count=0,
+                            status="error",
+                            error_message=str(e),
                         )
-                        return {"error": termination_reason, "early_termination": True}
 
-                    continue
+                        # Check if this is a fatal error that should stop the experiment
+                        should_stop = fatal_error_tracker.track_error(str(e))
+                        if should_stop:
+                            termination_reason = fatal_error_tracker.get_termination_reason()
+                            print(f"\n🛑 FATAL ERROR DETECTED: {termination_reason}")
+                            print(f"   Stopping experiment early to avoid wasting time on unrecoverable errors.\n")
+
+                            # Persist what was generated so far, then mark the experiment failed
+                            await log_buffer.flush()
+                            await crud.update_experiment_status(
+                                db=db,
+                                experiment_id=experiment_id,
+                                organization_id=organization_id,
+                                status="failed",
+                                error_message=termination_reason,
+                            )
+                            return {"error": termination_reason, "early_termination": True}
+
+                        continue
         
+        # Stage boundary: persist buffered generation logs before scoring
+        await log_buffer.flush()
+
         if not test_cases_data:
             error_msg = "No responses generated"
             await crud.update_experiment_status(
@@ -750,11 +1016,23 @@ async def run_evaluation(
         simple_config = SimpleConfig()
         config_manager = type('obj', (object,), {'config': simple_config})()
         
-        output_dir = evaluation_module_path / "artifacts" / "deepeval_results"
+        # Judge verdicts are cached per organization; "verdictCache": false forces re-judging
+        verdict_cache = (
+            RedisVerdictCache(namespace=str(organization_id), loop=event_loop)
+            if config.get("verdictCache", True)
+            else None
+        )
+
+        # Each experiment writes its artifacts to its own directory
+        output_dir = evaluation_module_path / "artifacts" / "deepeval_results" / experiment_id
         evaluator = DeepEvalEvaluator(
             config_manager=config_manager,
             output_dir=str(output_dir),
             metric_thresholds=thresholds_config,
+            verdict_cache=verdict_cache,
+            judge_concurrency=config.get("judgeConcurrency"),
+            fused_rubric=bool(config.get("fusedRubric", False)),
+            batch_turn_safety=bool(config.get("batchTurnSafety", False)),
         )
         
         # Read UI-selected metrics from config
@@ -848,15 +1126,70 @@ async def run_evaluation(
         enabled_metrics = [k for k, v in deepeval_metrics_config.items() if v]
         print(f"📊 Enabled metrics: {enabled_metrics}")
         
+        # Running aggregates: DeepEval metrics + merged scorer scores keyed by metric
+        # name (mirrors results[*].metric_scores), and custom scorers keyed by scorer id
+        metric_aggregates: AggregateTracker = evaluator.aggregates
+        scorer_aggregates = AggregateTracker()
+
+        async def write_partial_results() -> None:
+            # Separate session: the main coroutine keeps using `db` meanwhile
+            while True:
+                await asyncio.sleep(PARTIAL_RESULTS_INTERVAL)
+                try:
+                    async with get_db() as partial_db:
+                        await crud.update_experiment_partial_results(
+                            db=partial_db,
+                            experiment_id=experiment_id,
+                            organization_id=organization_id,
+                            results={
+                                "partial": True,
+                                "progress": progress.snapshot(),
+                                "metric_summaries": metric_aggregates.metric_summaries(),
+                                "scorer_summaries": scorer_aggregates.metric_summaries(),
+                                "updated_at": datetime.now().isoformat(),
+                            },
+                        )
+                except Exception as partial_err:
+                    print(f"⚠️ Failed to write partial results: {partial_err}")
+
+        partial_results_task = asyncio.create_task(write_partial_results())
+
         # 4. Run DeepEval metrics (only if mode is "standard" or "both")
         results = []
+        early_stopping_monitor: Optional[SequentialGateMonitor] = None
         if evaluation_mode in ("standard", "both"):
             print(f"\n🧪 Running DeepEval built-in metrics (mode: {evaluation_mode})")
-            results = evaluator.run_evaluation(
+
+            # Early-stop mode: judge samples in random order and stop once every
+            # gate decision in suite_core.yaml is settled at the requested confidence
+            early_stopping_config = config.get("earlyStopping") or {}
+            suite_path = evaluation_module_path / "suits" / "suite_core.yaml"
+            if early_stopping_config.get("enabled") and suite_path.is_file():
+                gate_thresholds = load_gate_thresholds(str(suite_path.resolve()))
+                early_stopping_monitor = SequentialGateMonitor(
+                    thresholds=gate_thresholds,
+                    confidence=float(early_stopping_config.get("confidence", 0.95)),
+                    min_samples=int(early_stopping_config.get("minSamples", 20)),
+                )
+                random.Random(early_stopping_config.get("seed")).shuffle(test_cases_data)
+                evaluator.early_stopping = early_stopping_monitor
+                print(f"⏹ Early stopping enabled (confidence={early_stopping_monitor.confidence}, min_samples={early_stopping_monitor.min_samples})")
+
+            progress.start_stage("scoring", total=len(test_cases_data))
+            # The evaluator is synchronous: run it off the event loop and report
+            # per-sample progress back onto the loop
+            evaluator.progress_callback = lambda completed, errors: event_loop.call_soon_threadsafe(
+                progress.advance, completed, errors
+            )
+            results = await asyncio.to_thread(
+                evaluator.run_evaluation,
                 test_cases_data=test_cases_data,
                 metrics_config=deepeval_metrics_config,
                 use_case=task_type or "chatbot",
             )
+            if early_stopping_monitor is not None and early_stopping_monitor.stopped_early:
+                # Later stages (custom scorers, log metadata) only cover judged samples
+                del test_cases_data[len(results):]
         else:
             print(f"\n⏭️ Skipping DeepEval metrics (mode: {evaluation_mode})")
             # Still need to create empty results structure for consistency
@@ -925,6 +1258,7 @@ async def run_evaluation(
                     print(f"   No scorer selection specified - running all enabled scorers")
                 
                 if enabled_scorers:
+                    progress.start_stage("custom_scorers", total=len(enabled_scorers) * len(test_cases_data))
                     for scorer in enabled_scorers:
                         scorer_id = scorer.get("id", "unknown")
                         scorer_name = scorer.get("name", "Unknown Scorer")
@@ -960,6 +1294,7 @@ async def run_evaluation(
                                     input_text=input_text,
                                     output_text=output_text,
                                     expected_text=expected_text,
+                                    verdict_cache=verdict_cache,
                                 )
                                 
                                 scorer_scores.append({
@@ -970,6 +1305,8 @@ async def run_evaluation(
                                     "raw_response": result.raw_response,
                                 })
                                 
+                                progress.advance(errors=1 if result.label == "ERROR" else 0)
+                                scorer_aggregates.add(scorer_id, result.score, result.passed)
                                 status_icon = "✅" if result.passed else "❌"
                                 print(f"      {status_icon} Result: {result.label} (score={result.score:.2f}, passed={result.passed})")
                                 if result.total_tokens:
@@ -985,9 +1322,12 @@ async def run_evaluation(
                                         "passed": result.passed,
                                         "reason": result.reason if result.reason else (result.raw_response if result.raw_response else ""),
                                     }
+                                    metric_aggregates.add(scorer_name, result.score, result.passed)
                                 
                             except Exception as scorer_err:
                                 print(f"      ❌ Error: {scorer_err}")
+                                progress.advance(errors=1)
+                                scorer_aggregates.add(scorer_id, 0.0, False)
                                 scorer_scores.append({
                                     "test_case_idx": idx,
                                     "label": "ERROR",
@@ -1012,24 +1352,22 @@ async def run_evaluation(
         
         print(f"\n{'='*50}\n")
 
-        # 4.25 Run gatekeeper quality gate on the latest summary (if suite is available)
+        # Scoring is done; final results below replace the partial ones
+        partial_results_task.cancel()
+
+        # 4.25 Run gatekeeper quality gate on this run's summary (if suite is available)
         gatekeeper_result: dict[str, Any] | None = None
         try:
             suite_path = evaluation_module_path / "suits" / "suite_core.yaml"
-            latest_summary: Path | None = None
+            # In-memory summary of this experiment's DeepEval run (None when metrics were skipped)
+            run_summary = evaluator.last_summary
 
-            try:
-                summaries = list(Path(output_dir).glob("deepeval_summary_*.json"))
-                if summaries:
-                    latest_summary = max(summaries, key=lambda p: p.stat().st_mtime)
-            except Exception:
-                latest_summary = None
-
-            if latest_summary and suite_path.is_file():
+            if run_summary and suite_path.is_file():
                 print("\n🔒 Running gatekeeper quality gate...")
                 gate_result = evaluate_gate(
-                    summary_path=str(latest_summary),
+                    summary_path=None,
                     suite_path=str(suite_path.resolve()),
+                    summary=run_summary,
                 )
                 gatekeeper_result = gate_result.to_dict()
                 status = "PASSED" if gate_result.passed else "FAILED"
@@ -1039,14 +1377,15 @@ async def run_evaluation(
                     for r in gate_result.fail_reasons:
                         print(f"  - {r}")
             else:
-                if not latest_summary:
-                    print("Gatekeeper skipped: no deepeval_summary_*.json found.")
+                if not run_summary:
+                    print("Gatekeeper skipped: no DeepEval summary for this run.")
                 if not suite_path.is_file():
                     print(f"Gatekeeper skipped: suite file not found at {suite_path}")
         except Exception as ge:
             print(f"Gatekeeper error: {ge}")
 
         # 4.5 Persist per-log metric scores to log metadata
+        progress.start_stage("saving")
         # Map display names back to camelCase keys for frontend compatibility
         display_to_camel = {
             "Answer Relevancy": "answerRelevancy",
@@ -1084,6 +1423,7 @@ async def run_evaluation(
         
         try:
             print(f"📝 Updating {len(results)} logs with metric scores...")
+            metadata_updates: Dict[str, Dict[str, Any]] = {}
             for idx, result in enumerate(results):
                 log_id = test_cases_data[idx]["metadata"].get("log_id") if idx < len(test_cases_data) else None
                 if log_id:
@@ -1093,16 +1433,17 @@ async def run_evaluation(
                     for display_name, score_data in raw_scores.items():
                         camel_key = display_to_camel.get(display_name, display_name)
                         normalized_scores[camel_key] = score_data
-                    
-                    await crud.update_log_metadata(
-                        db=db,
-                        log_id=log_id,
-                        organization_id=organization_id,
-                        metadata={"metric_scores": normalized_scores},
-                    )
-                    print(f"   ✅ Updated log {log_id[:8]}... with {len(normalized_scores)} metrics")
+                    metadata_updates[log_id] = {"metric_scores": normalized_scores}
                 else:
                     print(f"   ⚠️ No log_id found for result {idx}")
+
+            # One bulk UPDATE instead of a round-trip and commit per log
+            updated_count = await crud.update_logs_metadata_bulk(
+                db=db,
+                organization_id=organization_id,
+                updates=metadata_updates,
+            )
+            print(f"   ✅ Updated {updated_count} logs with metric scores")
         except Exception as e:
             print(f"⚠️ Failed to update log metadata with metric scores: {e}")
             traceback.print_exc()
@@ -1150,41 +1491,27 @@ async def run_evaluation(
         # Check if this is a conversational evaluation by looking at the results
         is_conversational = any(r.get("is_conversational", False) for r in results)
 
+        # Averages come from the running aggregates instead of re-scanning results
         # For conversational datasets, also collect scores from conversational metric names
         if is_conversational:
-            # Collect all unique metric names from results
-            all_metric_names = set()
-            for r in results:
-                all_metric_names.update(r.get("metric_scores", {}).keys())
+            all_metric_names = metric_aggregates.metric_names()
             
             print(f"📊 Found conversational metrics: {all_metric_names}")
             
             # Process each metric found in results
             for metric_name in all_metric_names:
-                scores: list[float] = []
-                for r in results:
-                    score_obj = r.get("metric_scores", {}).get(metric_name)
-                    if isinstance(score_obj, dict):
-                        score_val = score_obj.get("score")
-                        if isinstance(score_val, (int, float)):
-                            scores.append(float(score_val))
-                
-                if scores:
-                    avg_score = sum(scores) / len(scores)
+                avg_score = metric_aggregates.mean(metric_name)
+                if avg_score is not None:
                     # Convert metric name to camelCase for frontend
                     camel_key = "".join(
                         word.capitalize() if i > 0 else word.lower()
                         for i, word in enumerate(metric_name.split())
                     )
                     avg_scores[camel_key] = avg_score
-                    await crud.create_metric(
-                        db=db,
-                        project_id=config.get("project_id"),
+                    await log_buffer.add_metric(
                         metric_name=camel_key,
                         metric_type="quality",
                         value=avg_score,
-                        organization_id=organization_id,
-                        experiment_id=experiment_id,
                     )
                     print(f"   ✅ Saved {metric_name}: {avg_score:.3f}")
         else:
@@ -1194,32 +1521,22 @@ async def run_evaluation(
                     mapping = metric_config_map.get(metric_key, {"display": metric_key, "camel": metric_key})
                     display_name = mapping["display"]
                     camel_key = mapping["camel"]
-                    scores: list[float] = []
-                    for r in results:
-                        score_obj = r.get("metric_scores", {}).get(display_name)
-                        if isinstance(score_obj, dict):
-                            score_val = score_obj.get("score")
-                            if isinstance(score_val, (int, float)):
-                                scores.append(float(score_val))
-                    if scores:
-                        avg_score = sum(scores) / len(scores)
+                    avg_score = metric_aggregates.mean(display_name)
+                    if avg_score is not None:
                         # Store with camelCase key for frontend compatibility
                         avg_scores[camel_key] = avg_score
-                        await crud.create_metric(
-                            db=db,
-                            project_id=config.get("project_id"),
+                        await log_buffer.add_metric(
                             metric_name=camel_key,  # Use camelCase for DB too
                             metric_type="quality",
                             value=avg_score,
-                            organization_id=organization_id,
-                            experiment_id=experiment_id,
                         )
         
         # 5.1 Store Custom Scorer Results (same format as DeepEval metrics)
         if custom_scorer_results:
             print(f"💾 Storing custom scorer results...")
             for scorer_id, scorer_scores in custom_scorer_results.items():
-                if scorer_scores:
+                scorer_acc = scorer_aggregates.get(scorer_id)
+                if scorer_scores and scorer_acc is not None:
                     # Find scorer info from enabled_scorers
                     scorer_name = scorer_id
                     metric_key = scorer_id
@@ -1229,22 +1546,17 @@ async def run_evaluation(
                             metric_key = s.get("metricKey", scorer_id)
                             break
                     
-                    # Calculate average
-                    avg_score = sum(s["score"] for s in scorer_scores) / len(scorer_scores)
-                    passed_rate = sum(1 for s in scorer_scores if s["passed"]) / len(scorer_scores)
+                    avg_score = scorer_acc.mean
+                    passed_rate = scorer_acc.pass_rate
                     
                     # Store in avg_scores with metricKey (same as DeepEval metrics)
                     avg_scores[metric_key] = avg_score
                     
                     # Store as metric (same format as DeepEval metrics)
-                    await crud.create_metric(
-                        db=db,
-                        project_id=config.get("project_id"),
+                    await log_buffer.add_metric(
                         metric_name=metric_key,
                         metric_type="quality",  # Same type as DeepEval metrics
                         value=avg_score,
-                        organization_id=organization_id,
-                        experiment_id=experiment_id,
                     )
                     print(f"   ✅ Saved {scorer_name} ({metric_key}): avg={avg_score:.3f}, pass_rate={passed_rate:.1%}")
         
@@ -1252,12 +1564,37 @@ async def run_evaluation(
         experiment_results: Dict[str, Any] = {
             "total_prompts": total_prompts,
             "avg_scores": avg_scores,  # Contains both DeepEval and custom scorer averages
+            "metric_summaries": metric_aggregates.metric_summaries(),
             "detailed_results": results[:10],  # Store first 10 for preview (includes custom scorer scores in metric_scores)
             "completed_at": datetime.now().isoformat(),
         }
         if gatekeeper_result is not None:
             experiment_results["gatekeeper"] = gatekeeper_result
+        if early_stopping_monitor is not None:
+            experiment_results["early_stopping"] = early_stopping_monitor.to_dict()
+        if sample_plan is not None:
+            estimator = StratifiedEstimator(
+                populations=sample_plan.populations,
+                confidence=float(sampling_config.get("confidence", 0.95)),
+            )
+            estimator.add_many(
+                (test_cases_data[idx]["metadata"].get("stratum"), result.get("metric_scores", {}))
+                for idx, result in enumerate(results)
+                if idx < len(test_cases_data)
+            )
+            experiment_results["sampling"] = {**sample_plan.to_dict(), "estimates": estimator.estimates()}
+        if generation_cache.hits or generation_cache.misses:
+            experiment_results["generation_cache"] = generation_cache.stats()
+            print(f"🗄️ Generation cache: {generation_cache.stats()}")
+        if verdict_cache is not None and (verdict_cache.hits or verdict_cache.misses):
+            experiment_results["verdict_cache"] = verdict_cache.stats()
+            print(f"🗄️ Verdict cache: {verdict_cache.stats()}")
+        if evaluator.judge_prompt_cache.get("prompt_tokens"):
+            experiment_results["judge_prompt_cache"] = evaluator.judge_prompt_cache
+        if runner_provider == "huggingface":
+            experiment_results["local_model_cache"] = get_model_registry().stats()
         
+        await log_buffer.flush()
         await crud.update_experiment_status(
             db=db,
             experiment_id=experiment_id,
@@ -1265,6 +1602,7 @@ async def run_evaluation(
             status="completed",
             results=experiment_results,
         )
+        await progress.finish("completed")
         
         print(f"\n✅ Evaluation completed successfully!")
         print(f"   Total prompts: {total_prompts}")
@@ -1276,6 +1614,12 @@ async def run_evaluation(
         error_msg = f"Evaluation failed: {str(e)}"
         print(f"\n❌ {error_msg}")
         traceback.print_exc()
+
+        try:
+            # Keep whatever per-sample rows were generated before the failure
+            await log_buffer.flush()
+        except Exception as flush_err:
+            print(f"⚠️ Failed to flush buffered logs: {flush_err}")
         
         try:
             await crud.update_experiment_status(
@@ -1288,5 +1632,11 @@ async def run_evaluation(
         except:
             pass
         
+        await progress.finish("failed", error_msg)
         return {"error": error_msg}
+    finally:
+        if partial_results_task is not None and not partial_results_task.done():
+            partial_results_task.cancel()
+        # Early-return failure paths above end here; no-op once a terminal event was sent
+        await progress.finish("failed")
 
@@ -0,0 +1,120 @@
+"""
+Assistant-turn generation for conversational (multi-turn) scenarios.
+
+Turns within a scenario are generated sequentially, because each prompt
+carries the conversation so far. run_evaluation runs several scenarios at
+once on the ordered worker pool and replays their per-turn outcomes through
+the experiment's FatalErrorTracker in scenario order.
+"""
+
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.error_detection import FatalErrorTracker
+
+SCENARIO_MAX_TOKENS = 1024
+
+
+def split_scenario_turns(convo: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """User messages to replay and the dataset's expected assistant turns (kept for reference)."""
+    user_turns_content = []
+    expected_assistant_turns = []
+    for t in convo.get("turns") or []:
+        role = (t.get("role") or "").lower()
+        content = t.get("content") or ""
+        if role == "user":
+            user_turns_content.append(content)
+        elif role == "assistant":
+            expected_assistant_turns.append(content)
+    return user_turns_content, expected_assistant_turns
+
+
+def build_turn_prompt(conversation_history: List[Dict[str, str]]) -> str:
+    """Prompt for the next assistant turn; the last history entry is the current user message."""
+    user_msg = conversation_history[-1]["content"]
+    if len(conversation_history) == 1:
+        # First turn - just the user message
+        return f"You are a helpful assistant. Respond to the user.\n\nUser: {user_msg}\n\nAssistant:"
+    history_str = ""
+    for h in conversation_history[:-1]:  # Exclude current turn
+        role_label = "User" if h["role"] == "user" else "Assistant"
+        history_str += f"{role_label}: {h['content']}\n"
+    return f"You are a helpful assistant. Continue this conversation.\n\n{history_str}User: {user_msg}\n\nAssistant:"
+
+
+def clean_response(response: Optional[str]) -> str:
+    """Strip whitespace and an echoed 'Assistant:' prefix; empty responses get a placeholder."""
+    if response:
+        response = response.strip()
+        # Remove common prefixes if model echoes them
+        if response.lower().startswith("assistant:"):
+            response = response[10:].strip()
+    return response or "[Model returned empty response]"
+
+
+def generate_scenario(
+    user_turns_content: List[str],
+    generate_text: Callable[..., str],
+    temperature: float,
+    stop: Optional[threading.Event] = None,
+) -> Dict[str, Any]:
+    """
+    Generate the assistant turns of one scenario, sequentially (blocking; run
+    it in a worker thread).
+
+    ``generate_text(prompt=, max_tokens=, temperature=)`` produces one turn.
+    Generation ends early once ``stop`` is set (the experiment is terminating)
+    or the scenario hits consecutive fatal errors of its own. ``turn_errors``
+    holds one entry per generated turn: None on success, else the error.
+    """
+    # Imported here like in run_evaluation, so importing this module does not load deepeval
+    from deepeval.test_case import Turn
+
+    turn_objects = []
+    generated_assistant_turns = []
+    conversation_history = []  # Track conversation for context
+    turn_errors: List[Optional[str]] = []
+    # Local tracker so a scenario stops on its own fatal errors without waiting for the consumer
+    scenario_tracker = FatalErrorTracker(threshold=2)
+
+    start_time = datetime.now()
+    total_tokens = 0
+
+    for user_msg in user_turns_content:
+        if stop is not None and stop.is_set():
+            break
+
+        turn_objects.append(Turn(role="user", content=user_msg))
+        conversation_history.append({"role": "user", "content": user_msg})
+
+        try:
+            assistant_response = clean_response(
+                generate_text(
+                    prompt=build_turn_prompt(conversation_history),
+                    max_tokens=SCENARIO_MAX_TOKENS,
+                    temperature=temperature,
+                )
+            )
+            turn_errors.append(None)
+            scenario_tracker.track_success()
+        except Exception as gen_err:
+            assistant_response = f"[Generation error: {str(gen_err)[:100]}]"
+            turn_errors.append(str(gen_err))
+            if scenario_tracker.track_error(str(gen_err)):
+                break
+
+        turn_objects.append(Turn(role="assistant", content=assistant_response))
+        conversation_history.append({"role": "assistant", "content": assistant_response})
+        generated_assistant_turns.append(assistant_response)
+
+        # Estimate tokens for this turn
+        total_tokens += len(user_msg.split()) + len(assistant_response.split())
+
+    return {
+        "turn_objects": turn_objects,
+        "generated_assistant_turns": generated_assistant_turns,
+        "turn_errors": turn_errors,
+        "latency_ms": int((datetime.now() - start_time).total_seconds() * 1000),
+        "total_tokens": total_tokens,
+    }
@@ -0,0 +1,98 @@
+"""
+Redis-backed judge verdict cache shared by DeepEval metrics and custom scorers.
+
+Verdicts are keyed by a SHA-256 of (judge model, metric or scorer template,
+test case content) - see deepeval_engine.verdict_cache - and scoped per
+organization. Entries expire after EVAL_VERDICT_CACHE_TTL seconds and the least
+recently used ones are evicted beyond EVAL_VERDICT_CACHE_MAX_ENTRIES (see
+utils.redis_lru).
+
+Redis calls always run on the event loop the cache was created on. Custom
+scorers run on that loop and await ``aget``/``aset`` directly. The DeepEval
+evaluator runs in a worker thread: its blocking ``get``/``set`` calls wait for
+the owning loop, and its async scoring (on a loop of its own) awaits
+``aget``/``aset``, which hand the call over without blocking that loop. Calls
+give up after EVAL_VERDICT_CACHE_TIMEOUT seconds. Redis errors and timeouts
+are counted and treated as misses - the cache never fails an evaluation.
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, Optional
+
+from deepeval_engine.verdict_cache import (
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_SECONDS,
+    VerdictCache,
+)
+from utils.redis_lru import RedisLRUStore
+
+CACHE_PREFIX = "evalcache:verdict"
+# Seconds a lookup or store may take before it is treated as a miss
+CACHE_TIMEOUT = float(os.getenv("EVAL_VERDICT_CACHE_TIMEOUT", "5"))
+
+
+class RedisVerdictCache(VerdictCache):
+    """Per-organization view of the shared verdict cache."""
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        """
+        Args:
+            namespace: Isolation scope (the organization id)
+            loop: Event loop that serves blocking ``get``/``set`` from worker
+                threads (defaults to the running loop)
+        """
+        super().__init__(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self.namespace = namespace
+        self.store = RedisLRUStore(CACHE_PREFIX, ttl_seconds, max_entries)
+        self._loop = loop or asyncio.get_running_loop()
+
+    def _member(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _run(self, coro):
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            coro.close()
+            raise RuntimeError("blocking verdict cache call on its own event loop; use aget/aset")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(CACHE_TIMEOUT)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    async def _arun(self, coro):
+        if asyncio.get_running_loop() is self._loop:
+            return await asyncio.wait_for(coro, CACHE_TIMEOUT)
+        # Called from another loop (the evaluator's): await the hand-off instead of blocking on it
+        future = asyncio.run_coroutine_threadsafe(asyncio.wait_for(coro, CACHE_TIMEOUT), self._loop)
+        return await asyncio.wrap_future(future)
+
+    async def _redis_load(self, key: str) -> Optional[Dict[str, Any]]:
+        document = await self.store.get(self._member(key))
+        return document["verdict"] if document is not None else None
+
+    async def _redis_store(self, key: str, verdict: Dict[str, Any]) -> None:
+        await self.store.set(self._member(key), {"verdict": verdict})
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._run(self._redis_load(key))
+
+    def _store(self, key: str, verdict: Dict[str, Any]) -> None:
+        self._run(self._redis_store(key, verdict))
+
+    async def _aload(self, key: str) -> Optional[Dict[str, Any]]:
+        return await self._arun(self._redis_load(key))
+
+    async def _astore(self, key: str, verdict: Dict[str, Any]) -> None:
+        await self._arun(self._redis_store(key, verdict))
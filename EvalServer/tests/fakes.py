@@ -0,0 +1,60 @@
+"""Recording stand-in for an AsyncSession, shared by the CRUD tests."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.dialects import postgresql
+
+
+class _Result:
+    def __init__(self, rows: Optional[List[Dict[str, Any]]] = None, rowcount: int = 0):
+        self._rows = rows or []
+        self.rowcount = rowcount
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+class RecordingSession:
+    """
+    Records every statement with its parameters. ``respond(sql, params)``
+    may return rows or a rowcount (as a _Result) or raise to simulate a
+    database error.
+    """
+
+    def __init__(self, respond: Optional[Callable[[str, Dict[str, Any]], Any]] = None):
+        self.respond = respond
+        self.statements: List[tuple] = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        params = dict(params or {})
+        # Every bind parameter in the SQL must be supplied (as the driver would require)
+        compiled = statement.compile(dialect=postgresql.dialect())
+        missing = set(compiled.params) - set(params)
+        assert not missing, f"unbound parameters: {sorted(missing)}"
+        self.statements.append((sql, params))
+        result = self.respond(sql, params) if self.respond else None
+        return result if isinstance(result, _Result) else _Result()
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def result(rows=None, rowcount=0) -> _Result:
+    return _Result(rows, rowcount)
@@ -0,0 +1,52 @@
+"""
+Tests for crud.update_logs_metadata_bulk: the parallel unnest() arrays it
+binds, chunking and the single commit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from crud.evaluation_logs import update_logs_metadata_bulk
+from tests.fakes import RecordingSession, result
+
+
+def test_binds_parallel_text_arrays_for_unnest():
+    session = RecordingSession(lambda sql, params: result(rowcount=len(params["log_ids"])))
+    updates = {
+        "0b4c7a3e-0000-4000-8000-000000000001": {"metric_scores": {"m": {"score": 0.5}}},
+        "0b4c7a3e-0000-4000-8000-000000000002": {},
+    }
+
+    updated = asyncio.run(update_logs_metadata_bulk(session, organization_id=7, updates=updates))
+
+    assert updated == 2 and session.commits == 1
+    (sql, params), = session.statements
+    assert "unnest(CAST(:log_ids AS text[]), CAST(:metadata_jsons AS text[]))" in sql
+    assert params["organization_id"] == 7
+    assert params["log_ids"] == list(updates)
+    assert all(isinstance(value, str) for value in params["metadata_jsons"])
+    assert [json.loads(value) for value in params["metadata_jsons"]] == [
+        {"metric_scores": {"m": {"score": 0.5}}},
+        {},
+    ]
+
+
+def test_chunks_share_one_commit_and_skip_empty_ids():
+    session = RecordingSession(lambda sql, params: result(rowcount=len(params["log_ids"])))
+    updates = {f"id-{i}": {"i": i} for i in range(5)}
+    updates[""] = {"dropped": True}
+
+    updated = asyncio.run(update_logs_metadata_bulk(session, 7, updates, chunk_size=2))
+
+    assert updated == 5
+    assert [params["log_ids"] for _, params in session.statements] == [["id-0", "id-1"], ["id-2", "id-3"], ["id-4"]]
+    assert all(len(p["log_ids"]) == len(p["metadata_jsons"]) for _, p in session.statements)
+    assert session.commits == 1
+
+
+def test_no_updates_runs_no_statement():
+    session = RecordingSession()
+    assert asyncio.run(update_logs_metadata_bulk(session, 7, {})) == 0
+    assert session.statements == [] and session.commits == 0
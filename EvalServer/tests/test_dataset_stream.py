@@ -0,0 +1,103 @@
+"""
+Tests for the streaming dataset loader: JSON arrays split at every possible
+chunk boundary, truncated files and the JSONL / wrapper-object layouts.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from utils.dataset_stream import StreamingDataset, iter_dataset_items
+
+ITEMS = [
+    {"prompt": "What is 2 + 2?", "expected_output": "4", "category": "math"},
+    {"prompt": "Unicode: café ✓, escapes \"quoted\" \\ and a ] bracket", "tags": ["a", "b"]},
+    12345,
+    -1.5e-3,
+    3.25,
+    True,
+    None,
+    "plain string, with comma",
+    [1, [2, {"nested": []}]],
+]
+
+
+def _write(tmp_path, text, name="data.json"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", list(range(1, 24)) + [4096])
+def test_array_items_survive_any_chunk_boundary(tmp_path, chunk_size):
+    path = _write(tmp_path, json.dumps(ITEMS, ensure_ascii=False, indent=2))
+    assert list(iter_dataset_items(path, chunk_size=chunk_size)) == ITEMS
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7])
+def test_compact_array_of_numbers(tmp_path, chunk_size):
+    values = [1, 22, 333, 4.5, 66.75, 1e10, -7, 0]
+    path = _write(tmp_path, json.dumps(values, separators=(",", ":")))
+    assert list(iter_dataset_items(path, chunk_size=chunk_size)) == values
+
+
+@pytest.mark.parametrize("cut", [1, 10, 40, -30, -3, -1])
+@pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+def test_truncated_array_raises(tmp_path, cut, chunk_size):
+    text = json.dumps(ITEMS, ensure_ascii=False)
+    path = _write(tmp_path, text[:cut])
+    with pytest.raises(ValueError):
+        list(iter_dataset_items(path, chunk_size=chunk_size))
+
+
+def test_truncated_array_yields_complete_items_before_failing(tmp_path):
+    text = json.dumps(ITEMS[:3])
+    path = _write(tmp_path, text[: text.rindex(",")])
+    stream = iter_dataset_items(path, chunk_size=8)
+    assert [next(stream), next(stream)] == ITEMS[:2]
+    with pytest.raises(ValueError):
+        list(stream)
+
+
+@pytest.mark.parametrize("text", ["[1,,2]", "[,1]", "[1 2]", '[{"a": 1} {"b": 2}]'])
+def test_malformed_arrays_raise(tmp_path, text):
+    with pytest.raises(ValueError):
+        list(iter_dataset_items(_write(tmp_path, text), chunk_size=2))
+
+
+def test_empty_and_whitespace_only_files(tmp_path):
+    assert list(iter_dataset_items(_write(tmp_path, ""))) == []
+    assert list(iter_dataset_items(_write(tmp_path, "  \n[ ]  ", name="b.json"), chunk_size=1)) == []
+
+
+def test_utf8_bom_is_skipped(tmp_path):
+    path = tmp_path / "bom.json"
+    path.write_bytes("﻿[1, 2]".encode("utf-8"))
+    assert list(iter_dataset_items(path, chunk_size=1)) == [1, 2]
+
+
+def test_jsonl_skips_blank_lines_and_reports_bad_line(tmp_path):
+    path = _write(tmp_path, '{"a": 1}\n\n{"a": 2}\n', name="data.jsonl")
+    assert list(iter_dataset_items(path)) == [{"a": 1}, {"a": 2}]
+
+    bad = _write(tmp_path, '{"a": 1}\n{"a": \n', name="bad.ndjson")
+    with pytest.raises(ValueError, match="line 2"):
+        list(iter_dataset_items(bad))
+
+
+@pytest.mark.parametrize("key", ["prompts", "test_cases", "data"])
+def test_wrapper_objects_are_unwrapped(tmp_path, key):
+    path = _write(tmp_path, json.dumps({key: ITEMS[:2], "name": "suite"}))
+    assert list(iter_dataset_items(path)) == ITEMS[:2]
+
+
+def test_streaming_dataset_is_reiterable(tmp_path):
+    path = _write(tmp_path, json.dumps([{"turns": [{"role": "user", "content": "hi"}]}, {"turns": []}]))
+    dataset = StreamingDataset(path, chunk_size=4)
+
+    assert len(dataset) == 2
+    assert list(dataset) == list(dataset)
+    assert dataset.is_conversational()
+    assert not StreamingDataset(_write(tmp_path, "[]", name="empty.json"))
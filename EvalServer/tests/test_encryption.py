@@ -0,0 +1,31 @@
+"""
+Tests that API keys encrypted by the backend (Servers/utils/encryption.utils.ts)
+decrypt on the eval server.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from utils.encryption import decrypt
+
+# Produced by the backend's encrypt("sk-test-1234567890") with the e2e ENCRYPTION_KEY
+# and a fixed IV
+BACKEND_CIPHERTEXT = "000102030405060708090a0b0c0d0e0f:14881c6269cb74b768372be9b391dab02fe71817b484c3f5de303fcbba1f36ad"
+
+
+def test_decrypts_backend_ciphertext(monkeypatch):
+    monkeypatch.setenv("ENCRYPTION_KEY", "test-encryption-key-32chars!!")
+    assert decrypt(BACKEND_CIPHERTEXT) == "sk-test-1234567890"
+
+
+def test_wrong_key_does_not_decrypt(monkeypatch):
+    monkeypatch.setenv("ENCRYPTION_KEY", "another-key")
+    with pytest.raises(ValueError):
+        decrypt(BACKEND_CIPHERTEXT)
+
+
+@pytest.mark.parametrize("value", ["", "no-separator", "a:b:c"])
+def test_rejects_malformed_input(value):
+    with pytest.raises(ValueError):
+        decrypt(value)
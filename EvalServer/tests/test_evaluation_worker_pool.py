@@ -0,0 +1,92 @@
+"""
+Tests for the warm evaluation worker pool: crash detection and respawn,
+worker recycling, and the per-job environment restore inside a worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from utils import evaluation_worker_pool as pool_module
+from utils.evaluation_worker_pool import EvaluationWorkerPool, WorkerCrashedError
+
+
+def echo_worker(conn, index):
+    """Stand-in worker process: replies with its pid, or dies when the job asks it to."""
+    while True:
+        job = conn.recv()
+        if job is None:
+            break
+        if job["config"].get("crash"):
+            os._exit(3)
+        conn.send({"ok": True, "error": None, "pid": os.getpid()})
+
+
+@pytest.fixture
+def pool():
+    pool = EvaluationWorkerPool(size=1, max_tasks_per_worker=2, worker_main=echo_worker)
+    yield pool
+    pool.shutdown()
+
+
+def test_crash_raises_and_respawns_a_warm_worker(pool):
+    async def run():
+        first = await pool.run("exp_1", {}, 1)
+        with pytest.raises(WorkerCrashedError, match="exit code 3"):
+            await pool.run("exp_2", {"crash": True}, 1)
+        assert pool._slots[0].alive  # respawned before the error was raised
+        second = await pool.run("exp_3", {}, 1)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first["ok"] and second["ok"]
+    assert first["pid"] != second["pid"]
+
+
+def test_workers_are_recycled_after_max_tasks(pool):
+    async def run():
+        return [(await pool.run(f"exp_{i}", {}, 1))["pid"] for i in range(3)]
+
+    pids = asyncio.run(run())
+    assert pids[0] == pids[1] != pids[2]
+
+
+def test_worker_restores_environment_and_streams_after_each_job(monkeypatch, capsys):
+    seen = []
+
+    async def fake_run_job(job):
+        os.environ["OPENAI_API_KEY"] = f"key-for-{job['experiment_id']}"
+        os.environ.pop("KEEP_ME", None)
+        print("working")
+        seen.append(os.environ["OPENAI_API_KEY"])
+        if job["config"].get("fail"):
+            raise ValueError("judge exploded")
+        return {"error": None}
+
+    monkeypatch.setattr(pool_module, "_run_job", fake_run_job)
+    monkeypatch.setattr(pool_module, "WARM_UP_MODULES", ())
+    monkeypatch.setenv("KEEP_ME", "1")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    parent, child = multiprocessing.Pipe()
+    worker = threading.Thread(target=pool_module._worker_main, args=(child, 0))
+    worker.start()
+    try:
+        parent.send({"experiment_id": "exp_a", "config": {}, "organization_id": 1})
+        ok = parent.recv()
+        parent.send({"experiment_id": "exp_b", "config": {"fail": True}, "organization_id": 1})
+        failed = parent.recv()
+    finally:
+        parent.send(None)
+        worker.join(10)
+
+    assert ok == {"ok": True, "error": None}
+    assert failed == {"ok": False, "error": "judge exploded"}
+    assert seen == ["key-for-exp_a", "key-for-exp_b"]
+    assert "OPENAI_API_KEY" not in os.environ and os.environ["KEEP_ME"] == "1"
+    assert "[eval:exp_a] working" in capsys.readouterr().out
@@ -0,0 +1,145 @@
+"""
+Tests for the bounded, ordered worker pool used by the generation stage.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+
+import pytest
+
+from utils.generation_pool import OrderedWorkerPool, resolve_concurrency
+
+
+class _Tracker:
+    """Worker that sleeps per item and records how many calls run at once."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self.started = []
+        self.finished = []
+        self.cancelled = []
+
+    async def __call__(self, item):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.started.append(item)
+        try:
+            await asyncio.sleep(self.delays[item])
+            if self.delays[item] < 0:
+                raise AssertionError("unreachable")
+            self.finished.append(item)
+            return item * 10
+        except asyncio.CancelledError:
+            self.cancelled.append(item)
+            raise
+        finally:
+            self.active -= 1
+
+
+def test_results_come_back_in_input_order_when_completions_do_not():
+    # Later items finish first
+    delays = {i: 0.05 - i * 0.005 for i in range(10)}
+    worker = _Tracker(delays)
+
+    async def run():
+        async with OrderedWorkerPool(worker, concurrency=5) as pool:
+            return [entry async for entry in pool.results(range(10))]
+
+    results = asyncio.run(run())
+
+    assert results == [(i, i, i * 10) for i in range(10)]
+    assert worker.finished != sorted(worker.finished)
+
+
+@pytest.mark.parametrize("concurrency", [1, 3, 8])
+def test_concurrency_bound_is_never_exceeded(concurrency):
+    rng = random.Random(concurrency)
+    worker = _Tracker({i: rng.uniform(0, 0.01) for i in range(40)})
+
+    async def run():
+        async with OrderedWorkerPool(worker, concurrency=concurrency) as pool:
+            return [result async for _, _, result in pool.results(range(40))]
+
+    assert len(asyncio.run(run())) == 40
+    assert worker.peak == concurrency
+
+
+def test_window_bounds_how_far_ahead_items_are_started():
+    worker = _Tracker({i: 0 for i in range(50)})
+    pulled = []
+
+    def items():
+        for i in range(50):
+            pulled.append(i)
+            yield i
+
+    async def run():
+        async with OrderedWorkerPool(worker, concurrency=2, window=4) as pool:
+            async for idx, _, _ in pool.results(items()):
+                if idx == 0:
+                    await asyncio.sleep(0.01)
+                    return len(pulled)
+
+    # window started items, one more once item 0 was consumed, one pulled and waiting for a slot
+    assert asyncio.run(run()) <= 4 + 2
+
+
+def test_failure_propagates_and_cancels_in_flight_tasks():
+    # Items 0 and 1 succeed, 2 fails, the rest are still running when it does
+    delays = {i: 1.0 for i in range(10)}
+    delays[0] = delays[1] = 0.02
+    delays[2] = 0.01
+
+    async def worker(item):
+        if item == 2:
+            await asyncio.sleep(delays[item])
+            raise ValueError("boom")
+        return await tracker(item)
+
+    tracker = _Tracker(delays)
+    seen = []
+
+    async def run():
+        pool = OrderedWorkerPool(worker, concurrency=4)
+        with pytest.raises(ValueError, match="boom"):
+            async with pool:
+                async for idx, _, _ in pool.results(range(10)):
+                    seen.append(idx)
+        return pool
+
+    pool = asyncio.run(run())
+
+    assert seen == [0, 1]
+    assert pool._tasks == set()
+    assert pool._feeder.done()
+    # Items started alongside the failure were cancelled, not left running
+    assert tracker.cancelled and tracker.active == 0
+    assert not set(tracker.cancelled) & set(tracker.finished)
+
+
+def test_errors_from_the_input_iterator_surface_after_earlier_results():
+    def items():
+        yield 1
+        raise RuntimeError("bad dataset")
+
+    async def worker(item):
+        return item
+
+    async def run():
+        got = []
+        async with OrderedWorkerPool(worker, concurrency=2) as pool:
+            with pytest.raises(RuntimeError, match="bad dataset"):
+                async for _, _, result in pool.results(items()):
+                    got.append(result)
+        return got
+
+    assert asyncio.run(run()) == [1]
+
+
+@pytest.mark.parametrize("value, expected", [("6", 6), (0, 1), (None, 4), ("x", 4)])
+def test_resolve_concurrency(value, expected):
+    assert resolve_concurrency(value, default=4) == expected
@@ -0,0 +1,118 @@
+"""
+Tests for crud.LogWriteBuffer: batching, flush ordering, rollback on a
+failed flush and the column types of buffered rows.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+
+import pytest
+
+from crud.evaluation_logs import LogWriteBuffer
+from tests.fakes import RecordingSession
+
+
+def _buffer(session, batch_size=100):
+    return LogWriteBuffer(session, organization_id=7, project_id="proj", experiment_id="exp_1", batch_size=batch_size)
+
+
+def test_rows_are_queued_until_flush_then_written_in_one_commit():
+    session = RecordingSession()
+    buffer = _buffer(session)
+
+    async def run():
+        log_id = await buffer.add_log(input_text="q", output_text="a", metadata={"k": 1}, created_by=42)
+        await buffer.add_metric("latency", "performance", 12.5, dimensions={"log_id": log_id})
+        assert session.statements == [] and buffer.pending == 2
+        return log_id, await buffer.flush()
+
+    log_id, written = asyncio.run(run())
+
+    assert written == 2 and buffer.pending == 0
+    assert session.commits == 1 and session.rollbacks == 0
+    (log_sql, log_params), (metric_sql, metric_params) = session.statements
+    assert "INSERT INTO llm_evals_logs" in log_sql and "INSERT INTO llm_evals_metrics" in metric_sql
+    assert uuid.UUID(log_params["id_0"]) and log_params["id_0"] == log_id
+    assert json.loads(log_params["metadata_0"]) == {"k": 1}
+    assert json.loads(metric_params["dimensions_0"]) == {"log_id": log_id}
+    assert metric_params["value_0"] == 12.5
+
+
+@pytest.mark.parametrize("created_by, expected", [(42, "42"), (None, None)])
+def test_created_by_is_written_as_text(created_by, expected):
+    # llm_evals_logs.created_by is VARCHAR, as in create_experiment
+    session = RecordingSession()
+    buffer = _buffer(session)
+
+    async def run():
+        await buffer.add_log(input_text="q", created_by=created_by)
+        await buffer.flush()
+
+    asyncio.run(run())
+    assert session.statements[0][1]["created_by_0"] == expected
+
+
+def test_reaching_batch_size_flushes_automatically():
+    session = RecordingSession()
+    buffer = _buffer(session, batch_size=3)
+
+    async def run():
+        for i in range(7):
+            await buffer.add_log(input_text=str(i))
+
+    asyncio.run(run())
+    assert session.commits == 2
+    assert buffer.pending == 1
+    assert [params["input_text_2"] for _, params in session.statements] == ["2", "5"]
+
+
+def test_failed_flush_rolls_back_and_keeps_rows_for_the_next_attempt():
+    fail = {"metrics": True}
+
+    def respond(sql, params):
+        if "llm_evals_metrics" in sql and fail["metrics"]:
+            raise RuntimeError("connection reset")
+
+    session = RecordingSession(respond)
+    buffer = _buffer(session)
+
+    async def run():
+        log_id = await buffer.add_log(input_text="q")
+        await buffer.add_metric("m", "quality", 1.0)
+        with pytest.raises(RuntimeError):
+            await buffer.flush()
+        assert session.rollbacks == 1 and session.commits == 0
+        assert buffer.pending == 2
+
+        fail["metrics"] = False
+        assert await buffer.flush() == 2
+        return log_id
+
+    log_id = asyncio.run(run())
+    assert session.commits == 1 and buffer.pending == 0
+    # The retried flush writes the same rows again (same client-side ids)
+    log_inserts = [params for sql, params in session.statements if "llm_evals_logs" in sql]
+    assert [params["id_0"] for params in log_inserts] == [log_id, log_id]
+
+
+def test_large_flush_is_split_into_multi_row_inserts():
+    session = RecordingSession()
+    buffer = _buffer(session, batch_size=5000)
+
+    async def run():
+        for i in range(2500):
+            await buffer.add_log(input_text=str(i))
+        return await buffer.flush()
+
+    assert asyncio.run(run()) == 2500
+    assert [len([k for k in params if k.startswith("id_")]) for _, params in session.statements] == [1000, 1000, 500]
+    assert session.commits == 1
+
+
+def test_flush_without_rows_touches_nothing():
+    session = RecordingSession()
+    assert asyncio.run(_buffer(session).flush()) == 0
+    assert session.statements == [] and session.commits == 0
@@ -0,0 +1,95 @@
+"""
+Tests for custom scorer verdict caching: parsed labels are cached and reused,
+unparseable judge replies are not.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from utils import run_custom_scorer as scorer_module
+from utils.run_custom_scorer import run_custom_scorer
+
+SCORER = {
+    "id": "scorer-1",
+    "name": "Correctness",
+    "defaultThreshold": 0.5,
+    "config": {
+        "judgeModel": {"name": "gpt-4o-mini", "provider": "openai", "params": {"temperature": 0.0}},
+        "messages": [{"role": "user", "content": "Is {{output}} a correct answer to {{input}}?"}],
+        "choiceScores": [{"label": "PASS", "score": 1.0}, {"label": "FAIL", "score": 0.0}],
+    },
+}
+
+
+class MemoryVerdictCache:
+    def __init__(self):
+        self.entries = {}
+
+    async def aget(self, key):
+        return self.entries.get(key)
+
+    async def aset(self, key, verdict):
+        self.entries[key] = verdict
+
+
+class FakeJudge:
+    """OpenAI-compatible client returning canned replies."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(with_raw_response=SimpleNamespace(create=self._create)))
+
+    def _create(self, **kwargs):
+        self.calls += 1
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=self.replies.pop(0)))],
+            usage=None,
+        )
+        return SimpleNamespace(parse=lambda: response)
+
+
+@pytest.fixture
+def judge(monkeypatch):
+    def install(*replies):
+        fake = FakeJudge(replies)
+        monkeypatch.setattr(scorer_module, "OpenAI", object)
+        monkeypatch.setattr(scorer_module, "get_provider_client", lambda *args, **kwargs: (fake, "sk-test"))
+        return fake
+    return install
+
+
+def _score(cache):
+    return asyncio.run(run_custom_scorer(SCORER, "2 + 2?", "4", verdict_cache=cache))
+
+
+def test_parsed_verdict_is_cached_and_reused(judge):
+    fake = judge('{"verdict": "PASS", "reason": "correct"}')
+    cache = MemoryVerdictCache()
+
+    first = _score(cache)
+    second = _score(cache)
+
+    assert (first.label, first.score, first.passed) == ("PASS", 1.0, True)
+    assert (second.label, second.score, second.reason) == ("PASS", 1.0, "correct")
+    assert fake.calls == 1
+
+
+@pytest.mark.parametrize("reply", ["", "<think>truncated reasoning", "Maybe, hard to say"])
+def test_unparseable_reply_is_not_cached(judge, reply):
+    fake = judge(reply, "PASS")
+    cache = MemoryVerdictCache()
+
+    first = _score(cache)
+    assert first.label not in ("PASS", "FAIL")
+    assert first.score == 0.0
+    assert cache.entries == {}
+
+    # The next run asks the judge again instead of replaying the failure
+    second = _score(cache)
+    assert (second.label, second.score) == ("PASS", 1.0)
+    assert fake.calls == 2
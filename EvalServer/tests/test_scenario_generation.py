@@ -0,0 +1,134 @@
+"""
+Tests for conversational scenario generation: sequential turns with history,
+stop handling and per-scenario fatal errors, also when several scenarios run
+at once on the ordered worker pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.generation_pool import OrderedWorkerPool
+from utils.scenario_generation import build_turn_prompt, clean_response, generate_scenario, split_scenario_turns
+
+
+def test_split_scenario_turns_separates_roles():
+    convo = {"turns": [
+        {"role": "User", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+        {"role": "user", "content": "bye"},
+        {"role": "system", "content": "ignored"},
+    ]}
+    assert split_scenario_turns(convo) == (["hi", "bye"], ["hello"])
+    assert split_scenario_turns({}) == ([], [])
+
+
+def test_prompts_carry_the_conversation_so_far():
+    first = build_turn_prompt([{"role": "user", "content": "hi"}])
+    assert first.endswith("User: hi\n\nAssistant:")
+    assert "Continue" not in first
+
+    later = build_turn_prompt([
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+        {"role": "user", "content": "how are you?"},
+    ])
+    assert "User: hi\nAssistant: hello\nUser: how are you?\n\nAssistant:" in later
+
+
+@pytest.mark.parametrize("raw, cleaned", [
+    ("  Assistant: sure ", "sure"),
+    ("fine", "fine"),
+    ("", "[Model returned empty response]"),
+    (None, "[Model returned empty response]"),
+])
+def test_clean_response(raw, cleaned):
+    assert clean_response(raw) == cleaned
+
+
+def test_turns_are_generated_in_order_with_configured_temperature():
+    calls = []
+
+    def generate_text(prompt, max_tokens, temperature):
+        calls.append((prompt, temperature))
+        return f"reply {len(calls)}"
+
+    result = generate_scenario(["a", "b", "c"], generate_text, temperature=0.0)
+
+    assert result["generated_assistant_turns"] == ["reply 1", "reply 2", "reply 3"]
+    assert result["turn_errors"] == [None, None, None]
+    assert [t.role for t in result["turn_objects"]] == ["user", "assistant"] * 3
+    assert "Assistant: reply 2\nUser: c" in calls[2][0]
+    assert {temperature for _, temperature in calls} == {0.0}
+
+
+def test_stop_event_ends_a_running_scenario():
+    stop = threading.Event()
+
+    def generate_text(prompt, max_tokens, temperature):
+        stop.set()
+        return "ok"
+
+    result = generate_scenario(["a", "b", "c"], generate_text, 0.0, stop)
+    assert result["generated_assistant_turns"] == ["ok"]
+
+
+def test_consecutive_fatal_errors_stop_the_scenario_and_are_reported():
+    def generate_text(prompt, max_tokens, temperature):
+        raise RuntimeError("Invalid API key provided")
+
+    result = generate_scenario(["a", "b", "c", "d"], generate_text, 0.0)
+
+    assert result["turn_errors"] == ["Invalid API key provided"] * 2
+    assert result["generated_assistant_turns"][0].startswith("[Generation error:")
+    assert len(result["generated_assistant_turns"]) == 1
+
+
+def test_non_fatal_errors_do_not_stop_the_scenario():
+    replies = iter([RuntimeError("timeout"), "ok", RuntimeError("timeout")])
+
+    def generate_text(prompt, max_tokens, temperature):
+        reply = next(replies)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    result = generate_scenario(["a", "b", "c"], generate_text, 0.0)
+    assert result["turn_errors"] == ["timeout", None, "timeout"]
+
+
+def test_scenarios_run_concurrently_while_turns_stay_sequential():
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    per_scenario = {}
+
+    def generate_text(prompt, max_tokens, temperature):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        scenario = prompt.split("User: ")[1].split("-")[0]
+        per_scenario.setdefault(scenario, []).append(prompt.count("User: "))
+        return "ok"
+
+    scenarios = [[f"s{i}-t{t}" for t in range(3)] for i in range(4)]
+
+    async def worker(turns):
+        return await asyncio.to_thread(generate_scenario, turns, generate_text, 0.0)
+
+    async def run():
+        async with OrderedWorkerPool(worker, concurrency=4) as pool:
+            return [result async for _, _, result in pool.results(scenarios)]
+
+    results = asyncio.run(run())
+
+    assert len(results) == 4 and all(r["turn_errors"] == [None] * 3 for r in results)
+    assert active["peak"] > 1
+    # Each scenario's turns were generated one after another, with growing history
+    assert all(counts == [1, 2, 3] for counts in per_scenario.values())
@@ -185,23 +185,16 @@ def main() -> int:
         print(f"Evaluation error: {e}")
         return 1
 
-    # After evaluation, run gatekeeper on the latest summary in the output dir
-    output_dir = Path(runtime["output_dir"])
+    # After evaluation, run gatekeeper on the summary this run produced
     suite_path = Path("suits/suite_core.yaml")
-    latest_summary = None
-    try:
-        summaries = list(output_dir.glob("deepeval_summary_*.json"))
-        if summaries:
-            latest_summary = max(summaries, key=lambda p: p.stat().st_mtime)
-    except Exception:
-        latest_summary = None
+    summary = evaluator.last_summary
 
     print("\nPipeline complete.")
     print(f"Saved outputs to: {args.output_dir}")
 
-    if latest_summary and suite_path.is_file():
+    if summary and suite_path.is_file():
         print("\nRunning gatekeeper quality gate...")
-        gate_result = evaluate_gate(summary_path=str(latest_summary), suite_path=str(suite_path.resolve()))
+        gate_result = evaluate_gate(summary_path=None, suite_path=str(suite_path.resolve()), summary=summary)
         status = "PASSED" if gate_result.passed else "FAILED"
         print(f"[Gatekeeper] {status} — checked_metrics={gate_result.checked_metrics}")
         if gate_result.fail_reasons:
@@ -210,8 +203,8 @@ def main() -> int:
                 print(f"  - {r}")
         return 0 if gate_result.passed else 2
     else:
-        if not latest_summary:
-            print("Gatekeeper skipped: no summary file found.")
+        if not summary:
+            print("Gatekeeper skipped: no evaluation summary produced.")
         if not suite_path.is_file():
             print(f"Gatekeeper skipped: suite YAML not found at {suite_path}")
         return 0
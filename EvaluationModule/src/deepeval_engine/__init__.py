@@ -1,8 +1,21 @@
 """DeepEval evaluation engine for comprehensive LLM evaluation."""
 
-from .deepeval_evaluator import DeepEvalEvaluator
-from .evaluation_dataset import EvaluationDataset
-from .model_runner import ModelRunner
+import importlib
 
 __all__ = ["DeepEvalEvaluator", "EvaluationDataset", "ModelRunner"]
 
+_EXPORTS = {
+    "DeepEvalEvaluator": ".deepeval_evaluator",
+    "EvaluationDataset": ".evaluation_dataset",
+    "ModelRunner": ".model_runner",
+}
+
+
+def __getattr__(name):
+    # Resolved lazily so light submodules (rate_limiter, verdict_cache, ...) can be
+    # imported by the API server without pulling in deepeval, torch and transformers
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,188 @@
+"""
+Streaming per-metric aggregates.
+
+Scores are folded into accumulators as each sample is evaluated, so summary
+statistics are available at any point during a run (for progressive
+experiment results) and the final summary does not re-scan every result.
+
+Quantiles are exact while a metric has at most ``exact_limit`` scores. Past
+that they come from a fixed-width histogram whose range starts at [0, 1] (or
+the scores seen so far, if wider - custom scorers can map choices to any
+scale, e.g. 0-10) and doubles whenever a score falls outside it. For scores
+in [0, 1] the default 100 bins are accurate to 0.01; in general to
+(range width / bins).
+"""
+
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_EXACT_LIMIT = 1000
+
+
+class MetricAccumulator:
+    """Count, sum, min, max, pass count and a quantile sketch for one metric."""
+
+    def __init__(self, bins: int = 100, exact_limit: int = DEFAULT_EXACT_LIMIT):
+        self.bins = bins
+        self.exact_limit = exact_limit
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.passed = 0
+        # Scores kept verbatim until exact_limit, then replaced by the histogram
+        self._values: Optional[List[float]] = []
+        self._histogram: List[int] = []
+        self._low = 0.0
+        self._width = 1.0
+
+    def add(self, score: float, passed: bool = False) -> None:
+        score = float(score)
+        self.count += 1
+        self.total += score
+        self.min = score if self.min is None else min(self.min, score)
+        self.max = score if self.max is None else max(self.max, score)
+        if passed:
+            self.passed += 1
+        if self._values is not None:
+            self._values.append(score)
+            if len(self._values) > self.exact_limit:
+                self._start_histogram()
+            return
+        self._cover(score)
+        self._histogram[self._bin(score)] += 1
+
+    def _start_histogram(self) -> None:
+        self._low = min(0.0, self.min)
+        self._width = max(1.0, self.max) - self._low
+        self._histogram = [0] * self.bins
+        for value in self._values:
+            self._histogram[self._bin(value)] += 1
+        self._values = None
+
+    def _bin(self, score: float) -> int:
+        idx = int((score - self._low) / self._width * self.bins)
+        return max(0, min(self.bins - 1, idx))
+
+    def _cover(self, score: float) -> None:
+        """Double the histogram range (towards ``score``) until it contains ``score``."""
+        while not (self._low <= score <= self._low + self._width):
+            old_low, old_width, old = self._low, self._width, self._histogram
+            if score < old_low:
+                self._low -= old_width
+            self._width *= 2
+            self._histogram = [0] * self.bins
+            for idx, bucket in enumerate(old):
+                if bucket:
+                    center = old_low + (idx + 0.5) * old_width / self.bins
+                    self._histogram[self._bin(center)] += bucket
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    @property
+    def pass_rate(self) -> Optional[float]:
+        return self.passed / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        q-quantile (0 <= q <= 1): linearly interpolated between the sorted
+        scores while they are kept, afterwards interpolated within a histogram bin.
+        """
+        if not self.count:
+            return None
+        q = max(0.0, min(1.0, q))
+        if self._values is not None:
+            values = sorted(self._values)
+            position = q * (len(values) - 1)
+            lower = int(position)
+            upper = min(lower + 1, len(values) - 1)
+            return values[lower] + (values[upper] - values[lower]) * (position - lower)
+        target = q * self.count
+        cumulative = 0
+        for idx, bucket in enumerate(self._histogram):
+            if bucket and cumulative + bucket >= target:
+                fraction = (target - cumulative) / bucket
+                value = self._low + (idx + fraction) * self._width / self.bins
+                return max(self.min, min(self.max, value))
+            cumulative += bucket
+        return self.max
+
+    def to_summary(self) -> Dict[str, Any]:
+        """Same shape as DeepEvalEvaluator.generate_summary_dict()'s metric summaries, plus quantiles."""
+        return {
+            "average_score": round(self.mean, 3),
+            "pass_rate": round(self.pass_rate * 100, 1),
+            "min_score": round(self.min, 3),
+            "max_score": round(self.max, 3),
+            "p50_score": round(self.quantile(0.5), 3),
+            "p90_score": round(self.quantile(0.9), 3),
+            "total_evaluated": self.count,
+        }
+
+
+class AggregateTracker:
+    """
+    Thread-safe collection of MetricAccumulators keyed by metric name.
+
+    The evaluator updates it from a worker thread while the server reads
+    snapshots from the event loop.
+    """
+
+    def __init__(self, bins: int = 100):
+        self.bins = bins
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, MetricAccumulator] = {}
+        self.samples = 0
+        self.word_count_total = 0
+        self.response_length_total = 0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics = {}
+            self.samples = 0
+            self.word_count_total = 0
+            self.response_length_total = 0
+
+    def add(self, metric_name: str, score: Any, passed: bool = False) -> None:
+        """Fold one score in; non-numeric scores (skipped or errored metrics) are ignored."""
+        if not isinstance(score, (int, float)) or isinstance(score, bool) or not math.isfinite(score):
+            return
+        with self._lock:
+            acc = self._metrics.get(metric_name)
+            if acc is None:
+                acc = self._metrics[metric_name] = MetricAccumulator(self.bins)
+            acc.add(score, passed)
+
+    def add_result(self, result: Dict[str, Any]) -> None:
+        """Fold in an evaluator result row (its metric_scores and length stats)."""
+        with self._lock:
+            self.samples += 1
+            self.word_count_total += result.get("word_count", 0) or 0
+            self.response_length_total += result.get("response_length", 0) or 0
+        for metric_name, score_data in (result.get("metric_scores") or {}).items():
+            if isinstance(score_data, dict):
+                self.add(metric_name, score_data.get("score"), bool(score_data.get("passed")))
+
+    def add_results(self, results: Iterable[Dict[str, Any]]) -> None:
+        for result in results:
+            self.add_result(result)
+
+    def get(self, metric_name: str) -> Optional[MetricAccumulator]:
+        with self._lock:
+            return self._metrics.get(metric_name)
+
+    def mean(self, metric_name: str) -> Optional[float]:
+        with self._lock:
+            acc = self._metrics.get(metric_name)
+            return acc.mean if acc is not None else None
+
+    def metric_names(self) -> list:
+        with self._lock:
+            return list(self._metrics.keys())
+
+    def metric_summaries(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: acc.to_summary() for name, acc in self._metrics.items() if acc.count}
@@ -0,0 +1,304 @@
+"""
+Provider batch-API execution for large offline runs.
+
+Instead of one interactive request per prompt, all requests are packaged
+into provider batch jobs, polled until they finish and mapped back by
+``custom_id``. Batch jobs are billed at a discount and do not count against
+interactive rate limits; the trade-off is latency (up to the 24h completion
+window).
+
+Supported providers:
+
+- OpenAI Batch API: JSONL upload to ``/files`` (purpose ``batch``), job via
+  ``/batches`` on ``/v1/chat/completions``, results from the output/error files
+- Anthropic Message Batches: ``/v1/messages/batches``, results from the
+  batch's ``results_url``
+
+Everything goes over plain HTTP to a configurable base URL (OPENAI_BASE_URL /
+ANTHROPIC_BASE_URL or the ``base_url`` argument), so the mode can be run
+against a local stand-in server.
+
+Requests are identified by a hash of their body, so a caller that persisted
+the submitted jobs (``on_submit``) can re-attach to them after a restart
+(``jobs``) instead of submitting and paying for the same requests again.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import httpx
+
+BATCH_PROVIDERS = ("openai", "anthropic")
+DEFAULT_POLL_INTERVAL = float(os.getenv("EVAL_BATCH_POLL_INTERVAL", "30"))
+DEFAULT_TIMEOUT = float(os.getenv("EVAL_BATCH_TIMEOUT", str(25 * 3600)))
+# Provider limits are 50k (OpenAI) and 100k (Anthropic) requests per batch
+MAX_REQUESTS_PER_BATCH = 50_000
+
+OPENAI_TERMINAL = ("completed", "failed", "expired", "cancelled")
+ANTHROPIC_API_VERSION = "2023-06-01"
+
+
+class BatchJobError(RuntimeError):
+    """A batch job could not be created or failed as a whole."""
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one request in a batch: generated text or an error message."""
+    custom_id: str
+    text: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _openai_text(body: Dict[str, Any]) -> str:
+    return ((body.get("choices") or [{}])[0].get("message") or {}).get("content") or ""
+
+
+def _anthropic_text(message: Dict[str, Any]) -> str:
+    return "".join(
+        block.get("text", "") for block in message.get("content") or [] if block.get("type") == "text"
+    )
+
+
+def _jsonl(lines: Sequence[Dict[str, Any]]) -> bytes:
+    return "\n".join(json.dumps(line) for line in lines).encode("utf-8")
+
+
+def _parse_jsonl(text: str) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def request_id(body: Dict[str, Any]) -> str:
+    """Batch ``custom_id`` of a request body (identical bodies share one request)."""
+    digest = hashlib.sha256(json.dumps(body, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+    return f"req-{digest[:32]}"
+
+
+class ProviderBatchRunner:
+    """
+    Runs a list of provider-native request bodies (chat.completions params
+    for OpenAI, messages params for Anthropic) as batch jobs.
+
+    ``on_poll(status, done, total)`` is called after every status check.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_TIMEOUT,
+        on_poll: Optional[Callable[[str, int, int], None]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.provider = provider.lower()
+        if self.provider not in BATCH_PROVIDERS:
+            raise ValueError(f"Batch execution is not supported for provider: {provider}")
+        if self.provider == "openai":
+            self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+            self.base_url = (base_url or os.getenv("OPENAI_BASE_URL") or "https://api.openai.com/v1").rstrip("/")
+        else:
+            self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+            self.base_url = (base_url or os.getenv("ANTHROPIC_BASE_URL") or "https://api.anthropic.com").rstrip("/")
+        if not self.api_key:
+            raise ValueError(f"No API key configured for {self.provider} batch execution")
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.on_poll = on_poll
+        # Custom HTTP transport (e.g. an in-process stand-in server in tests)
+        self.transport = transport
+
+    def _headers(self) -> Dict[str, str]:
+        if self.provider == "openai":
+            return {"Authorization": f"Bearer {self.api_key}"}
+        return {"x-api-key": self.api_key, "anthropic-version": ANTHROPIC_API_VERSION}
+
+    async def arun(
+        self,
+        bodies: Sequence[Dict[str, Any]],
+        jobs: Optional[Sequence[Dict[str, Any]]] = None,
+        on_submit: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+    ) -> List[BatchResult]:
+        """
+        Run every body and return results in input order.
+
+        ``jobs`` are batch jobs submitted earlier for (some of) these requests,
+        as passed to ``on_submit``; they are polled and their successful results
+        reused, and only the remaining requests are submitted. ``on_submit(jobs)``
+        (sync or async) receives every newly created job as soon as it exists,
+        so callers can persist it before the long wait.
+        """
+        ids = [request_id(body) for body in bodies]
+        unique = dict(zip(ids, bodies))
+        submit = self._submit_openai if self.provider == "openai" else self._submit_anthropic
+        collect = self._collect_openai if self.provider == "openai" else self._collect_anthropic
+
+        merged: Dict[str, BatchResult] = {}
+        async with httpx.AsyncClient(
+            headers=self._headers(), timeout=httpx.Timeout(120.0), transport=self.transport
+        ) as client:
+            previous = [job for job in jobs or [] if job.get("provider") == self.provider and job.get("id")]
+            if previous:
+                print(f"🔗 Re-attaching to {len(previous)} earlier {self.provider} batch job(s)")
+                for results in await asyncio.gather(*(self._reattach(client, collect, job["id"]) for job in previous)):
+                    merged.update({cid: r for cid, r in results.items() if cid in unique and r.error is None})
+
+            missing = [(cid, body) for cid, body in unique.items() if cid not in merged]
+            chunks = [missing[i:i + MAX_REQUESTS_PER_BATCH] for i in range(0, len(missing), MAX_REQUESTS_PER_BATCH)]
+            if chunks:
+                batch_ids = await asyncio.gather(*(submit(client, chunk) for chunk in chunks))
+                if on_submit is not None:
+                    submitted = on_submit([
+                        {"provider": self.provider, "id": batch_id, "requests": len(chunk)}
+                        for batch_id, chunk in zip(batch_ids, chunks)
+                    ])
+                    if inspect.isawaitable(submitted):
+                        await submitted
+                for results in await asyncio.gather(*(
+                    collect(client, batch_id, [cid for cid, _ in chunk])
+                    for batch_id, chunk in zip(batch_ids, chunks)
+                )):
+                    merged.update(results)
+
+        return [merged.get(cid) or BatchResult(cid, error="missing from batch output") for cid in ids]
+
+    async def _reattach(self, client: httpx.AsyncClient, collect, batch_id: str) -> Dict[str, BatchResult]:
+        try:
+            return await collect(client, batch_id, None)
+        except Exception as e:
+            # Expired, deleted or failed: its requests are simply submitted again
+            print(f"⚠️ Could not re-attach to {self.provider} batch {batch_id}: {e}")
+            return {}
+
+    def run(self, bodies: Sequence[Dict[str, Any]]) -> List[BatchResult]:
+        """Blocking wrapper around ``arun`` for synchronous callers."""
+        return asyncio.run(self.arun(bodies))
+
+    async def _poll(self, client: httpx.AsyncClient, url: str, is_done: Callable[[Dict[str, Any]], bool], progress) -> Dict[str, Any]:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            response = await client.get(url)
+            response.raise_for_status()
+            job = response.json()
+            if self.on_poll is not None:
+                self.on_poll(*progress(job))
+            if is_done(job):
+                return job
+            if time.monotonic() > deadline:
+                raise BatchJobError(f"Batch job did not finish within {self.timeout:.0f}s: {url}")
+            await asyncio.sleep(self.poll_interval)
+
+    # --- OpenAI ------------------------------------------------------------
+
+    async def _submit_openai(self, client: httpx.AsyncClient, items) -> str:
+        lines = [
+            {"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body}
+            for custom_id, body in items
+        ]
+        upload = await client.post(
+            f"{self.base_url}/files",
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", _jsonl(lines), "application/jsonl")},
+        )
+        upload.raise_for_status()
+        created = await client.post(
+            f"{self.base_url}/batches",
+            json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+        )
+        created.raise_for_status()
+        return created.json()["id"]
+
+    async def _collect_openai(
+        self, client: httpx.AsyncClient, batch_id: str, custom_ids: Optional[List[str]]
+    ) -> Dict[str, BatchResult]:
+        def progress(job):
+            counts = job.get("request_counts") or {}
+            total = counts.get("total") or len(custom_ids or [])
+            return job.get("status", ""), counts.get("completed", 0) + counts.get("failed", 0), total
+
+        job = await self._poll(
+            client,
+            f"{self.base_url}/batches/{batch_id}",
+            lambda j: j.get("status") in OPENAI_TERMINAL,
+            progress,
+        )
+        if job.get("status") == "failed":
+            errors = (job.get("errors") or {}).get("data") or []
+            detail = "; ".join(e.get("message", "") for e in errors) or "unknown error"
+            raise BatchJobError(f"OpenAI batch {batch_id} failed: {detail}")
+
+        results: Dict[str, BatchResult] = {}
+        for file_key in ("output_file_id", "error_file_id"):
+            file_id = job.get(file_key)
+            if not file_id:
+                continue
+            content = await client.get(f"{self.base_url}/files/{file_id}/content")
+            content.raise_for_status()
+            for line in _parse_jsonl(content.text):
+                custom_id = line.get("custom_id")
+                response = line.get("response") or {}
+                body = response.get("body") or {}
+                if line.get("error") or response.get("status_code", 200) != 200:
+                    error = line.get("error") or body.get("error") or {}
+                    results[custom_id] = BatchResult(custom_id, error=error.get("message") or json.dumps(error))
+                else:
+                    results[custom_id] = BatchResult(custom_id, text=_openai_text(body))
+        if job.get("status") != "completed":
+            for custom_id in custom_ids or []:
+                results.setdefault(custom_id, BatchResult(custom_id, error=f"batch {job.get('status')}"))
+        return results
+
+    # --- Anthropic ---------------------------------------------------------
+
+    async def _submit_anthropic(self, client: httpx.AsyncClient, items) -> str:
+        created = await client.post(
+            f"{self.base_url}/v1/messages/batches",
+            json={"requests": [{"custom_id": custom_id, "params": body} for custom_id, body in items]},
+        )
+        created.raise_for_status()
+        return created.json()["id"]
+
+    async def _collect_anthropic(
+        self, client: httpx.AsyncClient, batch_id: str, custom_ids: Optional[List[str]]
+    ) -> Dict[str, BatchResult]:
+        def progress(job):
+            counts = job.get("request_counts") or {}
+            done = sum(counts.get(k, 0) for k in ("succeeded", "errored", "canceled", "expired"))
+            return job.get("processing_status", ""), done, len(custom_ids) if custom_ids else done + counts.get("processing", 0)
+
+        job = await self._poll(
+            client,
+            f"{self.base_url}/v1/messages/batches/{batch_id}",
+            lambda j: j.get("processing_status") == "ended",
+            progress,
+        )
+        results_url = job.get("results_url")
+        if not results_url:
+            raise BatchJobError(f"Anthropic batch {batch_id} ended without results")
+        content = await client.get(results_url)
+        content.raise_for_status()
+
+        results: Dict[str, BatchResult] = {}
+        for line in _parse_jsonl(content.text):
+            custom_id = line.get("custom_id")
+            result = line.get("result") or {}
+            if result.get("type") == "succeeded":
+                results[custom_id] = BatchResult(custom_id, text=_anthropic_text(result.get("message") or {}))
+            else:
+                error = (result.get("error") or {}).get("error") or result.get("error") or {}
+                results[custom_id] = BatchResult(
+                    custom_id,
+                    error=error.get("message") if isinstance(error, dict) and error.get("message") else result.get("type", "errored"),
+                )
+        return results
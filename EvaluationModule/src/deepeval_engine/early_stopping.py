@@ -0,0 +1,135 @@
+"""
+Sequential early stopping for quality-gated evaluations.
+
+When an experiment only needs to pass or fail the suite thresholds, samples
+are judged in random order and every gated metric keeps a confidence
+sequence for its mean score. As soon as each metric's interval lies entirely
+on one side of its threshold, further judging cannot change the gate
+decision (at the configured confidence) and the run can stop.
+
+Scores are bounded in [0, 1], so the interval is a Hoeffding bound made
+valid at every sample count by spending alpha_n = alpha / (n (n + 1)) at
+step n (these sum to alpha), with alpha split evenly across gated metrics.
+Hoeffding's inequality also holds when sampling without replacement, so the
+bound is valid for the mean over the whole (finite) dataset.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+PASS = "pass"
+FAIL = "fail"
+UNDECIDED = "undecided"
+
+
+@dataclass
+class MetricBound:
+    """Running mean and anytime-valid confidence interval for one gated metric."""
+    threshold: float
+    comparison: str = "gte"
+    n: int = 0
+    total: float = 0.0
+    lower: float = 0.0
+    upper: float = 1.0
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.n if self.n else None
+
+    def update(self, score: float, alpha: float) -> None:
+        self.n += 1
+        self.total += max(0.0, min(1.0, float(score)))
+        alpha_n = alpha / (self.n * (self.n + 1))
+        radius = math.sqrt(math.log(2.0 / alpha_n) / (2.0 * self.n))
+        self.lower = max(0.0, self.mean - radius)
+        self.upper = min(1.0, self.mean + radius)
+
+    @property
+    def decision(self) -> str:
+        if self.comparison == "lte":
+            if self.upper <= self.threshold:
+                return PASS
+            if self.lower > self.threshold:
+                return FAIL
+        else:
+            if self.lower >= self.threshold:
+                return PASS
+            if self.upper < self.threshold:
+                return FAIL
+        return UNDECIDED
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "threshold": self.threshold,
+            "comparison": self.comparison,
+            "samples": self.n,
+            "mean": round(self.mean, 4) if self.mean is not None else None,
+            "lower": round(self.lower, 4),
+            "upper": round(self.upper, 4),
+            "decision": self.decision,
+        }
+
+
+@dataclass
+class SequentialGateMonitor:
+    """
+    Tracks gated metrics over a randomly ordered stream of results.
+
+    Only metrics that actually produce scores are considered (the gate skips
+    metrics that were not run). ``settled`` becomes true once at least
+    ``min_samples`` results were seen and every observed gated metric has a
+    pass/fail decision.
+    """
+    thresholds: Dict[str, Tuple[float, str]]
+    confidence: float = 0.95
+    min_samples: int = 20
+    bounds: Dict[str, MetricBound] = field(default_factory=dict)
+    samples_seen: int = 0
+    stopped_early: bool = False
+    total_samples: Optional[int] = None
+
+    @property
+    def alpha(self) -> float:
+        # Bonferroni split across gated metrics keeps the joint error at 1 - confidence
+        return (1.0 - self.confidence) / max(1, len(self.thresholds))
+
+    def restrict(self, metric_names) -> None:
+        """
+        Limit gating to metrics that will actually be computed (before any
+        update), so alpha is not split across metrics that never report.
+        """
+        if self.samples_seen == 0:
+            self.thresholds = {k: v for k, v in self.thresholds.items() if k in set(metric_names)}
+
+    def update(self, metric_scores: Dict[str, Any]) -> None:
+        """Fold in one result's metric_scores ({name: {"score": ...}})."""
+        self.samples_seen += 1
+        for metric_name, score_data in (metric_scores or {}).items():
+            if metric_name not in self.thresholds or not isinstance(score_data, dict):
+                continue
+            score = score_data.get("score")
+            if not isinstance(score, (int, float)) or isinstance(score, bool):
+                continue
+            bound = self.bounds.get(metric_name)
+            if bound is None:
+                threshold, comparison = self.thresholds[metric_name]
+                bound = self.bounds[metric_name] = MetricBound(threshold=threshold, comparison=comparison)
+            bound.update(score, self.alpha)
+
+    @property
+    def settled(self) -> bool:
+        if self.samples_seen < self.min_samples or not self.bounds:
+            return False
+        return all(bound.decision != UNDECIDED for bound in self.bounds.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "enabled": True,
+            "stopped_early": self.stopped_early,
+            "samples_evaluated": self.samples_seen,
+            "total_samples": self.total_samples,
+            "confidence": self.confidence,
+            "min_samples": self.min_samples,
+            "metrics": {name: bound.to_dict() for name, bound in self.bounds.items()},
+        }
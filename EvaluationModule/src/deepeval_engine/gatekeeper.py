@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -34,14 +35,39 @@ def _load_summary(summary_path: str) -> Dict[str, Any]:
         return json.load(f)
 
 
+# Parsed suite files keyed by path, invalidated when the file's mtime changes
+_suite_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
 def _load_suite_yaml(suite_path: str) -> Dict[str, Any]:
     if yaml is None:
         raise RuntimeError("PyYAML is not installed. Please install pyyaml to use the gatekeeper.")
+    mtime_ns = os.stat(suite_path).st_mtime_ns
+    cached = _suite_cache.get(suite_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
     with open(suite_path, "r", encoding="utf-8") as f:
         content: Dict[str, Any] = yaml.safe_load(f) or {}
+    _suite_cache[suite_path] = (mtime_ns, content)
     return content
 
 
+def load_gate_thresholds(suite_path: str) -> Dict[str, Tuple[float, str]]:
+    """
+    Gated metrics of a suite as {metric_name: (average_score threshold, comparison)}.
+    Metrics without an average_score threshold are not gated and are omitted.
+    """
+    suite = _load_suite_yaml(suite_path)
+    gated: Dict[str, Tuple[float, str]] = {}
+    for metric_name, cfg in (suite.get("metrics", {}) or {}).items():
+        threshold = ((cfg or {}).get("thresholds", {}) or {}).get("average_score")
+        if threshold is None:
+            continue
+        comparison = (cfg or {}).get("comparison", "gte")
+        gated[metric_name] = (float(threshold), comparison if comparison in ("gte", "lte") else "gte")
+    return gated
+
+
 def _compare_value(
     metric_name: str,
     stat_name: str,
@@ -67,15 +93,21 @@ def _compare_value(
 
 
 def evaluate_gate(
-    summary_path: str,
+    summary_path: Optional[str],
     suite_path: str,
+    summary: Optional[Dict[str, Any]] = None,
 ) -> GateResult:
     """
-    Evaluate the gate based on the DeepEval summary JSON and suite thresholds YAML.
+    Evaluate the gate based on the DeepEval summary and suite thresholds YAML.
+    - The summary is either passed in memory (``summary``, as returned by
+      DeepEvalEvaluator.generate_summary_dict) or read from ``summary_path``.
     - Skips any threshold entries that are null/missing.
     - Defaults comparison to 'gte' unless overridden per metric in YAML.
     """
-    summary = _load_summary(summary_path)
+    if summary is None:
+        if not summary_path:
+            raise ValueError("evaluate_gate requires either a summary dict or a summary_path")
+        summary = _load_summary(summary_path)
     suite = _load_suite_yaml(suite_path)
 
     metric_summaries: Dict[str, Any] = summary.get("metric_summaries", {}) or {}
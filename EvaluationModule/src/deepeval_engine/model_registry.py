@@ -0,0 +1,188 @@
+"""
+Process-level registry of loaded local (HuggingFace) models.
+
+Loading tokenizer and weights from disk dominates the start-up of local-model
+experiments. Long-lived evaluation workers keep recently used models resident
+here, keyed by (model name, device), and evict the least recently used ones
+when their total size exceeds EVAL_LOCAL_MODEL_CACHE_BYTES (default 8 GiB;
+0 disables caching). A model larger than the whole budget is still loaded
+but not kept resident.
+"""
+
+import gc
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MEMORY_BUDGET_BYTES = int(os.getenv("EVAL_LOCAL_MODEL_CACHE_BYTES", str(8 * 1024 ** 3)))
+
+
+def model_size_bytes(model: Any) -> int:
+    """Bytes held by a torch module's parameters and buffers (0 if it is not one)."""
+    total = 0
+    for getter in ("parameters", "buffers"):
+        tensors = getattr(model, getter, None)
+        if tensors is None:
+            continue
+        for tensor in tensors():
+            total += tensor.numel() * tensor.element_size()
+    return total
+
+
+def _release_memory() -> None:
+    gc.collect()
+    try:
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except ImportError:
+        pass
+
+
+@dataclass
+class LoadedModel:
+    """A resident model, its tokenizer and bookkeeping for the registry stats."""
+    key: Hashable
+    model: Any
+    tokenizer: Any
+    size_bytes: int
+    load_seconds: float
+    hits: int = 0
+
+
+class _PendingLoad:
+    """A load in progress; threads asking for the same key wait for its result."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.entry: Optional[LoadedModel] = None
+
+
+class ModelRegistry:
+    """
+    Thread-safe LRU of loaded models under a memory budget.
+
+    Concurrent requests for the same model wait for a single load instead of
+    loading it twice, and share its result even when the model is too large
+    to stay resident. If the load fails, the next waiter tries it again.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries: "OrderedDict[Hashable, LoadedModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: Dict[Hashable, _PendingLoad] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _lookup(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.hits += 1
+                self.hits += 1
+            return entry
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Tuple[Any, Any]],
+    ) -> Tuple[LoadedModel, bool]:
+        """
+        Return ``(entry, cache_hit)`` for ``key``, calling ``loader()`` (which
+        returns ``(model, tokenizer)``) on a miss.
+        """
+        while True:
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry, True
+            with self._lock:
+                if key in self._entries:
+                    continue  # loaded by another thread since the lookup
+                pending = self._loading.get(key)
+                if pending is None:
+                    pending = self._loading[key] = _PendingLoad()
+                    break
+            pending.done.wait()
+            if pending.entry is not None:
+                with self._lock:
+                    pending.entry.hits += 1
+                    self.hits += 1
+                return pending.entry, True
+
+        try:
+            start = time.perf_counter()
+            model, tokenizer = loader()
+            entry = LoadedModel(
+                key=key,
+                model=model,
+                tokenizer=tokenizer,
+                size_bytes=model_size_bytes(model),
+                load_seconds=time.perf_counter() - start,
+            )
+            with self._lock:
+                self.misses += 1
+                # A model larger than the whole budget is used but not kept, so it
+                # does not flush everything else out
+                if self.budget_bytes > 0 and entry.size_bytes <= self.budget_bytes:
+                    self._entries[key] = entry
+                    evicted = self._evict_to_budget(keep=key)
+                else:
+                    evicted = 0
+            pending.entry = entry
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            pending.done.set()
+        if evicted:
+            _release_memory()
+        return entry, False
+
+    def _evict_to_budget(self, keep: Hashable) -> int:
+        evicted = 0
+        total = sum(e.size_bytes for e in self._entries.values())
+        for key in list(self._entries.keys()):
+            if total <= self.budget_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self._entries.pop(key).size_bytes
+            evicted += 1
+        self.evictions += evicted
+        return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        _release_memory()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "budget_bytes": self.budget_bytes,
+                "resident_bytes": sum(e.size_bytes for e in self._entries.values()),
+                "models": [
+                    {
+                        "key": list(e.key) if isinstance(e.key, tuple) else e.key,
+                        "size_mb": round(e.size_bytes / (1024 ** 2), 1),
+                        "load_seconds": round(e.load_seconds, 2),
+                        "hits": e.hits,
+                    }
+                    for e in self._entries.values()
+                ],
+            }
+
+
+_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    return _registry
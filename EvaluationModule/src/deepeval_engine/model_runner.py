@@ -5,11 +5,134 @@ Generates responses from language models for evaluation prompts.
 """
 
 import os
-import time
-from typing import Optional, Dict, Any
+import asyncio
+import inspect
+import threading
+import weakref
+from typing import Optional, Dict, Any, List, Tuple
 from transformers import AutoTokenizer, AutoModelForCausalLM
 import torch
 
+from .batch_runner import BATCH_PROVIDERS, BatchResult, ProviderBatchRunner
+from .model_registry import get_model_registry
+from .ollama_support import KEEP_ALIVE as OLLAMA_KEEP_ALIVE, OllamaAsyncPool
+from .rate_limiter import acall_with_rate_limit, call_with_rate_limit, get_rate_limiter
+
+# Providers served locally; calls to these are not rate limited
+LOCAL_PROVIDERS = ("huggingface", "ollama")
+
+# Prompts per forward pass for local HuggingFace models
+DEFAULT_HF_BATCH_SIZE = int(os.getenv("EVAL_HF_BATCH_SIZE", "8"))
+# Async callers are collected for up to this many batches before length bucketing
+HF_BUCKET_WINDOW = 4
+
+# Providers that take a separate system prompt; the others get it prepended to the prompt
+SYSTEM_PROMPT_PROVIDERS = ("openai", "anthropic", "mistral", "openrouter")
+
+
+def _usage_field(usage: Any, name: str) -> int:
+    value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+    return int(value or 0)
+
+
+def prompt_cache_usage(usage: Any) -> Tuple[int, int, int]:
+    """
+    ``(prompt_tokens, cached_tokens, cache_write_tokens)`` from a provider usage
+    object (OpenAI-style ``prompt_tokens_details.cached_tokens`` or Anthropic
+    ``cache_read_input_tokens`` / ``cache_creation_input_tokens``).
+    """
+    if usage is None:
+        return 0, 0, 0
+    if _usage_field(usage, "input_tokens") or _usage_field(usage, "cache_read_input_tokens"):
+        # Anthropic: input_tokens only counts the uncached part of the prompt
+        cached = _usage_field(usage, "cache_read_input_tokens")
+        written = _usage_field(usage, "cache_creation_input_tokens")
+        return _usage_field(usage, "input_tokens") + cached + written, cached, written
+    details = usage.get("prompt_tokens_details") if isinstance(usage, dict) else getattr(usage, "prompt_tokens_details", None)
+    cached = _usage_field(details, "cached_tokens") if details is not None else 0
+    return _usage_field(usage, "prompt_tokens"), cached, 0
+
+
+async def _aclose_client(client: Any) -> None:
+    """Close a provider async client, whichever close protocol its SDK implements."""
+    for name in ("aclose", "close"):
+        close = getattr(client, name, None)
+        if callable(close):
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+            return
+    if hasattr(client, "__aexit__"):
+        await client.__aexit__(None, None, None)
+
+
+class _HuggingFaceMicroBatcher:
+    """
+    Collects concurrent ``agenerate`` calls for a local model and serves them
+    with ``generate_batch``.
+
+    Requests are flushed once ``max_pending`` are waiting or ``max_wait``
+    seconds after the first one arrives; requests with identical sampling
+    settings share a flush, and flushes run one at a time since the model
+    instance is shared.
+    """
+
+    def __init__(self, runner: "ModelRunner", max_pending: int, max_wait: float = 0.05):
+        self.runner = runner
+        self.max_pending = max(1, max_pending)
+        self.max_wait = max_wait
+        self._pending: Dict[Tuple[int, float, Optional[float]], List[Tuple[str, asyncio.Future]]] = {}
+        self._pending_count = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._model_lock = asyncio.Lock()
+        self._tasks: set = set()
+
+    async def generate(self, prompt: str, max_tokens: int, temperature: float, top_p: Optional[float]) -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault((max_tokens, temperature, top_p), []).append((prompt, future))
+        self._pending_count += 1
+        if self._pending_count >= self.max_pending:
+            self._schedule_flush(loop, 0)
+        elif self._flush_handle is None:
+            self._schedule_flush(loop, self.max_wait)
+        return await future
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop, delay: float) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = loop.call_later(delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        pending, self._pending, self._pending_count = self._pending, {}, 0
+        task = asyncio.get_running_loop().create_task(self._flush(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, pending) -> None:
+        async with self._model_lock:
+            for (max_tokens, temperature, top_p), entries in pending.items():
+                entries = [(prompt, future) for prompt, future in entries if not future.done()]
+                if not entries:
+                    continue
+                try:
+                    responses = await asyncio.to_thread(
+                        self.runner.generate_batch,
+                        [prompt for prompt, _ in entries],
+                        max_tokens,
+                        temperature,
+                        top_p,
+                    )
+                except Exception as e:
+                    for _, future in entries:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                for (_, future), response in zip(entries, responses):
+                    if not future.done():
+                        future.set_result(response)
+
 
 class ModelRunner:
     """
@@ -22,7 +145,8 @@ class ModelRunner:
         self,
         model_name: str = "TinyLlama/TinyLlama-1.1B-Chat-v1.0",
         provider: str = "huggingface",
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        batch_size: Optional[int] = None,
     ):
         """
         Initialize model runner.
@@ -31,9 +155,12 @@ class ModelRunner:
             model_name: Name of the model (HuggingFace model ID, OpenAI model name, etc.)
             provider: Provider type ("huggingface", "openai", "ollama")
             device: Device to run on ("cpu", "cuda", "mps"). Auto-detected if None.
+            batch_size: Prompts per forward pass for HuggingFace models
+                (default EVAL_HF_BATCH_SIZE)
         """
         self.model_name = model_name
         self.provider = provider.lower()
+        self.batch_size = max(1, int(batch_size or DEFAULT_HF_BATCH_SIZE))
         
         if device is None:
             if torch.cuda.is_available():
@@ -47,6 +174,15 @@ class ModelRunner:
         
         self.model = None
         self.tokenizer = None
+        # Shared with every other caller using the same provider and API key
+        self.rate_limiter = None if self.provider in LOCAL_PROVIDERS else get_rate_limiter(self.provider)
+        # Async clients hold connection pools bound to an event loop: one per loop, reused across calls
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+        # Provider prompt-cache accounting (see prompt_cache_stats)
+        self._usage_lock = threading.Lock()
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        self.cache_write_tokens = 0
         
         if self.provider == "huggingface":
             self._load_huggingface_model()
@@ -69,14 +205,18 @@ class ModelRunner:
         
         print(f"✓ Model runner initialized: {model_name} on {self.device}")
 
-    def _retry_with_backoff(self, func, max_retries=3, base_delay=2):
+    def _retry_with_backoff(self, func, max_retries=3):
         """
-        Retry a function with exponential backoff on rate limit errors.
+        Run a provider call through the shared adaptive rate limiter.
+
+        The call waits for a token first; rate limit errors (429) slow the
+        limiter down and are retried after the provider's Retry-After (or a
+        short backoff). When ``func`` returns a raw SDK response, its
+        rate-limit headers tune the limiter.
 
         Args:
             func: Function to execute (should take no arguments, use lambda if needed)
             max_retries: Maximum number of retries (default: 3)
-            base_delay: Base delay in seconds for exponential backoff (default: 2)
 
         Returns:
             Result from the function
@@ -84,38 +224,42 @@ class ModelRunner:
         Raises:
             Exception: Re-raises the last exception if all retries fail
         """
-        for attempt in range(max_retries + 1):
-            try:
-                return func()
-            except Exception as e:
-                error_str = str(e)
-                # Check if it's a rate limit error (Status 429 or rate limit message)
-                is_rate_limit = "429" in error_str or "rate limit" in error_str.lower()
-
-                if is_rate_limit and attempt < max_retries:
-                    # Exponential backoff: 2s, 4s, 8s
-                    delay = base_delay * (2 ** attempt)
-                    print(f"⏳ Rate limit hit. Retrying in {delay}s... (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(delay)
-                else:
-                    # Not a rate limit error, or we've exhausted retries
-                    raise
+        return call_with_rate_limit(self.rate_limiter, func, max_retries=max_retries)
 
     def _load_huggingface_model(self):
-        """Load HuggingFace model."""
+        """Load HuggingFace model (reusing a resident copy from the process model registry)."""
+        entry, cache_hit = get_model_registry().get_or_load(
+            (self.model_name, self.device),
+            self._load_huggingface_weights,
+        )
+        self.model = entry.model
+        self.tokenizer = entry.tokenizer
+        if cache_hit:
+            print(f"♻️  Reusing loaded HuggingFace model: {self.model_name} (loaded in {entry.load_seconds:.1f}s, {entry.hits} reuses)")
+        else:
+            print(f"✓ Loaded HuggingFace model in {entry.load_seconds:.1f}s ({entry.size_bytes / 1024 ** 2:.0f} MB)")
+
+    def _load_huggingface_weights(self):
+        """Load tokenizer and weights from disk."""
         print(f"Loading HuggingFace model: {self.model_name}...")
         
-        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-        self.model = AutoModelForCausalLM.from_pretrained(
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        # Decoder-only models must be left-padded for batched generation so every
+        # prompt ends right where its generated tokens begin
+        tokenizer.padding_side = "left"
+        if tokenizer.pad_token is None:
+            tokenizer.pad_token = tokenizer.eos_token
+        model = AutoModelForCausalLM.from_pretrained(
             self.model_name,
             torch_dtype=torch.float16 if self.device in ["cuda", "mps"] else torch.float32,
             device_map="auto" if self.device == "cuda" else None,
         )
         
         if self.device != "cuda":
-            self.model = self.model.to(self.device)
+            model = model.to(self.device)
         
-        self.model.eval()
+        model.eval()
+        return model, tokenizer
     
     def _setup_openai(self):
         """Setup OpenAI API."""
@@ -213,6 +357,7 @@ class ModelRunner:
         max_tokens: int = 500,
         temperature: float = 0.7,
         top_p: Optional[float] = None,
+        system: Optional[str] = None,
     ) -> str:
         """
         Generate a response to the given prompt.
@@ -222,26 +367,30 @@ class ModelRunner:
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
             top_p: Nucleus sampling parameter
+            system: Optional static system prompt. Sent ahead of the prompt so
+                providers can serve it from their prompt cache (marked with
+                ``cache_control`` for Anthropic)
             
         Returns:
             Generated response text
         """
+        prompt, system = self._split_system(prompt, system)
         if self.provider == "huggingface":
             return self._generate_huggingface(prompt, max_tokens, temperature, top_p)
         elif self.provider == "openai":
-            return self._generate_openai(prompt, max_tokens, temperature, top_p)
+            return self._generate_openai(prompt, max_tokens, temperature, top_p, system)
         elif self.provider == "anthropic":
-            return self._generate_anthropic(prompt, max_tokens, temperature, top_p)
+            return self._generate_anthropic(prompt, max_tokens, temperature, top_p, system)
         elif self.provider == "google":
             return self._generate_google(prompt, max_tokens, temperature, top_p)
         elif self.provider == "xai":
             return self._generate_xai(prompt, max_tokens, temperature, top_p)
         elif self.provider == "mistral":
-            return self._generate_mistral(prompt, max_tokens, temperature, top_p)
+            return self._generate_mistral(prompt, max_tokens, temperature, top_p, system)
         elif self.provider == "ollama":
             return self._generate_ollama(prompt, max_tokens, temperature, top_p)
         elif self.provider == "openrouter":
-            return self._generate_openrouter(prompt, max_tokens, temperature, top_p)
+            return self._generate_openrouter(prompt, max_tokens, temperature, top_p, system)
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
     
@@ -253,23 +402,56 @@ class ModelRunner:
         top_p: float,
     ) -> str:
         """Generate using HuggingFace model."""
-        inputs = self.tokenizer(prompt, return_tensors="pt").to(self.device)
-        
-        with torch.no_grad():
-            outputs = self.model.generate(
-                **inputs,
-                max_new_tokens=max_tokens,
-                temperature=temperature,
-                top_p=top_p,
-                do_sample=True,
-                pad_token_id=self.tokenizer.eos_token_id,
-            )
-        
-        # Decode only the generated tokens (skip the input)
-        generated_tokens = outputs[0][inputs['input_ids'].shape[1]:]
-        response = self.tokenizer.decode(generated_tokens, skip_special_tokens=True)
-        
-        return response.strip()
+        return self._generate_huggingface_batch([prompt], max_tokens, temperature, top_p)[0]
+
+    def _generate_huggingface_batch(
+        self,
+        prompts: List[str],
+        max_tokens: int,
+        temperature: float,
+        top_p: Optional[float],
+        batch_size: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Generate with a HuggingFace model in padded, length-bucketed batches.
+
+        Prompts are sorted by token length and split into batches of
+        ``batch_size`` so each batch pads to similar lengths; responses are
+        returned in input order.
+        """
+        batch_size = max(1, int(batch_size or self.batch_size))
+        lengths = [len(ids) for ids in self.tokenizer(prompts)["input_ids"]]
+        order = sorted(range(len(prompts)), key=lambda i: lengths[i])
+
+        generate_kwargs: Dict[str, Any] = {"max_new_tokens": max_tokens}
+        if temperature and temperature > 0:
+            generate_kwargs.update(do_sample=True, temperature=temperature, top_p=top_p)
+        else:
+            # Temperature 0 means greedy decoding (sampling rejects it)
+            generate_kwargs["do_sample"] = False
+
+        responses: List[str] = [""] * len(prompts)
+        for start in range(0, len(order), batch_size):
+            indices = order[start:start + batch_size]
+            inputs = self.tokenizer(
+                [prompts[i] for i in indices],
+                return_tensors="pt",
+                padding=True,
+            ).to(self.device)
+
+            with torch.no_grad():
+                outputs = self.model.generate(
+                    **inputs,
+                    **generate_kwargs,
+                    pad_token_id=self.tokenizer.pad_token_id,
+                )
+
+            # Decode only the generated tokens (with left padding every prompt ends at the same column)
+            generated_tokens = outputs[:, inputs["input_ids"].shape[1]:]
+            decoded = self.tokenizer.batch_decode(generated_tokens, skip_special_tokens=True)
+            for i, text in zip(indices, decoded):
+                responses[i] = text.strip()
+        return responses
     
     def _generate_openai(
         self,
@@ -277,26 +459,18 @@ class ModelRunner:
         max_tokens: int,
         temperature: float,
         top_p: Optional[float],
+        system: Optional[str] = None,
     ) -> str:
         """Generate using OpenAI API with retry logic for rate limits."""
-        # Some OpenAI models (e.g., o-series) do not allow temperature and top_p together.
-        # Prefer temperature and include top_p only when provided and not an o-series model.
-        params: Dict[str, Any] = {
-            "model": self.model_name,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-        model_lower = (self.model_name or "").lower()
-        is_o_series = model_lower.startswith("o")  # covers o1, o3, etc.
-        if (top_p is not None) and not is_o_series:
-            params["top_p"] = top_p
+        params = self._openai_params(prompt, max_tokens, temperature, top_p, system)
 
         def _call_openai():
-            response = self.openai_client.chat.completions.create(**params)
-            return response.choices[0].message.content.strip()
+            # Raw response so the limiter can read the x-ratelimit-* headers
+            return self.openai_client.chat.completions.with_raw_response.create(**params)
 
-        return self._retry_with_backoff(_call_openai)
+        response = self._retry_with_backoff(_call_openai).parse()
+        self._record_usage(response.usage)
+        return response.choices[0].message.content.strip()
     
     def _generate_anthropic(
         self,
@@ -304,42 +478,24 @@ class ModelRunner:
         max_tokens: int,
         temperature: float,
         top_p: Optional[float],
+        system: Optional[str] = None,
     ) -> str:
         """Generate using Anthropic API with retry logic for rate limits."""
-        # Anthropic does not allow specifying both temperature and top_p simultaneously.
-        kwargs: Dict[str, Any] = {
-            "model": self.model_name,
-            "max_tokens": max_tokens,
-            "messages": [{"role": "user", "content": prompt}],
-        }
-        if top_p is not None:
-            # If top_p is provided explicitly, use it and omit temperature
-            kwargs["top_p"] = top_p
-        else:
-            kwargs["temperature"] = temperature
+        kwargs = self._anthropic_params(prompt, max_tokens, temperature, top_p, system)
 
         def _call_anthropic():
             try:
-                message = self.anthropic_client.messages.create(**kwargs)
-                # Handle various response formats from Anthropic
-                if not message.content:
-                    return ""
-                content_block = message.content[0]
-                # Content block might be a TextBlock object or dict
-                if hasattr(content_block, 'text'):
-                    text = content_block.text
-                elif isinstance(content_block, dict):
-                    text = content_block.get('text', '')
-                else:
-                    text = str(content_block)
-                return (text or "").strip()
+                # Raw response so the limiter can read the anthropic-ratelimit-* headers
+                return self.anthropic_client.messages.with_raw_response.create(**kwargs)
             except Exception as e:
                 import traceback
                 print(f"Anthropic API error: {e}")
                 print(f"Traceback: {traceback.format_exc()}")
                 raise
 
-        return self._retry_with_backoff(_call_anthropic)
+        message = self._retry_with_backoff(_call_anthropic).parse()
+        self._record_usage(message.usage)
+        return self._anthropic_text(message)
 
     def _generate_google(
         self,
@@ -349,12 +505,7 @@ class ModelRunner:
         top_p: Optional[float],
     ) -> str:
         """Generate using Google API (Gemini models) with retry logic for rate limits."""
-        generation_config = {
-            "max_output_tokens": max_tokens,
-            "temperature": temperature,
-        }
-        if top_p is not None:
-            generation_config["top_p"] = top_p
+        generation_config = self._google_config(max_tokens, temperature, top_p)
 
         def _call_google():
             response = self.google_client.generate_content(
@@ -392,34 +543,13 @@ class ModelRunner:
         max_tokens: int,
         temperature: float,
         top_p: Optional[float],
+        system: Optional[str] = None,
     ) -> str:
         """Generate using Mistral official SDK with retry logic for rate limits."""
-        params: Dict[str, Any] = {
-            "model": self.model_name,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-        if top_p is not None:
-            params["top_p"] = top_p
+        params = self._mistral_params(prompt, max_tokens, temperature, top_p, system)
 
         def _call_mistral():
-            chat_response = self.mistral_client.chat.complete(**params)
-            content = chat_response.choices[0].message.content
-
-            # Handle case where content is a list (e.g., list of content blocks)
-            if isinstance(content, list):
-                # Extract text from content blocks if they're dicts with 'text' key
-                # Otherwise just join them as strings
-                text_parts = []
-                for item in content:
-                    if isinstance(item, dict) and 'text' in item:
-                        text_parts.append(item['text'])
-                    else:
-                        text_parts.append(str(item))
-                content = ''.join(text_parts)
-
-            return content.strip() if content else ""
+            return self._mistral_text(self.mistral_client.chat.complete(**params))
 
         return self._retry_with_backoff(_call_mistral)
     
@@ -431,13 +561,13 @@ class ModelRunner:
         top_p: Optional[float],
     ) -> str:
         """Generate using Ollama."""
-        options = {
-            "num_predict": max_tokens,
-            "temperature": temperature,
-        }
-        if top_p is not None:
-            options["top_p"] = top_p
-        response = self.ollama_client.generate(model=self.model_name, prompt=prompt, options=options)
+        options = self._ollama_options(max_tokens, temperature, top_p)
+        response = self.ollama_client.generate(
+            model=self.model_name,
+            prompt=prompt,
+            options=options,
+            keep_alive=OLLAMA_KEEP_ALIVE,
+        )
         
         return response['response'].strip()
     
@@ -447,23 +577,361 @@ class ModelRunner:
         max_tokens: int,
         temperature: float,
         top_p: Optional[float],
+        system: Optional[str] = None,
     ) -> str:
         """Generate using OpenRouter (OpenAI-compatible API) with retry logic for rate limits."""
+        params = self._openrouter_params(prompt, max_tokens, temperature, top_p, system)
+
+        def _call_openrouter():
+            return self.openrouter_client.chat.completions.with_raw_response.create(**params)
+
+        response = self._retry_with_backoff(_call_openrouter).parse()
+        self._record_usage(response.usage)
+        return response.choices[0].message.content.strip()
+    
+    # ------------------------------------------------------------------
+    # Request building / response parsing shared by the sync and async paths
+    # ------------------------------------------------------------------
+
+    def _split_system(self, prompt: str, system: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Inline the system prompt for providers without a separate system field (still as the prefix)."""
+        if system and self.provider not in SYSTEM_PROMPT_PROVIDERS:
+            return f"{system}\n\n{prompt}", None
+        return prompt, system
+
+    @staticmethod
+    def _chat_messages(prompt: str, system: Optional[str]) -> List[Dict[str, Any]]:
+        # Static system content first: OpenAI-compatible APIs cache the longest shared prefix
+        messages: List[Dict[str, Any]] = [{"role": "system", "content": system}] if system else []
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _record_usage(self, usage: Any) -> None:
+        prompt_tokens, cached, written = prompt_cache_usage(usage)
+        with self._usage_lock:
+            self.prompt_tokens += prompt_tokens
+            self.cached_prompt_tokens += cached
+            self.cache_write_tokens += written
+
+    def prompt_cache_stats(self) -> Dict[str, Any]:
+        """Prompt tokens sent so far and how many were served from the provider's prompt cache."""
+        with self._usage_lock:
+            return {
+                "prompt_tokens": self.prompt_tokens,
+                "cached_tokens": self.cached_prompt_tokens,
+                "cache_write_tokens": self.cache_write_tokens,
+                "hit_rate": round(self.cached_prompt_tokens / self.prompt_tokens, 4) if self.prompt_tokens else 0.0,
+            }
+
+    def _openai_params(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        top_p: Optional[float],
+        system: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        # Some OpenAI models (e.g., o-series) do not allow temperature and top_p together.
+        # Prefer temperature and include top_p only when provided and not an o-series model.
         params: Dict[str, Any] = {
             "model": self.model_name,
+            "messages": self._chat_messages(prompt, system),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        model_lower = (self.model_name or "").lower()
+        is_o_series = model_lower.startswith("o")  # covers o1, o3, etc.
+        if (top_p is not None) and not is_o_series:
+            params["top_p"] = top_p
+        return params
+
+    def _openrouter_params(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        top_p: Optional[float],
+        system: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        messages = self._chat_messages(prompt, system)
+        if system and (self.model_name or "").startswith("anthropic/"):
+            # Anthropic models behind OpenRouter only cache blocks marked with cache_control
+            messages[0]["content"] = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+        params: Dict[str, Any] = {
+            "model": self.model_name,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if top_p is not None:
+            params["top_p"] = top_p
+        return params
+
+    def _anthropic_params(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        top_p: Optional[float],
+        system: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        # Anthropic does not allow specifying both temperature and top_p simultaneously.
+        kwargs: Dict[str, Any] = {
+            "model": self.model_name,
+            "max_tokens": max_tokens,
             "messages": [{"role": "user", "content": prompt}],
+        }
+        if system:
+            # Cache breakpoint after the static system prompt; requests sharing it
+            # read the prefix from the prompt cache
+            kwargs["system"] = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+        if top_p is not None:
+            # If top_p is provided explicitly, use it and omit temperature
+            kwargs["top_p"] = top_p
+        else:
+            kwargs["temperature"] = temperature
+        return kwargs
+
+    @staticmethod
+    def _anthropic_text(message: Any) -> str:
+        # Handle various response formats from Anthropic
+        if not message.content:
+            return ""
+        content_block = message.content[0]
+        # Content block might be a TextBlock object or dict
+        if hasattr(content_block, 'text'):
+            text = content_block.text
+        elif isinstance(content_block, dict):
+            text = content_block.get('text', '')
+        else:
+            text = str(content_block)
+        return (text or "").strip()
+
+    @staticmethod
+    def _google_config(max_tokens: int, temperature: float, top_p: Optional[float]) -> Dict[str, Any]:
+        generation_config = {
+            "max_output_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if top_p is not None:
+            generation_config["top_p"] = top_p
+        return generation_config
+
+    def _mistral_params(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        top_p: Optional[float],
+        system: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {
+            "model": self.model_name,
+            "messages": self._chat_messages(prompt, system),
             "max_tokens": max_tokens,
             "temperature": temperature,
         }
         if top_p is not None:
             params["top_p"] = top_p
+        return params
 
-        def _call_openrouter():
-            response = self.openrouter_client.chat.completions.create(**params)
+    @staticmethod
+    def _mistral_text(chat_response: Any) -> str:
+        content = chat_response.choices[0].message.content
+
+        # Handle case where content is a list (e.g., list of content blocks)
+        if isinstance(content, list):
+            # Extract text from content blocks if they're dicts with 'text' key
+            # Otherwise just join them as strings
+            text_parts = []
+            for item in content:
+                if isinstance(item, dict) and 'text' in item:
+                    text_parts.append(item['text'])
+                else:
+                    text_parts.append(str(item))
+            content = ''.join(text_parts)
+
+        return content.strip() if content else ""
+
+    @staticmethod
+    def _ollama_options(max_tokens: int, temperature: float, top_p: Optional[float]) -> Dict[str, Any]:
+        options = {
+            "num_predict": max_tokens,
+            "temperature": temperature,
+        }
+        if top_p is not None:
+            options["top_p"] = top_p
+        return options
+
+    # ------------------------------------------------------------------
+    # Async path
+    # ------------------------------------------------------------------
+
+    def _create_async_client(self) -> Any:
+        """Native async client for the provider (each keeps a pooled, keep-alive HTTP/gRPC connection)."""
+        if self.provider == "huggingface":
+            # Local models batch concurrent requests instead of running them one by one
+            return _HuggingFaceMicroBatcher(self, max_pending=self.batch_size * HF_BUCKET_WINDOW)
+        if self.provider == "openai":
+            import openai
+            return openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        if self.provider == "openrouter":
+            import openai
+            return openai.AsyncOpenAI(
+                api_key=os.getenv("OPENROUTER_API_KEY"),
+                base_url="https://openrouter.ai/api/v1",
+            )
+        if self.provider == "anthropic":
+            import anthropic
+            return anthropic.AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        if self.provider == "mistral":
+            from mistralai import Mistral
+            return Mistral(api_key=os.getenv("MISTRAL_API_KEY"))
+        if self.provider == "google":
+            import google.generativeai as genai
+            return genai.GenerativeModel(self.model_name)
+        if self.provider == "xai":
+            from xai_sdk import AsyncClient
+            return AsyncClient(api_key=os.getenv("XAI_API_KEY"))
+        if self.provider == "ollama":
+            # Capped at the server's OLLAMA_NUM_PARALLEL slots, with keep_alive set
+            return OllamaAsyncPool()
+        raise ValueError(f"Unsupported provider for async generation: {self.provider}")
+
+    def _async_client(self) -> Any:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = self._create_async_client()
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Close the async client bound to the running event loop, if any.
+
+        Call it before the loop is discarded (e.g. at the end of an
+        ``asyncio.run``); otherwise the client's connection pool is dropped unclosed.
+        """
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is None:
+            return
+        try:
+            await _aclose_client(client)
+        except Exception as e:
+            print(f"⚠️ Failed to close {self.provider} async client: {e}")
+
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        top_p: Optional[float] = None,
+        system: Optional[str] = None,
+    ) -> str:
+        """
+        Async counterpart of ``generate`` using the providers' native async clients.
+
+        Calls go through the same shared rate limiter as the sync path and
+        never block the event loop. Local HuggingFace requests are gathered
+        into batches and run in a worker thread (inference is compute bound).
+        """
+        client = self._async_client()
+        prompt, system = self._split_system(prompt, system)
+
+        if self.provider == "huggingface":
+            return await client.generate(prompt, max_tokens, temperature, top_p)
+
+        if self.provider in ("openai", "openrouter"):
+            if self.provider == "openai":
+                params = self._openai_params(prompt, max_tokens, temperature, top_p, system)
+            else:
+                params = self._openrouter_params(prompt, max_tokens, temperature, top_p, system)
+            raw = await acall_with_rate_limit(
+                self.rate_limiter,
+                lambda: client.chat.completions.with_raw_response.create(**params),
+            )
+            response = raw.parse()
+            self._record_usage(response.usage)
             return response.choices[0].message.content.strip()
 
-        return self._retry_with_backoff(_call_openrouter)
-    
+        if self.provider == "anthropic":
+            kwargs = self._anthropic_params(prompt, max_tokens, temperature, top_p, system)
+            raw = await acall_with_rate_limit(
+                self.rate_limiter,
+                lambda: client.messages.with_raw_response.create(**kwargs),
+            )
+            message = raw.parse()
+            self._record_usage(message.usage)
+            return self._anthropic_text(message)
+
+        if self.provider == "mistral":
+            params = self._mistral_params(prompt, max_tokens, temperature, top_p, system)
+            response = await acall_with_rate_limit(
+                self.rate_limiter,
+                lambda: client.chat.complete_async(**params),
+            )
+            return self._mistral_text(response)
+
+        if self.provider == "google":
+            generation_config = self._google_config(max_tokens, temperature, top_p)
+            response = await acall_with_rate_limit(
+                self.rate_limiter,
+                lambda: client.generate_content_async(prompt, generation_config=generation_config),
+            )
+            return response.text.strip()
+
+        if self.provider == "xai":
+            from xai_sdk.chat import user
+
+            async def _call_xai():
+                chat = client.chat.create(model=self.model_name)
+                chat.append(user(prompt))
+                return await chat.sample(max_tokens=max_tokens, temperature=temperature)
+
+            response = await acall_with_rate_limit(self.rate_limiter, _call_xai)
+            return response.message.content.strip()
+
+        if self.provider == "ollama":
+            options = self._ollama_options(max_tokens, temperature, top_p)
+            response = await client.generate(model=self.model_name, prompt=prompt, options=options)
+            return response['response'].strip()
+
+        raise ValueError(f"Unsupported provider: {self.provider}")
+
+    @property
+    def supports_batch_api(self) -> bool:
+        return self.provider in BATCH_PROVIDERS
+
+    async def agenerate_batch_api(
+        self,
+        prompts: List[str],
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        top_p: Optional[float] = None,
+        on_poll=None,
+        jobs: Optional[List[Dict[str, Any]]] = None,
+        on_submit=None,
+    ) -> List[BatchResult]:
+        """
+        Generate responses for ``prompts`` through the provider's batch API
+        (OpenAI Batch / Anthropic Message Batches).
+
+        Results come back in input order; failed requests carry ``error``
+        instead of ``text``. Batch jobs bypass the interactive rate limiter.
+        ``jobs``/``on_submit`` re-attach to and persist submitted batch jobs
+        (see ProviderBatchRunner.arun).
+        """
+        if not self.supports_batch_api:
+            raise ValueError(f"Batch execution is not supported for provider: {self.provider}")
+        build = self._openai_params if self.provider == "openai" else self._anthropic_params
+        bodies = [build(prompt, max_tokens, temperature, top_p) for prompt in prompts]
+        runner = ProviderBatchRunner(self.provider, on_poll=on_poll)
+        results = await runner.arun(bodies, jobs=jobs, on_submit=on_submit)
+        for result in results:
+            if result.text is not None:
+                result.text = result.text.strip()
+        return results
+
     def generate_batch(
         self,
         prompts: list[str],
@@ -474,6 +942,9 @@ class ModelRunner:
         """
         Generate responses for multiple prompts.
         
+        HuggingFace models run padded, length-bucketed batches of
+        ``self.batch_size``; API providers are called one prompt at a time.
+        
         Args:
             prompts: List of input prompts
             max_tokens: Maximum tokens to generate
@@ -483,6 +954,8 @@ class ModelRunner:
         Returns:
             List of generated responses
         """
+        if self.provider == "huggingface":
+            return self._generate_huggingface_batch(prompts, max_tokens, temperature, top_p)
         responses = []
         for prompt in prompts:
             response = self.generate(prompt, max_tokens, temperature, top_p)
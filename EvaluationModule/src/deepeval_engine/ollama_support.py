@@ -0,0 +1,122 @@
+"""
+Ollama helpers built on the server's HTTP API.
+
+- Model inventory comes from ``GET /api/tags`` and is cached per host for
+  EVAL_OLLAMA_INVENTORY_TTL seconds, so checking for a model does not shell
+  out to ``ollama list`` on every experiment; missing models are pulled with
+  ``POST /api/pull``.
+- Async generation is capped at the server's parallel slots
+  (OLLAMA_NUM_PARALLEL) so extra requests wait client-side instead of queueing
+  behind a timeout on the server.
+- Requests carry ``keep_alive`` (EVAL_OLLAMA_KEEP_ALIVE, default 30m) so the
+  model stays loaded between experiments.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+
+import httpx
+
+DEFAULT_HOST = "http://127.0.0.1:11434"
+KEEP_ALIVE = os.getenv("EVAL_OLLAMA_KEEP_ALIVE", "30m")
+INVENTORY_TTL_SECONDS = float(os.getenv("EVAL_OLLAMA_INVENTORY_TTL", "300"))
+DEFAULT_NUM_PARALLEL = 4
+
+_inventory: Dict[str, Tuple[float, Set[str]]] = {}
+_inventory_lock = threading.Lock()
+
+
+def ollama_host() -> str:
+    """Base URL of the Ollama server (OLLAMA_HOST, which may omit the scheme)."""
+    host = (os.getenv("OLLAMA_HOST") or DEFAULT_HOST).strip().rstrip("/")
+    if "://" not in host:
+        host = f"http://{host}"
+    return host
+
+
+def ollama_num_parallel() -> int:
+    """Requests the server handles at once per model (OLLAMA_NUM_PARALLEL)."""
+    try:
+        return max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", str(DEFAULT_NUM_PARALLEL))))
+    except ValueError:
+        return DEFAULT_NUM_PARALLEL
+
+
+def normalize_model_name(name: str) -> str:
+    """Ollama reports untagged models as ``<name>:latest``."""
+    return name if ":" in name.rsplit("/", 1)[-1] else f"{name}:latest"
+
+
+def list_local_models(host: Optional[str] = None, refresh: bool = False, timeout: float = 10.0) -> Set[str]:
+    """Names of models available on the server, from the cached ``/api/tags`` listing."""
+    host = host or ollama_host()
+    with _inventory_lock:
+        cached = _inventory.get(host)
+    if cached is not None and not refresh and time.monotonic() - cached[0] < INVENTORY_TTL_SECONDS:
+        return cached[1]
+
+    response = httpx.get(f"{host}/api/tags", timeout=timeout)
+    response.raise_for_status()
+    names = set()
+    for model in response.json().get("models", []):
+        for field in ("name", "model"):
+            if model.get(field):
+                names.add(normalize_model_name(model[field]))
+    with _inventory_lock:
+        _inventory[host] = (time.monotonic(), names)
+    return names
+
+
+def ensure_model(model_name: str, host: Optional[str] = None, pull_timeout: float = 600.0) -> bool:
+    """
+    Make sure ``model_name`` is on the server, pulling it if needed.
+
+    A cache miss re-reads the listing once before pulling, since another
+    worker may have pulled the model since it was cached.
+    """
+    host = host or ollama_host()
+    wanted = normalize_model_name(model_name)
+    if wanted in list_local_models(host) or wanted in list_local_models(host, refresh=True):
+        return True
+
+    response = httpx.post(
+        f"{host}/api/pull",
+        json={"model": model_name, "stream": False},
+        timeout=pull_timeout,
+    )
+    response.raise_for_status()
+    if response.json().get("status") != "success":
+        return False
+    with _inventory_lock:
+        fetched_at, names = _inventory.get(host, (time.monotonic(), set()))
+        _inventory[host] = (fetched_at, names | {wanted})
+    return True
+
+
+class OllamaAsyncPool:
+    """
+    ``ollama.AsyncClient`` (one pooled HTTP connection set) with in-flight
+    requests capped at the server's parallel slots.
+    """
+
+    def __init__(self, host: Optional[str] = None, parallel: Optional[int] = None):
+        import ollama
+
+        self.client = ollama.AsyncClient(host=host or ollama_host())
+        self.semaphore = asyncio.Semaphore(parallel or ollama_num_parallel())
+
+    async def aclose(self) -> None:
+        close = getattr(self.client, "close", None)
+        if close is not None:
+            await close()
+        else:
+            # Older ollama releases only expose the underlying httpx client
+            await self.client._client.aclose()
+
+    async def generate(self, **kwargs: Any) -> Any:
+        kwargs.setdefault("keep_alive", KEEP_ALIVE)
+        async with self.semaphore:
+            return await self.client.generate(**kwargs)
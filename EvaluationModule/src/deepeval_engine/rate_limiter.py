@@ -0,0 +1,434 @@
+"""
+Adaptive per-provider rate limiting for LLM API calls.
+
+One limiter exists per (provider, API key) in the process, shared by every
+call site (model generation, DeepEval judges, custom scorers, arena). A
+limiter starts uncapped, so providers that never push back are not slowed
+down. The first 429 caps it at half the request rate observed just before,
+and from then on it is a token bucket whose refill rate adapts AIMD-style:
+every successful call adds a little to the rate, every 429 halves it, and
+once the rate climbs back to the maximum the cap is lifted again. Provider
+hints take precedence over guessing:
+
+- ``Retry-After`` / ``retry-after-ms`` block the bucket for that long
+- ``x-ratelimit-remaining-requests`` / ``x-ratelimit-reset-requests`` (OpenAI
+  and compatible APIs) and ``anthropic-ratelimit-requests-remaining`` /
+  ``-reset`` cap the rate at what is left of the current window, and block
+  until the reset once nothing is left
+
+so concurrent workers converge on the quota instead of bursting into 429s and
+sleeping for fixed multi-second backoffs.
+
+EVAL_RATE_LIMIT_RPS starts every limiter capped at that many requests per
+second instead; EVAL_RATE_LIMIT_BURST and EVAL_RATE_LIMIT_MAX_RPS tune the
+bucket once it is capped.
+
+Only throttling counts as a rate limit. Exhausted credit or billing quota
+(OpenAI ``insufficient_quota``, for instance, is also sent as a 429) fails
+straight away, since waiting does not help.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Set, Tuple
+
+# Unset: uncapped until the provider first returns a 429
+DEFAULT_RATE = float(os.environ["EVAL_RATE_LIMIT_RPS"]) if os.getenv("EVAL_RATE_LIMIT_RPS") else None
+DEFAULT_BURST = float(os.getenv("EVAL_RATE_LIMIT_BURST", "10"))
+DEFAULT_MAX_RATE = float(os.getenv("EVAL_RATE_LIMIT_MAX_RPS", "50"))
+MIN_RATE = 0.05
+ADDITIVE_INCREASE = 0.1
+MULTIPLICATIVE_DECREASE = 0.5
+# Backoff when a 429 carries no Retry-After: 1s, 2s, 4s, ... capped
+FALLBACK_BACKOFF_BASE = 1.0
+FALLBACK_BACKOFF_MAX = 60.0
+# Window over which an uncapped limiter measures its request rate
+OBSERVED_RATE_WINDOW = 10.0
+
+# Error codes/types meaning "slow down" (OpenAI, Anthropic, Google, Mistral)
+RATE_LIMIT_CODES = {
+    "rate_limit_exceeded",
+    "rate_limit_error",
+    "rate_limited",
+    "resource_exhausted",
+    "too_many_requests",
+}
+# Error codes meaning the account is out of credit or quota; retrying cannot succeed
+BILLING_CODES = {
+    "insufficient_quota",
+    "billing_hard_limit_reached",
+    "billing_not_active",
+    "access_terminated",
+    "credit_balance_too_low",
+}
+
+PROVIDER_API_KEY_ENV = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "google": "GOOGLE_API_KEY",
+    "gemini": "GEMINI_API_KEY",
+    "xai": "XAI_API_KEY",
+    "mistral": "MISTRAL_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+}
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+
+
+def parse_duration(value: Any) -> Optional[float]:
+    """Parse '1.5', '20ms', '6m0s', '1h2m3s' (OpenAI reset style) into seconds."""
+    if value is None:
+        return None
+    text = str(value).strip().lower()
+    if not text:
+        return None
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(text)
+    if not parts or "".join(n + u for n, u in parts) != text:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(n) * scale[u] for n, u in parts)
+
+
+def _seconds_until(value: Any) -> Optional[float]:
+    """Seconds until an RFC 3339 timestamp or HTTP date (Anthropic resets, Retry-After dates)."""
+    text = str(value).strip()
+    when: Optional[datetime] = None
+    try:
+        when = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _header(headers: Optional[Mapping[str, Any]], name: str) -> Optional[str]:
+    if not headers:
+        return None
+    try:
+        value = headers.get(name)
+        if value is None:
+            value = headers.get(name.title())
+    except Exception:
+        return None
+    return str(value) if value is not None else None
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, Any]]) -> Optional[float]:
+    """Delay requested by ``retry-after-ms`` or ``Retry-After`` (seconds or HTTP date)."""
+    ms = _header(headers, "retry-after-ms")
+    if ms is not None:
+        try:
+            return max(0.0, float(ms) / 1000.0)
+        except ValueError:
+            pass
+    value = _header(headers, "retry-after")
+    if value is None:
+        return None
+    seconds = parse_duration(value)
+    return seconds if seconds is not None else _seconds_until(value)
+
+
+def request_quota(headers: Optional[Mapping[str, Any]]) -> Tuple[Optional[float], Optional[float]]:
+    """(remaining requests, seconds until the window resets) from provider rate-limit headers."""
+    remaining = _header(headers, "x-ratelimit-remaining-requests")
+    reset = parse_duration(_header(headers, "x-ratelimit-reset-requests"))
+    if remaining is None:
+        remaining = _header(headers, "anthropic-ratelimit-requests-remaining")
+        reset_at = _header(headers, "anthropic-ratelimit-requests-reset")
+        reset = _seconds_until(reset_at) if reset_at is not None else None
+    try:
+        remaining_value = float(remaining) if remaining is not None else None
+    except ValueError:
+        remaining_value = None
+    return remaining_value, reset
+
+
+def error_headers(exc: BaseException) -> Optional[Mapping[str, Any]]:
+    """Response headers carried by an SDK exception (openai/anthropic/httpx/mistral), if any."""
+    for owner in (exc, getattr(exc, "response", None), getattr(exc, "raw_response", None)):
+        headers = getattr(owner, "headers", None)
+        if headers is not None and hasattr(headers, "get"):
+            return headers
+    return None
+
+
+def error_codes(exc: BaseException) -> Set[str]:
+    """Lower-cased error ``code``/``type`` values carried by an SDK exception or its JSON body."""
+    codes: Set[str] = set()
+
+    def collect(source: Any) -> None:
+        if isinstance(source, Mapping):
+            for field in ("code", "type", "status"):
+                value = source.get(field)
+                if isinstance(value, str):
+                    codes.add(value.lower())
+            if isinstance(source.get("error"), Mapping):
+                collect(source["error"])
+        elif source is not None:
+            for field in ("code", "type"):
+                value = getattr(source, field, None)
+                if isinstance(value, str):
+                    codes.add(value.lower())
+
+    collect(exc)
+    collect(getattr(exc, "body", None))
+    response = getattr(exc, "response", None)
+    if response is not None:
+        try:
+            collect(response.json())
+        except Exception:
+            pass
+    return codes
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """
+    True for throttling errors: a rate-limit error code/type, HTTP 429 or a
+    rate-limit exception type, falling back to the message. Billing and
+    credit-quota errors are never rate limits, whatever their status code.
+    """
+    codes = error_codes(exc)
+    if codes & BILLING_CODES:
+        return False
+    if codes & RATE_LIMIT_CODES:
+        return True
+    for owner in (exc, getattr(exc, "response", None)):
+        for attr in ("status_code", "status", "code"):
+            if getattr(owner, attr, None) == 429:
+                return True
+    name = type(exc).__name__
+    if "RateLimit" in name or name == "ResourceExhausted":
+        return True
+    text = str(exc).lower()
+    if any(code in text for code in BILLING_CODES) or "exceeded your current quota" in text:
+        return False
+    return "rate limit" in text or "rate_limit" in text or "too many requests" in text
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket with an AIMD-adjusted refill rate.
+
+    ``rate=None`` means uncapped: callers only wait out provider-requested
+    blocks, and the limiter records when they started so the first 429 can
+    cap it at a rate below what was actually being sent.
+
+    Tokens may go negative: each caller reserves a token and waits for its
+    turn, so waiters are spaced ``1 / rate`` apart instead of retrying in a
+    burst. Thread-safe; ``acquire`` blocks the calling thread and
+    ``acquire_async`` only suspends the coroutine.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = DEFAULT_RATE,
+        burst: float = DEFAULT_BURST,
+        max_rate: float = DEFAULT_MAX_RATE,
+        min_rate: float = MIN_RATE,
+    ):
+        self.rate: Optional[float] = None if rate is None else max(min_rate, rate)
+        self.capacity = max(1.0, burst)
+        self.max_rate = max(self.rate or 0.0, max_rate)
+        self.min_rate = min_rate
+        self.tokens = self.capacity
+        self.blocked_until = 0.0
+        self.rate_limited = 0
+        self._recent: deque = deque(maxlen=10000)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self.rate is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _observed_rate(self, now: float) -> float:
+        """Requests per second reserved over the last OBSERVED_RATE_WINDOW seconds while uncapped."""
+        while self._recent and self._recent[0] < now - OBSERVED_RATE_WINDOW:
+            self._recent.popleft()
+        if not self._recent:
+            return self.min_rate
+        span = max(1.0, min(OBSERVED_RATE_WINDOW, now - self._recent[0]))
+        return len(self._recent) / span
+
+    def _cap(self, now: float, rate: float) -> None:
+        """Switch an uncapped limiter to a token bucket refilling at ``rate``."""
+        self.rate = max(self.min_rate, min(self.max_rate, rate))
+        self.tokens = 0.0
+        self._recent.clear()
+
+    def reserve(self, consume: bool = True) -> float:
+        """Reserve a slot and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, self.blocked_until - now)
+            if self.rate is None:
+                if consume:
+                    self._recent.append(now)
+            elif consume:
+                self.tokens -= 1.0
+                if self.tokens < 0:
+                    wait = max(wait, -self.tokens / self.rate)
+            return wait
+
+    def acquire(self, consume: bool = True) -> None:
+        wait = self.reserve(consume)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, consume: bool = True) -> None:
+        wait = self.reserve(consume)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _block(self, now: float, seconds: float) -> None:
+        # The bucket refills back to zero exactly when the block ends, so callers
+        # that reserved during it are released 1 / rate apart, not all at once
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        if self.rate is not None:
+            self.tokens = min(self.tokens, -(self.blocked_until - now) * self.rate)
+
+    def _apply_quota(self, headers: Optional[Mapping[str, Any]], now: float) -> None:
+        remaining, reset = request_quota(headers)
+        if remaining is None or not reset:
+            return
+        if remaining <= 0:
+            self._block(now, reset)
+        elif self.rate is None:
+            # Uncapped callers could outrun the window; start from what the provider allows
+            if remaining / reset < self._observed_rate(now):
+                self._cap(now, remaining / reset)
+                self.tokens = min(self.capacity, remaining)
+        else:
+            # Never plan to spend the remaining quota faster than the window allows
+            self.rate = max(self.min_rate, min(self.rate, remaining / reset))
+
+    def on_success(self, headers: Optional[Mapping[str, Any]] = None) -> None:
+        """Additive increase (the cap is lifted once back at the maximum), then clamp to what is left."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self.rate is not None:
+                self.rate += ADDITIVE_INCREASE
+                if self.rate >= self.max_rate:
+                    self.rate = None
+                    self.tokens = self.capacity
+            self._apply_quota(headers, now)
+
+    def on_rate_limited(self, headers: Optional[Mapping[str, Any]] = None, attempt: int = 0) -> float:
+        """Multiplicative decrease and block until the provider's retry time; returns the block length."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate_limited += 1
+            if self.rate is None:
+                self._cap(now, self._observed_rate(now) * MULTIPLICATIVE_DECREASE)
+            else:
+                self.rate = max(self.min_rate, self.rate * MULTIPLICATIVE_DECREASE)
+            delay = retry_after_seconds(headers)
+            if delay is None:
+                delay = min(FALLBACK_BACKOFF_MAX, FALLBACK_BACKOFF_BASE * (2 ** attempt))
+            self._block(now, delay)
+            self._apply_quota(headers, now)
+            return delay
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate_per_sec": round(self.rate, 3) if self.rate is not None else None,
+                "rate_limited": self.rate_limited,
+                "blocked_for_sec": round(max(0.0, self.blocked_until - time.monotonic()), 3),
+            }
+
+
+_limiters: Dict[Tuple[str, str], AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, api_key: Optional[str] = None) -> AdaptiveRateLimiter:
+    """
+    Process-wide limiter for ``provider`` and ``api_key`` (read from the
+    provider's env var when omitted). The key is only stored hashed.
+    """
+    provider = (provider or "unknown").lower()
+    if api_key is None:
+        env_var = PROVIDER_API_KEY_ENV.get(provider)
+        api_key = os.getenv(env_var, "") if env_var else ""
+    key_id = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16] if api_key else ""
+    with _limiters_lock:
+        limiter = _limiters.get((provider, key_id))
+        if limiter is None:
+            limiter = _limiters[(provider, key_id)] = AdaptiveRateLimiter()
+        return limiter
+
+
+def response_headers(result: Any) -> Optional[Mapping[str, Any]]:
+    """Headers of a raw SDK/httpx response, if the call returned one."""
+    headers = getattr(result, "headers", None)
+    return headers if headers is not None and hasattr(headers, "get") else None
+
+
+def call_with_rate_limit(
+    limiter: Optional[AdaptiveRateLimiter],
+    func: Callable[[], Any],
+    max_retries: int = 3,
+    consume: bool = True,
+) -> Any:
+    """
+    Call ``func`` through ``limiter``, retrying rate-limit errors once the
+    limiter allows. ``consume=False`` only waits out blocks (for wrappers
+    whose inner calls are already paced).
+    """
+    if limiter is None:
+        return func()
+    for attempt in range(max_retries + 1):
+        limiter.acquire(consume)
+        try:
+            result = func()
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt >= max_retries:
+                raise
+            delay = limiter.on_rate_limited(error_headers(e), attempt)
+            print(f"⏳ Rate limit hit. Retrying in {delay:.1f}s... (attempt {attempt + 1}/{max_retries})")
+            continue
+        limiter.on_success(response_headers(result))
+        return result
+
+
+async def acall_with_rate_limit(
+    limiter: Optional[AdaptiveRateLimiter],
+    func: Callable[[], Awaitable[Any]],
+    max_retries: int = 3,
+    consume: bool = True,
+) -> Any:
+    """Async counterpart of ``call_with_rate_limit``; ``func`` returns a fresh awaitable per attempt."""
+    if limiter is None:
+        return await func()
+    for attempt in range(max_retries + 1):
+        await limiter.acquire_async(consume)
+        try:
+            result = await func()
+        except Exception as e:
+            if not is_rate_limit_error(e) or attempt >= max_retries:
+                raise
+            delay = limiter.on_rate_limited(error_headers(e), attempt)
+            print(f"⏳ Rate limit hit. Retrying in {delay:.1f}s... (attempt {attempt + 1}/{max_retries})")
+            continue
+        limiter.on_success(response_headers(result))
+        return result
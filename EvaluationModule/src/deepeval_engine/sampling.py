@@ -0,0 +1,226 @@
+"""
+Stratified sampling for large evaluation datasets.
+
+Instead of generating and judging every prompt, a sample is drawn per
+stratum (e.g. category x difficulty) with proportional allocation, and
+metric means are reported per stratum and for the whole population using the
+standard stratified estimator:
+
+    mean_st = sum_h W_h * mean_h,          W_h = N_h / N
+    Var     = sum_h W_h^2 * (1 - n_h/N_h) * s_h^2 / n_h
+
+with a normal-approximation confidence interval. The finite population
+correction (1 - n_h/N_h) makes a fully sampled stratum contribute no variance.
+"""
+
+import math
+import random
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+DEFAULT_STRATA_FIELDS = ("category", "difficulty")
+
+
+def stratum_label(item: Dict[str, Any], fields: Sequence[str] = DEFAULT_STRATA_FIELDS) -> str:
+    """Stable stratum label such as 'category=math|difficulty=hard'."""
+    parts = []
+    for name in fields:
+        value = item.get(name) if isinstance(item, dict) else None
+        parts.append(f"{name}={value if value not in (None, '') else 'unknown'}")
+    return "|".join(parts)
+
+
+def allocate_proportional(populations: Dict[str, int], sample_size: int, min_per_stratum: int = 2) -> Dict[str, int]:
+    """
+    Split ``sample_size`` across strata proportionally to their size
+    (largest-remainder rounding). Every stratum gets at least
+    ``min_per_stratum`` items (capped at its size) when the budget allows, so
+    its variance can be estimated.
+    """
+    total = sum(populations.values())
+    sample_size = max(0, min(sample_size, total))
+    if sample_size == 0:
+        return {key: 0 for key in populations}
+
+    floor_min = {key: min(min_per_stratum, n) for key, n in populations.items()}
+    if sum(floor_min.values()) > sample_size:
+        floor_min = {key: 0 for key in populations}
+
+    quotas = {key: sample_size * n / total for key, n in populations.items()}
+    allocation = {key: max(floor_min[key], int(math.floor(q))) for key, q in quotas.items()}
+
+    # Largest remainders get the leftover slots; trim from the biggest strata if minimums overshot
+    by_remainder = sorted(populations, key=lambda k: quotas[k] - math.floor(quotas[k]), reverse=True)
+    while sum(allocation.values()) < sample_size:
+        progressed = False
+        for key in by_remainder:
+            if sum(allocation.values()) >= sample_size:
+                break
+            if allocation[key] < populations[key]:
+                allocation[key] += 1
+                progressed = True
+        if not progressed:
+            break
+    by_size = sorted(populations, key=lambda k: allocation[k], reverse=True)
+    while sum(allocation.values()) > sample_size:
+        for key in by_size:
+            if sum(allocation.values()) <= sample_size:
+                break
+            if allocation[key] > floor_min[key]:
+                allocation[key] -= 1
+    return allocation
+
+
+@dataclass
+class StratifiedSample:
+    """The drawn items (in original dataset order) and the stratum sizes they came from."""
+    items: List[Any]
+    fields: Tuple[str, ...]
+    populations: Dict[str, int]
+    allocation: Dict[str, int]
+    seed: Any = None
+    population_size: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "strata_fields": list(self.fields),
+            "population_size": self.population_size,
+            "sample_size": len(self.items),
+            "seed": self.seed,
+            "strata": {
+                key: {"population": self.populations[key], "sampled": self.allocation.get(key, 0)}
+                for key in self.populations
+            },
+        }
+
+
+def draw_stratified_sample(
+    items: Iterable[Any],
+    sample_size: int,
+    fields: Sequence[str] = DEFAULT_STRATA_FIELDS,
+    seed: Any = None,
+) -> StratifiedSample:
+    """
+    Draw a proportional stratified random sample of ``sample_size`` items.
+
+    ``items`` may be a list or any re-iterable (e.g. a streamed dataset file):
+    the first pass only records stratum membership by index and the second
+    keeps the chosen items, so only the sample is held in memory.
+    """
+    fields = tuple(fields)
+    by_stratum: Dict[str, List[int]] = {}
+    population_size = 0
+    for idx, item in enumerate(items):
+        by_stratum.setdefault(stratum_label(item, fields), []).append(idx)
+        population_size += 1
+
+    populations = {key: len(indices) for key, indices in by_stratum.items()}
+    allocation = allocate_proportional(populations, sample_size)
+
+    rng = random.Random(seed)
+    chosen: List[int] = []
+    for key, indices in by_stratum.items():
+        chosen.extend(rng.sample(indices, allocation[key]))
+    chosen_set = set(chosen)
+
+    return StratifiedSample(
+        items=[item for idx, item in enumerate(items) if idx in chosen_set],
+        fields=fields,
+        populations=populations,
+        allocation=allocation,
+        seed=seed,
+        population_size=population_size,
+    )
+
+
+@dataclass
+class _StratumStats:
+    n: int = 0
+    total: float = 0.0
+    total_sq: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.n += 1
+        self.total += value
+        self.total_sq += value * value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.n
+
+    @property
+    def variance(self) -> float:
+        """Unbiased sample variance (0 for a single observation)."""
+        if self.n < 2:
+            return 0.0
+        return max(0.0, (self.total_sq - self.n * self.mean ** 2) / (self.n - 1))
+
+
+@dataclass
+class StratifiedEstimator:
+    """Accumulates per-stratum metric scores and produces stratified estimates."""
+    populations: Dict[str, int]
+    confidence: float = 0.95
+    _stats: Dict[str, Dict[str, _StratumStats]] = field(default_factory=dict)
+
+    def add(self, stratum: str, metric_scores: Dict[str, Any]) -> None:
+        for metric_name, score_data in (metric_scores or {}).items():
+            score = score_data.get("score") if isinstance(score_data, dict) else None
+            if not isinstance(score, (int, float)) or isinstance(score, bool):
+                continue
+            per_metric = self._stats.setdefault(metric_name, {})
+            per_metric.setdefault(stratum, _StratumStats()).add(float(score))
+
+    def add_many(self, rows: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        for stratum, metric_scores in rows:
+            self.add(stratum, metric_scores)
+
+    def _interval(self, mean: float, variance: float) -> Tuple[float, float]:
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        half_width = z * math.sqrt(variance)
+        return mean - half_width, mean + half_width
+
+    def estimates(self) -> Dict[str, Any]:
+        """
+        Per metric: overall stratified mean with CI, and per-stratum means with CIs.
+
+        Strata without scores for a metric are left out and the weights of
+        the remaining strata renormalised; ``coverage`` reports the share of
+        the population those strata represent.
+        """
+        population_total = sum(self.populations.values()) or 1
+        output: Dict[str, Any] = {}
+        for metric_name, per_stratum in self._stats.items():
+            covered = sum(self.populations.get(key, 0) for key in per_stratum)
+            if covered == 0:
+                continue
+            overall_mean = 0.0
+            overall_var = 0.0
+            strata_out: Dict[str, Any] = {}
+            for key, stats in per_stratum.items():
+                population = self.populations.get(key, stats.n)
+                weight = population / covered
+                fpc = max(0.0, 1.0 - stats.n / population) if population else 0.0
+                var_mean = fpc * stats.variance / stats.n
+                overall_mean += weight * stats.mean
+                overall_var += weight ** 2 * var_mean
+                low, high = self._interval(stats.mean, var_mean)
+                strata_out[key] = {
+                    "mean": round(stats.mean, 4),
+                    "ci_low": round(low, 4),
+                    "ci_high": round(high, 4),
+                    "sampled": stats.n,
+                    "population": population,
+                }
+            low, high = self._interval(overall_mean, overall_var)
+            output[metric_name] = {
+                "mean": round(overall_mean, 4),
+                "ci_low": round(low, 4),
+                "ci_high": round(high, 4),
+                "std_error": round(math.sqrt(overall_var), 4),
+                "confidence": self.confidence,
+                "coverage": round(covered / population_total, 4),
+                "strata": strata_out,
+            }
+        return output
@@ -0,0 +1,211 @@
+"""
+Judge verdict cache for DeepEval metrics.
+
+A judge verdict is a pure function of (judge model, metric and its prompt
+template/rubric, threshold, test case content), so re-scoring an unchanged
+sample - a re-run, a resumed experiment or a baseline comparison - can be a
+lookup instead of a paid LLM call.
+
+``VerdictCache`` is an in-process LRU with a TTL; hosts that want verdicts to
+survive across processes (the EvalServer uses Redis) subclass it and override
+``_load``/``_store`` and their async counterparts ``_aload``/``_astore``.
+Coroutines use ``aget``/``aset`` so a lookup never blocks the event loop.
+Only successful verdicts (score is not None) are cached.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Bump to invalidate every cached verdict (e.g. after changing how verdicts are parsed)
+VERDICT_CACHE_VERSION = 1
+
+DEFAULT_TTL_SECONDS = int(os.getenv("EVAL_VERDICT_CACHE_TTL", str(30 * 24 * 3600)))
+DEFAULT_MAX_ENTRIES = int(os.getenv("EVAL_VERDICT_CACHE_MAX_ENTRIES", "200000"))
+
+try:
+    from deepeval import __version__ as _DEEPEVAL_VERSION
+except Exception:
+    _DEEPEVAL_VERSION = "unknown"
+
+
+def _hash(material: Dict[str, Any]) -> str:
+    payload = json.dumps(material, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def describe_metric(metric: Any, judge: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Identify a metric instance for caching: class, judge, threshold and the
+    prompt text that drives it.
+
+    GEvalLikeMetric prompts (the static system prompt and the per-sample
+    prompt rendered with placeholders) are included so any change to the
+    rubric, instructions or template wording produces a new key. Native DeepEval
+    metrics keep their templates inside the library, so the installed
+    DeepEval version stands in for them.
+    """
+    template = None
+    build_prompt = getattr(metric, "_build_prompt", None)
+    if callable(build_prompt):
+        try:
+            template = build_prompt(
+                input_text="{input}", actual_output="{output}", expected_output="{expected}"
+            )
+        except Exception:
+            template = None
+    system_prompt = None
+    build_system_prompt = getattr(metric, "_build_system_prompt", None)
+    if callable(build_system_prompt):
+        try:
+            system_prompt = build_system_prompt()
+        except Exception:
+            system_prompt = None
+
+    if judge is None:
+        if getattr(metric, "provider", None) and getattr(metric, "model_name", None):
+            judge = f"{metric.provider}/{metric.model_name}"
+        else:
+            judge = getattr(metric, "evaluation_model", None)
+
+    return {
+        "class": f"{type(metric).__module__}.{type(metric).__qualname__}",
+        "judge": judge,
+        "threshold": getattr(metric, "threshold", None),
+        "template": template,
+        "system_prompt": system_prompt,
+        "rubric": getattr(metric, "_custom_rubric", None),
+        "criteria": getattr(metric, "criteria", None),
+        "evaluation_steps": getattr(metric, "evaluation_steps", None),
+        "deepeval_version": _DEEPEVAL_VERSION,
+    }
+
+
+def describe_test_case(test_case: Any) -> Dict[str, Any]:
+    """Content of a single-turn or conversational test case that a judge sees."""
+    turns = getattr(test_case, "turns", None)
+    if turns is not None:
+        return {
+            "turns": [
+                {"role": getattr(t, "role", ""), "content": getattr(t, "content", "")}
+                for t in turns
+            ],
+            "scenario": getattr(test_case, "scenario", None),
+            "expected_outcome": getattr(test_case, "expected_outcome", None),
+        }
+    return {
+        "input": getattr(test_case, "input", None),
+        "actual_output": getattr(test_case, "actual_output", None),
+        "expected_output": getattr(test_case, "expected_output", None),
+        "context": getattr(test_case, "context", None),
+        "retrieval_context": getattr(test_case, "retrieval_context", None),
+    }
+
+
+def make_verdict_key(
+    metric: Any,
+    test_case: Any,
+    judge: Optional[str] = None,
+    mode: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    SHA-256 key for a (metric, test case) verdict.
+
+    ``mode`` describes a judging mode other than the metric's own call (e.g.
+    a fused multi-criteria prompt); its verdicts get keys of their own.
+    """
+    material = {
+        "cache_version": VERDICT_CACHE_VERSION,
+        "metric": describe_metric(metric, judge=judge),
+        "test_case": describe_test_case(test_case),
+    }
+    if mode is not None:
+        material["mode"] = mode
+    return _hash(material)
+
+
+class VerdictCache:
+    """In-process LRU + TTL verdict cache with hit/miss accounting."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, verdict = entry
+        if expires_at < time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return verdict
+
+    def _store(self, key: str, verdict: Dict[str, Any]) -> None:
+        self._entries[key] = (time.time() + self.ttl_seconds, verdict)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _aload(self, key: str) -> Optional[Dict[str, Any]]:
+        # In-process lookups do no I/O
+        return self._load(key)
+
+    async def _astore(self, key: str, verdict: Dict[str, Any]) -> None:
+        self._store(key, verdict)
+
+    def _count(self, verdict: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if verdict is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return verdict
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            verdict = self._load(key)
+        except Exception:
+            self.errors += 1
+            verdict = None
+        return self._count(verdict)
+
+    def set(self, key: str, verdict: Dict[str, Any]) -> None:
+        try:
+            self._store(key, verdict)
+        except Exception:
+            self.errors += 1
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            verdict = await self._aload(key)
+        except Exception:
+            self.errors += 1
+            verdict = None
+        return self._count(verdict)
+
+    async def aset(self, key: str, verdict: Dict[str, Any]) -> None:
+        try:
+            await self._astore(key, verdict)
+        except Exception:
+            self.errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,81 @@
+"""
+Tests for the streaming per-metric aggregates and their quantile sketch.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+
+import pytest
+
+from deepeval_engine.aggregates import AggregateTracker, MetricAccumulator
+
+
+def _exact_quantile(values, q):
+    values = sorted(values)
+    position = q * (len(values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def test_small_samples_have_exact_quantiles():
+    acc = MetricAccumulator()
+    for score in [0.2, 0.9, 0.4, 0.1, 0.6]:
+        acc.add(score)
+
+    assert acc.quantile(0.5) == pytest.approx(statistics.median([0.2, 0.9, 0.4, 0.1, 0.6]))
+    assert acc.quantile(0.0) == 0.1
+    assert acc.quantile(1.0) == 0.9
+
+
+def test_unit_range_histogram_is_accurate_to_one_bin():
+    rng = random.Random(7)
+    values = [rng.betavariate(2, 5) for _ in range(5000)]
+    acc = MetricAccumulator(bins=100, exact_limit=100)
+    for value in values:
+        acc.add(value)
+
+    for q in (0.1, 0.5, 0.9):
+        assert acc.quantile(q) == pytest.approx(_exact_quantile(values, q), abs=0.01)
+
+
+def test_scores_outside_unit_range_are_not_clamped():
+    # A custom scorer mapping choices onto 0-10
+    rng = random.Random(11)
+    values = [rng.uniform(0, 10) for _ in range(5000)]
+    acc = MetricAccumulator(bins=100, exact_limit=100)
+    for value in values:
+        acc.add(value)
+
+    summary = acc.to_summary()
+    assert summary["p50_score"] == pytest.approx(_exact_quantile(values, 0.5), abs=0.1)
+    assert summary["p90_score"] == pytest.approx(_exact_quantile(values, 0.9), abs=0.1)
+    assert summary["max_score"] == pytest.approx(max(values), abs=1e-3)
+
+
+def test_histogram_range_grows_in_both_directions():
+    acc = MetricAccumulator(bins=100, exact_limit=10)
+    values = [i / 20 for i in range(21)]  # 0..1 while exact
+    values += [-5.0 + i * 0.25 for i in range(41)]  # then -5..5
+    values += [40.0, 50.0]
+    for value in values:
+        acc.add(value)
+
+    assert acc.min == -5.0 and acc.max == 50.0
+    assert acc.quantile(0.5) == pytest.approx(_exact_quantile(values, 0.5), abs=1.0)
+    assert acc.quantile(1.0) == 50.0
+    assert sum(acc._histogram) == len(values)
+
+
+def test_tracker_ignores_non_numeric_and_non_finite_scores():
+    tracker = AggregateTracker()
+    tracker.add_result({"metric_scores": {"m": {"score": 0.5, "passed": True}}})
+    tracker.add_result({"metric_scores": {"m": {"score": None}}})
+    tracker.add("m", float("nan"))
+    tracker.add("m", True)
+
+    summary = tracker.metric_summaries()["m"]
+    assert summary["total_evaluated"] == 1
+    assert summary["pass_rate"] == 100.0
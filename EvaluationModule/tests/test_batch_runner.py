@@ -0,0 +1,200 @@
+"""
+Tests for provider batch-API execution against a local stand-in server.
+
+The stand-in implements just enough of the OpenAI Batch API (file upload,
+batch creation and polling, output/error files) and of Anthropic Message
+Batches (creation, polling, results_url) to run ProviderBatchRunner end to
+end through an httpx MockTransport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+
+import httpx
+import pytest
+
+from deepeval_engine.batch_runner import ProviderBatchRunner, request_id
+
+
+def _prompt(body: dict) -> str:
+    return body["messages"][-1]["content"]
+
+
+class StandInServer:
+    """In-process fake of both providers' batch endpoints; prompts containing FAIL error out."""
+
+    def __init__(self, polls_before_done: int = 1):
+        self.polls_before_done = polls_before_done
+        self.files: dict = {}
+        self.batches: dict = {}
+        self.submitted: list = []  # custom_ids per created batch
+        self.gone: set = set()  # batch ids that answer 404
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path, method = request.url.path, request.method
+        if re.fullmatch(r"/v1/(messages/batches/|batches/)[^/]+", path) and path.rsplit("/", 1)[1] in self.gone:
+            return httpx.Response(404, json={"error": {"message": "not found"}})
+
+        # --- OpenAI ---
+        if method == "POST" and path == "/v1/files":
+            text = request.content.decode("utf-8")
+            lines = [json.loads(line) for line in text.splitlines() if line.startswith('{"custom_id"')]
+            file_id = f"file-{len(self.files)}"
+            self.files[file_id] = lines
+            return httpx.Response(200, json={"id": file_id})
+        if method == "POST" and path == "/v1/batches":
+            lines = self.files[json.loads(request.content)["input_file_id"]]
+            return self._create("openai", lines)
+        if method == "GET" and path.startswith("/v1/batches/"):
+            batch = self._poll(path.rsplit("/", 1)[1])
+            status = "completed" if batch["done"] else "in_progress"
+            job = {"id": batch["id"], "status": status, "request_counts": {"total": len(batch["requests"])}}
+            if batch["done"]:
+                job["output_file_id"] = f"out-{batch['id']}"
+                job["error_file_id"] = f"err-{batch['id']}"
+            return httpx.Response(200, json=job)
+        if method == "GET" and path.startswith("/v1/files/") and path.endswith("/content"):
+            kind, batch_id = path.split("/")[3].split("-", 1)
+            return httpx.Response(200, text=self._openai_file(self.batches[batch_id], errors=kind == "err"))
+
+        # --- Anthropic ---
+        if method == "POST" and path == "/v1/messages/batches":
+            return self._create("anthropic", json.loads(request.content)["requests"])
+        if method == "GET" and path.startswith("/v1/messages/batches/"):
+            batch = self._poll(path.rsplit("/", 1)[1])
+            job = {"id": batch["id"], "processing_status": "ended" if batch["done"] else "in_progress"}
+            if batch["done"]:
+                job["results_url"] = f"https://results.stand-in/{batch['id']}.jsonl"
+            return httpx.Response(200, json=job)
+        if method == "GET" and request.url.host == "results.stand-in":
+            batch = self.batches[path.strip("/").removesuffix(".jsonl")]
+            return httpx.Response(200, text=self._anthropic_results(batch))
+
+        return httpx.Response(404, json={"error": {"message": f"no route {method} {path}"}})
+
+    def _create(self, provider: str, requests: list) -> httpx.Response:
+        batch_id = f"batch{len(self.batches)}"
+        self.batches[batch_id] = {"id": batch_id, "provider": provider, "requests": requests, "polls": 0, "done": False}
+        self.submitted.append([r["custom_id"] for r in requests])
+        return httpx.Response(200, json={"id": batch_id})
+
+    def _poll(self, batch_id: str) -> dict:
+        batch = self.batches[batch_id]
+        batch["polls"] += 1
+        batch["done"] = batch["polls"] > self.polls_before_done
+        return batch
+
+    @staticmethod
+    def _openai_file(batch: dict, errors: bool) -> str:
+        lines = []
+        for r in batch["requests"]:
+            prompt = _prompt(r["body"])
+            if ("FAIL" in prompt) != errors:
+                continue
+            if errors:
+                response = {"status_code": 400, "body": {"error": {"message": f"rejected: {prompt}"}}}
+            else:
+                response = {"status_code": 200, "body": {"choices": [{"message": {"content": f" echo {prompt} "}}]}}
+            lines.append(json.dumps({"custom_id": r["custom_id"], "response": response}))
+        return "\n".join(lines)
+
+    @staticmethod
+    def _anthropic_results(batch: dict) -> str:
+        lines = []
+        for r in batch["requests"]:
+            prompt = _prompt(r["params"])
+            if "FAIL" in prompt:
+                result = {"type": "errored", "error": {"type": "error", "error": {"message": f"rejected: {prompt}"}}}
+            else:
+                result = {"type": "succeeded", "message": {"content": [{"type": "text", "text": f"echo {prompt}"}]}}
+            lines.append(json.dumps({"custom_id": r["custom_id"], "result": result}))
+        return "\n".join(lines)
+
+
+def _bodies(*prompts: str) -> list:
+    return [{"model": "m", "max_tokens": 16, "messages": [{"role": "user", "content": p}]} for p in prompts]
+
+
+def _runner(server: StandInServer, provider: str = "openai", **kwargs) -> ProviderBatchRunner:
+    base_url = "https://stand-in/v1" if provider == "openai" else "https://stand-in"
+    return ProviderBatchRunner(
+        provider, api_key="test", base_url=base_url, poll_interval=0, transport=server.transport(), **kwargs
+    )
+
+
+def test_openai_results_in_input_order_from_output_and_error_files():
+    server = StandInServer()
+    polls = []
+    runner = _runner(server, on_poll=lambda status, done, total: polls.append(status))
+
+    results = asyncio.run(runner.arun(_bodies("a", "FAIL b", "c")))
+
+    assert [r.text.strip() if r.text else None for r in results] == ["echo a", None, "echo c"]
+    assert results[1].error == "rejected: FAIL b"
+    assert polls == ["in_progress", "completed"]
+
+
+def test_anthropic_results_from_results_url():
+    server = StandInServer()
+    results = asyncio.run(_runner(server, "anthropic").arun(_bodies("x", "FAIL y")))
+
+    assert results[0].text == "echo x" and results[0].error is None
+    assert results[1].text is None and results[1].error == "rejected: FAIL y"
+
+
+@pytest.mark.parametrize("provider", ["openai", "anthropic"])
+def test_identical_requests_are_submitted_once(provider):
+    server = StandInServer()
+    results = asyncio.run(_runner(server, provider).arun(_bodies("same", "same", "other")))
+
+    assert len(server.submitted) == 1 and len(server.submitted[0]) == 2
+    assert results[0].text == results[1].text
+
+
+@pytest.mark.parametrize("provider", ["openai", "anthropic"])
+def test_resume_reattaches_to_recorded_jobs_instead_of_resubmitting(provider):
+    server = StandInServer(polls_before_done=3)
+    recorded = []
+    bodies = _bodies("a", "b")
+    first = asyncio.run(_runner(server, provider).arun(bodies, on_submit=recorded.extend))
+
+    assert len(recorded) == 1
+    assert recorded[0]["provider"] == provider and recorded[0]["id"] == "batch0" and recorded[0]["requests"] == 2
+
+    # A restarted run re-attaches: nothing new is submitted and results match
+    resumed = asyncio.run(_runner(server, provider).arun(bodies, jobs=recorded, on_submit=recorded.extend))
+    assert len(server.submitted) == 1
+    assert [r.text for r in resumed] == [r.text for r in first]
+
+    # Requests the recorded jobs do not cover are the only ones submitted
+    more = asyncio.run(_runner(server, provider).arun(_bodies("a", "new"), jobs=recorded, on_submit=recorded.extend))
+    assert server.submitted[-1] == [request_id(_bodies("new")[0])]
+    assert [r.text.strip() for r in more] == ["echo a", "echo new"]
+
+
+def test_unreachable_recorded_job_is_resubmitted():
+    server = StandInServer()
+    server.gone.add("batch-expired")
+    jobs = [{"provider": "openai", "id": "batch-expired", "requests": 1}]
+    results = asyncio.run(_runner(server).arun(_bodies("a"), jobs=jobs))
+
+    assert len(server.submitted) == 1
+    assert results[0].text.strip() == "echo a"
+
+
+def test_async_on_submit_is_awaited():
+    server = StandInServer()
+    recorded = []
+
+    async def record(jobs):
+        await asyncio.sleep(0)
+        recorded.extend(jobs)
+
+    asyncio.run(_runner(server, "anthropic").arun(_bodies("a"), on_submit=record))
+    assert [job["id"] for job in recorded] == ["batch0"]
@@ -0,0 +1,116 @@
+"""
+Tests for the sequential early-stopping gate (confidence sequences over
+gated metric means).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from deepeval_engine.early_stopping import FAIL, PASS, UNDECIDED, MetricBound, SequentialGateMonitor
+
+
+def _scores(name, score):
+    return {name: {"score": score}}
+
+
+def test_bound_radius_spends_alpha_over_n_times_n_plus_one():
+    bound = MetricBound(threshold=0.5)
+    for _ in range(10):
+        bound.update(0.8, alpha=0.05)
+
+    radius = math.sqrt(math.log(2.0 / (0.05 / (10 * 11))) / 20)
+    assert bound.mean == pytest.approx(0.8)
+    assert bound.lower == pytest.approx(0.8 - radius)
+    assert bound.upper == pytest.approx(min(1.0, 0.8 + radius))
+
+
+def test_scores_are_clipped_to_unit_interval():
+    bound = MetricBound(threshold=0.5)
+    bound.update(3.0, alpha=0.05)
+    bound.update(-1.0, alpha=0.05)
+    assert bound.mean == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize(
+    "comparison, score, expected",
+    [("gte", 1.0, PASS), ("gte", 0.0, FAIL), ("lte", 0.0, PASS), ("lte", 1.0, FAIL)],
+)
+def test_clear_outcomes_settle_in_both_directions(comparison, score, expected):
+    monitor = SequentialGateMonitor(thresholds={"m": (0.5, comparison)}, min_samples=5)
+    for _ in range(40):
+        monitor.update(_scores("m", score))
+
+    assert monitor.bounds["m"].decision == expected
+    assert monitor.settled
+
+
+def test_waits_for_min_samples_even_when_decided():
+    monitor = SequentialGateMonitor(thresholds={"m": (0.1, "gte")}, min_samples=200)
+    for _ in range(199):
+        monitor.update(_scores("m", 1.0))
+    assert monitor.bounds["m"].decision == PASS
+    assert not monitor.settled
+
+    monitor.update(_scores("m", 1.0))
+    assert monitor.settled
+
+
+def test_mean_at_threshold_stays_undecided():
+    rng = random.Random(3)
+    monitor = SequentialGateMonitor(thresholds={"m": (0.5, "gte")}, min_samples=5)
+    for _ in range(2000):
+        monitor.update(_scores("m", float(rng.random() < 0.5)))
+
+    assert monitor.bounds["m"].decision == UNDECIDED
+    assert not monitor.settled
+
+
+def test_every_gated_metric_must_be_decided():
+    monitor = SequentialGateMonitor(thresholds={"a": (0.5, "gte"), "b": (0.5, "gte")}, min_samples=5)
+    for i in range(100):
+        monitor.update({"a": {"score": 1.0}, "b": {"score": float(i % 2)}})
+
+    assert monitor.bounds["a"].decision == PASS
+    assert monitor.bounds["b"].decision == UNDECIDED
+    assert not monitor.settled
+
+
+def test_restrict_drops_metrics_that_never_report_from_the_alpha_split():
+    monitor = SequentialGateMonitor(thresholds={"a": (0.5, "gte"), "b": (0.5, "gte")}, confidence=0.9)
+    assert monitor.alpha == pytest.approx(0.05)
+
+    monitor.restrict(["a"])
+    assert monitor.alpha == pytest.approx(0.1)
+
+    monitor.update(_scores("a", 1.0))
+    monitor.restrict([])  # ignored once results have arrived
+    assert set(monitor.thresholds) == {"a"}
+
+
+def test_ungated_and_non_numeric_scores_are_ignored():
+    monitor = SequentialGateMonitor(thresholds={"m": (0.5, "gte")}, min_samples=1)
+    monitor.update({"m": {"score": None}, "other": {"score": 1.0}, "flag": True})
+    monitor.update({"m": {"score": True}})
+
+    assert monitor.samples_seen == 2
+    assert monitor.bounds == {}
+    assert not monitor.settled
+
+
+def test_wrong_decisions_stay_below_alpha():
+    # True mean 0.55 against a 0.5 threshold: stopping on FAIL would be an error
+    rng = random.Random(0)
+    wrong = 0
+    runs = 200
+    for _ in range(runs):
+        monitor = SequentialGateMonitor(thresholds={"m": (0.5, "gte")}, confidence=0.9, min_samples=1)
+        for _ in range(500):
+            monitor.update(_scores("m", float(rng.random() < 0.55)))
+            if monitor.settled:
+                break
+        wrong += monitor.bounds["m"].decision == FAIL
+    assert wrong / runs <= 0.1
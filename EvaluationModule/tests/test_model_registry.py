@@ -0,0 +1,67 @@
+"""
+Tests for the resident local-model registry: single-flight loading and
+cleanup after failed loads.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from deepeval_engine.model_registry import ModelRegistry
+
+
+class _Model:
+    def __init__(self, size):
+        self.size = size
+
+    def parameters(self):
+        return [type("T", (), {"numel": lambda _: self.size, "element_size": lambda _: 1})()]
+
+
+def _load_concurrently(registry, key, loader, threads=4):
+    results = []
+    workers = [
+        threading.Thread(target=lambda: results.append(registry.get_or_load(key, loader)))
+        for _ in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return results
+
+
+@pytest.mark.parametrize("size", [10, 10_000])
+def test_concurrent_requests_share_one_load(size):
+    registry = ModelRegistry(budget_bytes=1000)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return _Model(size), "tokenizer"
+
+    results = _load_concurrently(registry, "m", loader)
+
+    # Also holds for a model over budget, which is never kept resident
+    assert len(calls) == 1
+    assert len({id(entry) for entry, _ in results}) == 1
+    assert sorted(hit for _, hit in results) == [False, True, True, True]
+
+
+def test_failed_load_is_cleaned_up_and_retried():
+    registry = ModelRegistry(budget_bytes=1000)
+
+    def broken():
+        raise OSError("weights missing")
+
+    with pytest.raises(OSError):
+        registry.get_or_load("m", broken)
+    assert registry._loading == {}
+
+    entry, hit = registry.get_or_load("m", lambda: (_Model(10), "tokenizer"))
+    assert not hit and entry.size_bytes == 10
+    assert registry._loading == {}
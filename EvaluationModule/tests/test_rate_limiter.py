@@ -0,0 +1,164 @@
+"""
+Tests for the adaptive per-provider rate limiter: token-bucket refill, the
+AIMD rate adjustments and rate-limit vs billing error classification.
+"""
+
+from __future__ import annotations
+
+import types
+
+import pytest
+
+from deepeval_engine import rate_limiter
+from deepeval_engine.rate_limiter import AdaptiveRateLimiter, call_with_rate_limit, is_rate_limit_error
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the limiter's clock with one that only moves when told (sleeping advances it)."""
+    fake = types.SimpleNamespace(now=1000.0)
+    fake.monotonic = lambda: fake.now
+
+    def sleep(seconds):
+        fake.now += seconds
+
+    fake.sleep = sleep
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
+
+
+class _APIError(Exception):
+    def __init__(self, message, status_code=None, code=None, body=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+        self.body = body
+
+
+class RateLimitError(_APIError):
+    """Named like the OpenAI SDK's class, which is also raised for insufficient_quota."""
+
+
+def test_capped_bucket_spends_burst_then_spaces_callers(clock):
+    limiter = AdaptiveRateLimiter(rate=2.0, burst=3)
+
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.reserve() == pytest.approx(0.5)
+    assert limiter.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_refills_at_rate_up_to_capacity(clock):
+    limiter = AdaptiveRateLimiter(rate=2.0, burst=3)
+    for _ in range(3):
+        limiter.reserve()
+
+    clock.now += 1.0  # two tokens back
+    assert [limiter.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert limiter.reserve() > 0
+
+    clock.now += 60.0  # refills to capacity, not beyond
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.reserve() > 0
+
+
+def test_uncapped_by_default_until_first_rate_limit(clock):
+    limiter = AdaptiveRateLimiter(rate=None)
+    for i in range(100):
+        clock.now += 0.05  # 20 requests per second
+        assert limiter.reserve() == 0.0
+    assert limiter.stats()["rate_per_sec"] is None
+
+    delay = limiter.on_rate_limited({"retry-after": "2"})
+
+    assert delay == 2.0
+    assert limiter.rate == pytest.approx(10.0, rel=0.05)  # half the observed rate
+    assert limiter.reserve() == pytest.approx(2.0 + 0.1, rel=0.05)
+
+
+def test_aimd_halves_on_rate_limit_and_grows_additively(clock):
+    limiter = AdaptiveRateLimiter(rate=8.0, max_rate=50.0)
+
+    limiter.on_rate_limited({"retry-after-ms": "0"})
+    assert limiter.rate == pytest.approx(4.0)
+    limiter.on_rate_limited({"retry-after-ms": "0"})
+    assert limiter.rate == pytest.approx(2.0)
+
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.rate == pytest.approx(2.0 + 10 * rate_limiter.ADDITIVE_INCREASE)
+
+
+def test_rate_never_drops_below_minimum_and_cap_lifts_at_maximum(clock):
+    limiter = AdaptiveRateLimiter(rate=0.1, max_rate=0.3, min_rate=0.05)
+    for _ in range(5):
+        limiter.on_rate_limited({"retry-after": "0"})
+    assert limiter.rate == pytest.approx(0.05)
+
+    for _ in range(3):
+        limiter.on_success()
+    assert limiter.rate is None
+
+
+def test_fallback_backoff_doubles_without_retry_after(clock):
+    limiter = AdaptiveRateLimiter(rate=5.0)
+    delays = [limiter.on_rate_limited(None, attempt) for attempt in range(3)]
+    assert delays == [1.0, 2.0, 4.0]
+    assert limiter.on_rate_limited(None, 20) == rate_limiter.FALLBACK_BACKOFF_MAX
+
+
+def test_quota_headers_cap_an_uncapped_limiter_that_outruns_them(clock):
+    limiter = AdaptiveRateLimiter(rate=None)
+    for _ in range(50):
+        clock.now += 0.1
+        limiter.reserve()
+
+    limiter.on_success({"x-ratelimit-remaining-requests": "4", "x-ratelimit-reset-requests": "2s"})
+    assert limiter.rate == pytest.approx(2.0)
+
+    limiter.on_success({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "3s"})
+    assert limiter.reserve() >= 3.0
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        RateLimitError("Rate limit reached for requests", status_code=429, code="rate_limit_exceeded"),
+        _APIError("slow down", body={"type": "error", "error": {"type": "rate_limit_error"}}),
+        _APIError("Too Many Requests"),
+        type("ResourceExhausted", (Exception,), {})("Quota exceeded for requests per minute"),
+        _APIError("throttled", status_code=429),
+    ],
+)
+def test_throttling_errors_are_rate_limits(exc):
+    assert is_rate_limit_error(exc)
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        RateLimitError(
+            "You exceeded your current quota, please check your plan and billing details.",
+            status_code=429,
+            code="insufficient_quota",
+        ),
+        _APIError("Error code: 429", status_code=429, body={"error": {"code": "insufficient_quota"}}),
+        _APIError("Your credit balance is too low", body={"error": {"type": "credit_balance_too_low"}}),
+        _APIError("You exceeded your current quota"),
+        _APIError("quota project not set"),
+    ],
+)
+def test_billing_and_unrelated_quota_errors_are_not_rate_limits(exc):
+    assert not is_rate_limit_error(exc)
+
+
+def test_call_with_rate_limit_fails_fast_on_billing_errors(clock):
+    limiter = AdaptiveRateLimiter(rate=None)
+    calls = []
+
+    def out_of_credit():
+        calls.append(1)
+        raise RateLimitError("insufficient_quota", status_code=429, code="insufficient_quota")
+
+    with pytest.raises(RateLimitError):
+        call_with_rate_limit(limiter, out_of_credit, max_retries=3)
+    assert len(calls) == 1 and limiter.rate_limited == 0
@@ -0,0 +1,114 @@
+"""
+Tests for stratified sampling: proportional allocation and the stratified
+estimator's finite-population-corrected interval.
+"""
+
+from __future__ import annotations
+
+import math
+from statistics import NormalDist
+
+import pytest
+
+from deepeval_engine.sampling import (
+    StratifiedEstimator,
+    allocate_proportional,
+    draw_stratified_sample,
+    stratum_label,
+)
+
+
+def test_allocation_is_proportional_and_sums_to_sample_size():
+    allocation = allocate_proportional({"a": 600, "b": 300, "c": 100}, 100)
+    assert allocation == {"a": 60, "b": 30, "c": 10}
+
+
+def test_largest_remainders_get_leftover_slots():
+    allocation = allocate_proportional({"a": 50, "b": 30, "c": 20}, 7, min_per_stratum=0)
+    # Quotas 3.5, 2.1, 1.4
+    assert allocation == {"a": 4, "b": 2, "c": 1}
+    assert sum(allocation.values()) == 7
+
+
+def test_small_strata_get_minimum_when_budget_allows():
+    allocation = allocate_proportional({"big": 990, "small": 10}, 20)
+    assert allocation["small"] >= 2
+    assert sum(allocation.values()) == 20
+
+
+def test_minimum_dropped_when_budget_too_small_for_it():
+    allocation = allocate_proportional({"a": 10, "b": 10, "c": 10}, 2)
+    assert sum(allocation.values()) == 2
+
+
+@pytest.mark.parametrize("sample_size", [0, -5])
+def test_empty_budget(sample_size):
+    assert allocate_proportional({"a": 3}, sample_size) == {"a": 0}
+
+
+def test_allocation_never_exceeds_stratum_or_population():
+    allocation = allocate_proportional({"a": 3, "b": 1}, 50)
+    assert allocation == {"a": 3, "b": 1}
+
+
+def test_draw_keeps_dataset_order_and_is_reproducible():
+    items = [{"id": i, "category": "x" if i % 4 else "y"} for i in range(100)]
+    first = draw_stratified_sample(items, 20, fields=("category",), seed=42)
+    second = draw_stratified_sample(items, 20, fields=("category",), seed=42)
+
+    ids = [item["id"] for item in first.items]
+    assert ids == sorted(ids) == [item["id"] for item in second.items]
+    assert first.populations == {"category=y": 25, "category=x": 75}
+    assert first.allocation == {"category=y": 5, "category=x": 15}
+    assert first.to_dict()["sample_size"] == 20
+
+
+def test_missing_fields_fall_into_unknown_stratum():
+    assert stratum_label({"category": "math"}) == "category=math|difficulty=unknown"
+    assert stratum_label("not a dict", ("category",)) == "category=unknown"
+
+
+def test_stratified_mean_and_fpc_interval():
+    estimator = StratifiedEstimator(populations={"a": 100, "b": 300}, confidence=0.95)
+    a_scores, b_scores = [0.2, 0.4, 0.6], [0.8, 1.0]
+    for score in a_scores:
+        estimator.add("a", {"m": {"score": score}})
+    for score in b_scores:
+        estimator.add("b", {"m": {"score": score}})
+
+    def var_mean(scores, population):
+        n = len(scores)
+        mean = sum(scores) / n
+        s2 = sum((x - mean) ** 2 for x in scores) / (n - 1)
+        return (1 - n / population) * s2 / n
+
+    expected_mean = 0.25 * 0.4 + 0.75 * 0.9
+    expected_var = 0.25 ** 2 * var_mean(a_scores, 100) + 0.75 ** 2 * var_mean(b_scores, 300)
+    half_width = NormalDist().inv_cdf(0.975) * math.sqrt(expected_var)
+
+    result = estimator.estimates()["m"]
+    assert result["mean"] == pytest.approx(expected_mean, abs=1e-4)
+    assert result["std_error"] == pytest.approx(math.sqrt(expected_var), abs=1e-4)
+    assert result["ci_low"] == pytest.approx(expected_mean - half_width, abs=1e-4)
+    assert result["ci_high"] == pytest.approx(expected_mean + half_width, abs=1e-4)
+    assert result["coverage"] == 1.0
+
+
+def test_fully_sampled_stratum_has_zero_width_interval():
+    estimator = StratifiedEstimator(populations={"a": 3})
+    for score in (0.1, 0.5, 0.9):
+        estimator.add("a", {"m": {"score": score}})
+
+    result = estimator.estimates()["m"]
+    assert result["ci_low"] == result["ci_high"] == result["mean"] == pytest.approx(0.5)
+
+
+def test_strata_without_scores_are_renormalised_out():
+    estimator = StratifiedEstimator(populations={"a": 100, "b": 300})
+    estimator.add("a", {"m": {"score": 0.4}, "skipped": {"score": None}})
+    estimator.add("a", {"m": {"score": 0.6}})
+
+    estimates = estimator.estimates()
+    assert set(estimates) == {"m"}
+    assert estimates["m"]["mean"] == pytest.approx(0.5)
+    assert estimates["m"]["coverage"] == 0.25
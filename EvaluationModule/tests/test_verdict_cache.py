@@ -0,0 +1,49 @@
+"""
+Tests for the in-process verdict cache and its async interface.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from deepeval_engine.verdict_cache import VerdictCache
+
+VERDICT = {"score": 0.8, "passed": True, "reason": "ok"}
+
+
+def test_async_and_blocking_calls_share_entries_and_stats():
+    cache = VerdictCache()
+
+    async def scenario():
+        assert await cache.aget("k") is None
+        await cache.aset("k", VERDICT)
+        return await cache.aget("k")
+
+    assert asyncio.run(scenario()) == VERDICT
+    assert cache.get("k") == VERDICT
+    assert cache.stats() == {"hits": 2, "misses": 1, "errors": 0, "hit_rate": round(2 / 3, 4)}
+
+
+def test_async_store_errors_are_counted_as_misses():
+    class BrokenCache(VerdictCache):
+        async def _aload(self, key):
+            raise ConnectionError("down")
+
+        async def _astore(self, key, verdict):
+            raise ConnectionError("down")
+
+    cache = BrokenCache()
+
+    async def scenario():
+        await cache.aset("k", VERDICT)
+        return await cache.aget("k")
+
+    assert asyncio.run(scenario()) is None
+    assert cache.stats()["errors"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_expired_entries_miss():
+    cache = VerdictCache(ttl_seconds=-1)
+    cache.set("k", VERDICT)
+    assert asyncio.run(cache.aget("k")) is None
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple, Optional, Set
 import traceback
 
-from llm.base import ChatClient
+from llm.base import ChatClient, cached_prompt_tokens
 from models.judge_score import JudgeScore, DimensionScore
 from judge.prompt_builder import build_judge_messages
 from judge.rubric import JudgeRubric
@@ -31,6 +31,15 @@ def _weighted_mean(dim_scores: Dict[str, int], weights: Dict[str, float]) -> flo
     return round(num / den, 4) if den > 0 else 0.0
 
 
+def _call_meta(latency_ms: int, raw: Dict[str, Any]) -> Dict[str, Any]:
+    usage = (raw or {}).get("usage") or {}
+    return {
+        "latency_ms": latency_ms,
+        "prompt_tokens": usage.get("prompt_tokens"),
+        "cached_tokens": cached_prompt_tokens(usage),
+    }
+
+
 def run_judging(
     *,
     pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]],  # (scenario, response)
@@ -74,7 +83,7 @@ def run_judging(
             dimension_scores=dim_list,
             flags=data.get("flags", {}) or {},
             raw={"judge_raw": res.raw, "judge_parsed": data},
-            meta={"latency_ms": latency_ms},
+            meta=_call_meta(latency_ms, res.raw),
         )
         out.append(js.model_dump())
 
@@ -145,7 +154,7 @@ def run_judging_resumable(
                 dimension_scores=dim_list,
                 flags=data.get("flags", {}) or {},
                 raw={"judge_raw": res.raw, "judge_parsed": data},
-                meta={"latency_ms": latency_ms},
+                meta=_call_meta(latency_ms, res.raw),
             )
             out.append(js.model_dump())
 
@@ -10,6 +10,8 @@ from io_utils.jsonl import read_jsonl
 def compute_judge_stats(success_path: Path, failure_path: Path) -> Dict[str, Any]:
     scored = 0
     latencies = []
+    prompt_tokens = 0
+    cached_tokens = 0
     grs_scores = []
 
     # per-dimension sums/counts
@@ -23,6 +25,10 @@ def compute_judge_stats(success_path: Path, failure_path: Path) -> Dict[str, Any
             latency = meta.get("latency_ms")
             if isinstance(latency, int):
                 latencies.append(latency)
+            if isinstance(meta.get("prompt_tokens"), int):
+                prompt_tokens += meta["prompt_tokens"]
+            if isinstance(meta.get("cached_tokens"), int):
+                cached_tokens += meta["cached_tokens"]
 
             gs = obj.get("grs_score")
             if isinstance(gs, (int, float)):
@@ -54,6 +60,9 @@ def compute_judge_stats(success_path: Path, failure_path: Path) -> Dict[str, Any
         "scored": scored,
         "failed": failures,
         "latency_ms_avg": int(sum(latencies) / len(latencies)) if latencies else None,
+        "prompt_tokens": prompt_tokens,
+        "cached_prompt_tokens": cached_tokens,
+        "prompt_cache_hit_rate": round(cached_tokens / prompt_tokens, 4) if prompt_tokens else None,
         "mean_grs_score": _avg(grs_scores),
         "mean_dimension_scores": dim_avg,
         "errors_by_type": dict(errors_by_type),
@@ -10,6 +10,13 @@ class ChatResult:
     raw: Dict[str, Any]
 
 
+def cached_prompt_tokens(usage: Dict[str, Any]) -> int:
+    """Prompt tokens served from the provider's prompt cache (OpenAI-style usage)."""
+    details = (usage or {}).get("prompt_tokens_details") or {}
+    cached = details.get("cached_tokens")
+    return cached if isinstance(cached, int) else 0
+
+
 class ChatClient(Protocol):
     def chat(self, *, messages: List[Dict[str, str]], temperature: float, max_tokens: int) -> ChatResult:
         ...
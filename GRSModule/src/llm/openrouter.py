@@ -9,6 +9,25 @@ import httpx
 
 from llm.base import ChatResult
 
+# Providers behind OpenRouter that only cache prompt blocks marked with cache_control
+# (OpenAI, DeepSeek, Grok etc. cache shared prefixes automatically)
+CACHE_CONTROL_MODEL_PREFIXES = ("anthropic/", "google/")
+
+
+def with_cache_breakpoint(messages: List[Dict[str, Any]], model_id: str) -> List[Dict[str, Any]]:
+    """Mark the system message as a prompt-cache breakpoint for providers that need it."""
+    if not model_id.startswith(CACHE_CONTROL_MODEL_PREFIXES):
+        return messages
+    out = []
+    for m in messages:
+        if m.get("role") == "system" and isinstance(m.get("content"), str):
+            m = {
+                **m,
+                "content": [{"type": "text", "text": m["content"], "cache_control": {"type": "ephemeral"}}],
+            }
+        out.append(m)
+    return out
+
 
 @dataclass
 class OpenRouterChatClient:
@@ -43,7 +62,7 @@ class OpenRouterChatClient:
     ) -> ChatResult:
         payload = {
             "model": self.model_id,
-            "messages": messages,
+            "messages": with_cache_breakpoint(messages, self.model_id),
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
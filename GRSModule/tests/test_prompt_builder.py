@@ -0,0 +1,112 @@
+"""
+Unit tests for judge prompt construction and prompt-cache accounting.
+
+Judge prompts must keep everything that is shared across samples (rubric,
+aggregation, output format) in a leading system message so providers can
+serve it from their prompt cache.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from judge.load_rubric import load_judge_rubric
+from judge.prompt_builder import build_judge_messages, build_judge_system_prompt
+from judge.runner import JudgeConfig, run_judging
+from judge.stats import compute_judge_stats
+from io_utils.jsonl import write_jsonl
+from llm.base import ChatResult, cached_prompt_tokens
+from llm.openrouter import with_cache_breakpoint
+
+RUBRIC_PATH = Path(__file__).resolve().parents[1] / "configs" / "judge_rubric.yaml"
+
+
+@pytest.fixture
+def rubric():
+    return load_judge_rubric(RUBRIC_PATH)
+
+
+def _scenario(i: int) -> dict:
+    return {
+        "scenario_id": f"scn_{i}",
+        "prompt": f"Scenario prompt number {i}",
+        "constraints": {"must": [f"must_{i}"], "must_not": [f"must_not_{i}"]},
+    }
+
+
+def _response(i: int) -> dict:
+    return {"model_id": "cand", "provider": "mock", "output_text": f"Candidate answer {i}"}
+
+
+def test_system_message_is_identical_across_samples(rubric):
+    first = build_judge_messages(scenario=_scenario(1), response=_response(1), rubric=rubric)
+    second = build_judge_messages(scenario=_scenario(2), response=_response(2), rubric=rubric)
+
+    assert [m["role"] for m in first] == ["system", "user"]
+    assert first[0] == second[0]
+    assert first[0]["content"] == build_judge_system_prompt(rubric)
+    assert first[1] != second[1]
+
+
+def test_rubric_is_in_system_and_sample_content_in_user(rubric):
+    system, user = build_judge_messages(scenario=_scenario(7), response=_response(7), rubric=rubric)
+
+    for d in rubric.dimensions:
+        assert d.dimension_id in system["content"]
+        assert d.dimension_id not in user["content"].split("CANDIDATE MODEL RESPONSE")[0]
+    assert "dimension_scores" in system["content"]
+
+    for text in ("Scenario prompt number 7", "must_7", "must_not_7", "Candidate answer 7"):
+        assert text in user["content"]
+        assert text not in system["content"]
+
+
+def test_cache_breakpoint_only_for_models_that_need_it():
+    messages = [{"role": "system", "content": "static"}, {"role": "user", "content": "sample"}]
+
+    marked = with_cache_breakpoint(messages, "anthropic/claude-sonnet-4")
+    assert marked[0]["content"] == [
+        {"type": "text", "text": "static", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert marked[1] == messages[1]
+    assert messages[0]["content"] == "static"  # input left untouched
+
+    assert with_cache_breakpoint(messages, "openai/gpt-4o-mini") == messages
+
+
+def test_cached_prompt_tokens():
+    assert cached_prompt_tokens({"prompt_tokens": 900, "prompt_tokens_details": {"cached_tokens": 768}}) == 768
+    assert cached_prompt_tokens({"prompt_tokens": 900}) == 0
+    assert cached_prompt_tokens({}) == 0
+
+
+class _UsageClient:
+    def __init__(self, rubric):
+        self.rubric = rubric
+
+    def chat(self, *, messages, temperature, max_tokens):
+        scores = [{"dimension_id": d.dimension_id, "score": 3, "rationale": "ok", "evidence": []}
+                  for d in self.rubric.dimensions]
+        return ChatResult(
+            text=json.dumps({"dimension_scores": scores, "flags": {}}),
+            raw={"usage": {"prompt_tokens": 1000, "prompt_tokens_details": {"cached_tokens": 800}}},
+        )
+
+
+def test_judge_meta_and_stats_record_cached_tokens(rubric, tmp_path):
+    cfg = JudgeConfig(judge_model_id="judge", judge_provider="mock")
+    pairs = [(_scenario(i), _response(i)) for i in range(3)]
+    scores = run_judging(pairs=pairs, client=_UsageClient(rubric), rubric=rubric, cfg=cfg)
+
+    assert all(s["meta"]["cached_tokens"] == 800 for s in scores)
+    assert all(s["meta"]["prompt_tokens"] == 1000 for s in scores)
+
+    success = tmp_path / "scores.jsonl"
+    write_jsonl(success, scores)
+    stats = compute_judge_stats(success, tmp_path / "missing.jsonl")
+    assert stats["prompt_tokens"] == 3000
+    assert stats["cached_prompt_tokens"] == 2400
+    assert stats["prompt_cache_hit_rate"] == 0.8